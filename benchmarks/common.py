@@ -0,0 +1,54 @@
+"""
+Benchmark Common Module
+Benchmark script'lerinin ortak yardımcı fonksiyonları.
+"""
+
+import sys
+import json
+import subprocess
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.migration.memory import peak_rss_mb
+
+RESULTS_DIR = project_root / 'benchmarks' / 'results'
+
+
+def git_commit() -> str:
+    """
+    Çalışılan commit'in kısa hash'ini döndürür.
+    
+    Returns:
+        str: Commit hash'i (git yoksa 'unknown')
+    """
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=project_root, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def write_result(prefix: str, result: Dict[str, Any], output_dir: str = str(RESULTS_DIR)) -> Path:
+    """
+    Benchmark sonucunu commit hash'i içeren bir JSON dosyasına yazar.
+    
+    Args:
+        prefix: Dosya ismi öneki (örn. 'e2e', 'micro')
+        result: Sonuç sözlüğü
+        output_dir: Sonuç dizini
+        
+    Returns:
+        Path: Yazılan dosyanın yolu
+    """
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    path = output / f"{prefix}_{timestamp}_{result.get('git_commit', git_commit())}.json"
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, indent=2, default=str)
+    return path
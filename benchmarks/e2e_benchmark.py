@@ -0,0 +1,145 @@
+"""
+End-to-End Benchmark
+Sentetik e-ticaret veritabanını yerel MySQL'den yerel MongoDB'ye aktarır ve
+throughput, peak RSS ve aşama sürelerini commit'ler arasında karşılaştırılabilir
+bir JSON sonuç dosyasına yazar.
+
+Kullanım:
+    python benchmarks/e2e_benchmark.py --rows 1000000 --generate
+    python benchmarks/e2e_benchmark.py --rows 1000000   # mevcut veriyle tekrar çalıştır
+"""
+
+import sys
+import time
+import argparse
+import logging
+import platform
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any
+
+# Proje dizinini Python path'ine ekle
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+import yaml
+
+from src.database.sql_connector import SQLConnector
+from src.database.schema_discovery import SchemaDiscovery
+from src.database.mongodb_connector import MongoDBConnector
+from src.migration.migrator import DataMigrator
+from benchmarks.synthetic_data import build_database
+from benchmarks.common import RESULTS_DIR, git_commit, peak_rss_mb, write_result
+
+logger = logging.getLogger(__name__)
+
+
+def run_benchmark(sql_config: Dict[str, Any], mongodb_config: Dict[str, Any],
+                  migration_config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Şema keşfi ve migrate_all'ı çalıştırıp ölçümleri döndürür.
+    
+    Args:
+        sql_config: SQL bağlantı konfigürasyonu
+        mongodb_config: MongoDB bağlantı konfigürasyonu
+        migration_config: Migration konfigürasyonu
+        
+    Returns:
+        dict: Benchmark ölçümleri
+    """
+    sql_connector = SQLConnector(sql_config)
+    if not sql_connector.connect():
+        raise RuntimeError("SQL veritabanına bağlanılamadı")
+    mongodb_connector = MongoDBConnector(mongodb_config)
+    if not mongodb_connector.connect():
+        sql_connector.close()
+        raise RuntimeError("MongoDB'ye bağlanılamadı")
+    
+    try:
+        discovery_started = time.perf_counter()
+        schema_info = SchemaDiscovery(sql_connector).discover_all()
+        discovery_seconds = time.perf_counter() - discovery_started
+        
+        migrator = DataMigrator(sql_connector, mongodb_connector, migration_config)
+        migration_started = time.perf_counter()
+        stats = migrator.migrate_all(schema_info)
+        migration_seconds = time.perf_counter() - migration_started
+    finally:
+        mongodb_connector.close()
+        sql_connector.close()
+    
+    rows = sum(m.get('rows', 0) for m in stats.get('table_metrics', {}).values())
+    return {
+        'discovery_seconds': discovery_seconds,
+        'migration_seconds': migration_seconds,
+        'rows': rows,
+        'rows_per_second': rows / migration_seconds if migration_seconds > 0 else 0.0,
+        'peak_rss_mb': peak_rss_mb(),
+        'tables_migrated': stats.get('tables_migrated', 0),
+        'total_documents': stats.get('total_documents', 0),
+        'failed_documents': stats.get('failed_documents', 0),
+        'errors': stats.get('errors', []),
+        'table_metrics': stats.get('table_metrics', {})
+    }
+
+
+def main():
+    """
+    Benchmark'ı komut satırından çalıştırır.
+    """
+    parser = argparse.ArgumentParser(description="Uçtan uca migration benchmark'ı")
+    parser.add_argument('--config', default=str(project_root / 'config.yaml'),
+                        help="Bağlantı bilgileri için konfigürasyon dosyası")
+    parser.add_argument('--rows', type=int, default=1_000_000, help="Hedef toplam satır sayısı")
+    parser.add_argument('--generate', action='store_true',
+                        help="Benchmark veritabanını sentetik veriyle yeniden oluştur")
+    parser.add_argument('--sql-database', default='migration_bench')
+    parser.add_argument('--mongo-database', default='migration_bench')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output-dir', default=str(RESULTS_DIR))
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    
+    with open(args.config, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+    
+    # Benchmark her zaman ayrı veritabanlarında çalışır
+    sql_config = dict(config.get('sql_database', {}), database=args.sql_database)
+    if sql_config.get('type', 'mysql') != 'mysql':
+        raise SystemExit("Sentetik veri üretimi yalnızca MySQL için desteklenir")
+    mongodb_config = dict(config.get('mongodb', {}), database=args.mongo_database)
+    mongodb_config.pop('connection_string', None)
+    migration_config = dict(config.get('migration', {}), drop_existing=True)
+    
+    generation_seconds = None
+    if args.generate:
+        url = (f"mysql+pymysql://{sql_config.get('username')}:{sql_config.get('password')}@"
+               f"{sql_config.get('host', 'localhost')}:{sql_config.get('port', 3306)}/"
+               f"{args.sql_database}?charset=utf8mb4")
+        started = time.perf_counter()
+        build_database(url, args.rows, args.seed)
+        generation_seconds = time.perf_counter() - started
+    
+    measurements = run_benchmark(sql_config, mongodb_config, migration_config)
+    
+    result = {
+        'timestamp': datetime.now().isoformat(),
+        'git_commit': git_commit(),
+        'python': platform.python_version(),
+        'rows_requested': args.rows,
+        'seed': args.seed,
+        'generation_seconds': generation_seconds,
+        'migration_config': migration_config,
+        **measurements
+    }
+    
+    output_path = write_result('e2e', result, args.output_dir)
+    
+    print(f"Satır: {result['rows']}, Süre: {result['migration_seconds']:.2f} sn, "
+          f"{result['rows_per_second']:.0f} satır/sn, Peak RSS: {result['peak_rss_mb']:.1f} MB")
+    print(f"Sonuç: {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+Micro Benchmark
+Veritabanı gerektirmeden dönüşüm ve belge oluşturma hot loop'larını ölçer:
+_convert_value, satır → belge döngüsü (_convert_rows), composite PK _id
+oluşturma ve UpdateOne oluşturma. Sabit tohumlu sentetik satır tuple'ları
+kullanıldığı için sonuçlar deterministik ve commit'ler arasında karşılaştırılabilirdir.
+
+Kullanım:
+    python benchmarks/micro_benchmark.py
+    python benchmarks/micro_benchmark.py --rows 50000 --repeat 7 --save
+"""
+
+import sys
+import random
+import timeit
+import argparse
+import platform
+from datetime import datetime, date, timedelta
+from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, List, Any, Callable, Tuple
+
+# Proje dizinini Python path'ine ekle
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from pymongo import UpdateOne
+
+from src.migration.migrator import DataMigrator
+from benchmarks.common import git_commit, write_result
+
+BASE_DATE = datetime(2020, 1, 1)
+
+# Satır şekilleri: kolon ismi → değer üretici
+ROW_SHAPES: Dict[str, List[Tuple[str, Callable[[random.Random, int], Any]]]] = {
+    # Dar lookup tablosu
+    'narrow': [
+        ('id', lambda rng, i: i),
+        ('code', lambda rng, i: f"C{i:06d}"),
+        ('name', lambda rng, i: f"Kayıt {rng.randint(1, 1000)}"),
+        ('is_active', lambda rng, i: rng.random() < 0.9),
+    ],
+    # orders/payments benzeri karışık tipler
+    'mixed': [
+        ('id', lambda rng, i: i),
+        ('user_id', lambda rng, i: rng.randint(1, 100000)),
+        ('order_date', lambda rng, i: BASE_DATE + timedelta(seconds=rng.randint(0, 10 ** 8))),
+        ('birth_date', lambda rng, i: date(1950, 1, 1) + timedelta(days=rng.randint(0, 20000))),
+        ('total_amount', lambda rng, i: Decimal(f"{rng.uniform(1, 10000):.2f}")),
+        ('status', lambda rng, i: rng.choice(['pending', 'shipped', 'delivered'])),
+        ('shipping_address', lambda rng, i: f"{rng.randint(1, 200)}. Sokak No:{rng.randint(1, 99)} İstanbul"),
+        ('notes', lambda rng, i: None if rng.random() < 0.8 else "kapıya bırakın"),
+        ('quantity', lambda rng, i: rng.randint(1, 10)),
+        ('ratio', lambda rng, i: rng.random()),
+        ('is_gift', lambda rng, i: rng.random() < 0.1),
+        ('email', lambda rng, i: f"user{i}@example.com"),
+    ],
+    # BLOB içeren satırlar
+    'blob': [
+        ('id', lambda rng, i: i),
+        ('file_name', lambda rng, i: f"image_{i}.png"),
+        ('content', lambda rng, i: rng.getrandbits(8 * 4096).to_bytes(4096, 'little')),
+        ('uploaded_at', lambda rng, i: BASE_DATE + timedelta(seconds=i)),
+    ],
+}
+# Geniş tablo: mixed şeklinin 4 kopyası (48 kolon)
+ROW_SHAPES['wide'] = [
+    (f"{name}_{copy}" if copy else name, factory)
+    for copy in range(4)
+    for name, factory in ROW_SHAPES['mixed']
+]
+
+
+def build_rows(shape: str, count: int, seed: int) -> Tuple[List[str], List[Tuple[Any, ...]]]:
+    """
+    Belirtilen şekilde deterministik satır tuple'ları üretir.
+    
+    Args:
+        shape: ROW_SHAPES anahtarı
+        count: Satır sayısı
+        seed: Rastgele sayı üreteci tohumu
+        
+    Returns:
+        tuple: (kolon isimleri, satırlar)
+    """
+    rng = random.Random(seed)
+    columns = ROW_SHAPES[shape]
+    rows = [tuple(factory(rng, i) for _, factory in columns) for i in range(1, count + 1)]
+    return [name for name, _ in columns], rows
+
+
+def make_migrator(preserve_ids: bool = True) -> DataMigrator:
+    """
+    Bağlantı gerektirmeyen metotları ölçmek için DataMigrator oluşturur.
+    
+    Args:
+        preserve_ids: preserve_ids ayarı
+        
+    Returns:
+        DataMigrator: Bağlantısız migrator
+    """
+    sql_connector = SimpleNamespace(db_type='mysql')
+    return DataMigrator(sql_connector, None, {'preserve_ids': preserve_ids})
+
+
+def measure(func: Callable[[], Any], items: int, repeat: int) -> Dict[str, float]:
+    """
+    Fonksiyonu tekrar tekrar çalıştırıp öğe başına süreyi ölçer.
+    
+    Args:
+        func: Ölçülecek fonksiyon (tüm öğeleri işler)
+        items: Bir çalıştırmada işlenen öğe sayısı
+        repeat: Tekrar sayısı
+        
+    Returns:
+        dict: En iyi ve medyan öğe başına süre (ns) ve saniyede öğe
+    """
+    timings = sorted(timeit.repeat(func, number=1, repeat=repeat))
+    best = timings[0]
+    median = timings[len(timings) // 2]
+    return {
+        'best_ns_per_item': best / items * 1e9,
+        'median_ns_per_item': median / items * 1e9,
+        'items_per_second': items / best if best > 0 else 0.0
+    }
+
+
+def run_benchmarks(row_count: int, repeat: int, seed: int) -> Dict[str, Dict[str, float]]:
+    """
+    Tüm micro benchmark'ları çalıştırır.
+    
+    Args:
+        row_count: Her senaryodaki satır sayısı
+        repeat: Tekrar sayısı
+        seed: Rastgele sayı üreteci tohumu
+        
+    Returns:
+        dict: Senaryo ismi → ölçümler
+    """
+    migrator = make_migrator()
+    results = {}
+    
+    for shape in ROW_SHAPES:
+        column_names, rows = build_rows(shape, row_count, seed)
+        values = [value for row in rows for value in row]
+        
+        results[f"convert_value/{shape}"] = measure(
+            lambda: [migrator._convert_value(v) for v in values], len(values), repeat
+        )
+        results[f"convert_rows/{shape}"] = measure(
+            lambda: migrator._convert_rows(rows, column_names, ['id']), len(rows), repeat
+        )
+        results[f"convert_rows_composite_pk/{shape}"] = measure(
+            lambda: migrator._convert_rows(rows, column_names, column_names[:3]), len(rows), repeat
+        )
+        
+        documents = migrator._convert_rows(rows, column_names, ['id'])
+        results[f"update_one/{shape}"] = measure(
+            lambda: [UpdateOne({'_id': doc['_id']}, {'$set': doc}, upsert=True) for doc in documents],
+            len(documents), repeat
+        )
+    
+    return results
+
+
+def main():
+    """
+    Micro benchmark'ları çalıştırıp sonuçları yazdırır.
+    """
+    parser = argparse.ArgumentParser(description="Dönüşüm hot loop micro benchmark'ları")
+    parser.add_argument('--rows', type=int, default=20000, help="Senaryo başına satır sayısı")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--filter', default='', help="Yalnızca ismi bu metni içeren senaryolar")
+    parser.add_argument('--save', action='store_true', help="Sonucu benchmarks/results/ altına kaydet")
+    args = parser.parse_args()
+    
+    results = run_benchmarks(args.rows, args.repeat, args.seed)
+    if args.filter:
+        results = {name: r for name, r in results.items() if args.filter in name}
+    
+    print(f"{'Senaryo':<40} {'en iyi ns/öğe':>14} {'medyan ns/öğe':>14} {'öğe/sn':>12}")
+    for name, r in results.items():
+        print(f"{name:<40} {r['best_ns_per_item']:>14.0f} {r['median_ns_per_item']:>14.0f} "
+              f"{r['items_per_second']:>12.0f}")
+    
+    if args.save:
+        path = write_result('micro', {
+            'timestamp': datetime.now().isoformat(),
+            'git_commit': git_commit(),
+            'python': platform.python_version(),
+            'rows': args.rows,
+            'repeat': args.repeat,
+            'seed': args.seed,
+            'results': results
+        })
+        print(f"Sonuç: {path}")
+
+
+if __name__ == "__main__":
+    main()
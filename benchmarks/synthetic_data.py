@@ -0,0 +1,320 @@
+"""
+Synthetic Data Generator
+Benchmark için test_database.sql'deki e-ticaret şemasının büyük ölçekli
+(milyonlarca satır) bir kopyasını MySQL'de oluşturur.
+
+Kullanım:
+    python benchmarks/synthetic_data.py --rows 1000000 --database migration_bench
+"""
+
+import sys
+import random
+import argparse
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Any, Iterator, Tuple
+
+# Proje dizinini Python path'ine ekle
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import create_engine, text
+
+logger = logging.getLogger(__name__)
+
+# Toplam satır sayısının tablolara dağılımı (categories sabit 50 satır)
+TABLE_SHARES = {
+    'users': 0.08,
+    'products': 0.02,
+    'orders': 0.25,
+    'order_items': 0.45,
+    'payments': 0.20
+}
+
+CATEGORY_COUNT = 50
+INSERT_CHUNK_SIZE = 5000
+
+SCHEMA_DDL = [
+    """
+    CREATE TABLE users (
+        user_id INT PRIMARY KEY AUTO_INCREMENT,
+        username VARCHAR(50) NOT NULL UNIQUE,
+        email VARCHAR(100) NOT NULL UNIQUE,
+        password_hash VARCHAR(255) NOT NULL,
+        first_name VARCHAR(50) NOT NULL,
+        last_name VARCHAR(50) NOT NULL,
+        phone VARCHAR(20),
+        birth_date DATE,
+        registration_date DATETIME DEFAULT CURRENT_TIMESTAMP,
+        is_active BOOLEAN DEFAULT TRUE,
+        balance DECIMAL(10, 2) DEFAULT 0.00,
+        INDEX idx_registration_date (registration_date)
+    ) ENGINE=InnoDB
+    """,
+    """
+    CREATE TABLE categories (
+        category_id INT PRIMARY KEY AUTO_INCREMENT,
+        category_name VARCHAR(100) NOT NULL UNIQUE,
+        description TEXT,
+        parent_category_id INT NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (parent_category_id) REFERENCES categories(category_id) ON DELETE SET NULL
+    ) ENGINE=InnoDB
+    """,
+    """
+    CREATE TABLE products (
+        product_id INT PRIMARY KEY AUTO_INCREMENT,
+        product_name VARCHAR(200) NOT NULL,
+        description TEXT,
+        category_id INT NOT NULL,
+        price DECIMAL(10, 2) NOT NULL,
+        stock_quantity INT NOT NULL DEFAULT 0,
+        sku VARCHAR(50) UNIQUE,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+        FOREIGN KEY (category_id) REFERENCES categories(category_id) ON DELETE RESTRICT,
+        INDEX idx_price (price)
+    ) ENGINE=InnoDB
+    """,
+    """
+    CREATE TABLE orders (
+        order_id INT PRIMARY KEY AUTO_INCREMENT,
+        user_id INT NOT NULL,
+        order_date DATETIME DEFAULT CURRENT_TIMESTAMP,
+        total_amount DECIMAL(10, 2) NOT NULL,
+        status ENUM('pending', 'processing', 'shipped', 'delivered', 'cancelled') DEFAULT 'pending',
+        shipping_address TEXT NOT NULL,
+        notes TEXT,
+        FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE RESTRICT,
+        INDEX idx_order_date (order_date),
+        INDEX idx_status (status)
+    ) ENGINE=InnoDB
+    """,
+    """
+    CREATE TABLE order_items (
+        order_item_id INT PRIMARY KEY AUTO_INCREMENT,
+        order_id INT NOT NULL,
+        product_id INT NOT NULL,
+        quantity INT NOT NULL,
+        unit_price DECIMAL(10, 2) NOT NULL,
+        subtotal DECIMAL(10, 2) NOT NULL,
+        FOREIGN KEY (order_id) REFERENCES orders(order_id) ON DELETE CASCADE,
+        FOREIGN KEY (product_id) REFERENCES products(product_id) ON DELETE RESTRICT
+    ) ENGINE=InnoDB
+    """,
+    """
+    CREATE TABLE payments (
+        payment_id INT PRIMARY KEY AUTO_INCREMENT,
+        order_id INT NOT NULL,
+        payment_method ENUM('credit_card', 'debit_card', 'bank_transfer', 'cash') NOT NULL,
+        amount DECIMAL(10, 2) NOT NULL,
+        payment_date DATETIME DEFAULT CURRENT_TIMESTAMP,
+        status ENUM('pending', 'completed', 'failed', 'refunded') DEFAULT 'pending',
+        transaction_id VARCHAR(100) UNIQUE,
+        FOREIGN KEY (order_id) REFERENCES orders(order_id) ON DELETE RESTRICT,
+        INDEX idx_payment_date (payment_date)
+    ) ENGINE=InnoDB
+    """
+]
+
+# Tablolar FK sırasına göre silinir / doldurulur
+DROP_ORDER = ['payments', 'order_items', 'orders', 'products', 'categories', 'users']
+
+FIRST_NAMES = ['Ahmet', 'Ayşe', 'Mehmet', 'Zeynep', 'Can', 'Elif', 'Emre', 'Selin', 'Burak', 'Deniz']
+LAST_NAMES = ['Yılmaz', 'Kaya', 'Demir', 'Şahin', 'Çelik', 'Yıldız', 'Aydın', 'Öztürk', 'Arslan', 'Doğan']
+CITIES = ['İstanbul', 'Ankara', 'İzmir', 'Bursa', 'Antalya', 'Konya', 'Adana', 'Trabzon']
+WORDS = ['kaliteli', 'dayanıklı', 'hafif', 'şık', 'ekonomik', 'pratik', 'modern', 'klasik',
+         'orijinal', 'garantili', 'yeni', 'popüler', 'özel', 'sınırlı', 'üretim']
+ORDER_STATUSES = ['pending', 'processing', 'shipped', 'delivered', 'cancelled']
+PAYMENT_METHODS = ['credit_card', 'debit_card', 'bank_transfer', 'cash']
+PAYMENT_STATUSES = ['pending', 'completed', 'failed', 'refunded']
+
+BASE_DATE = datetime(2020, 1, 1)
+
+
+def table_row_counts(total_rows: int) -> Dict[str, int]:
+    """
+    Toplam satır sayısını tablolara dağıtır.
+    
+    Args:
+        total_rows: Hedef toplam satır sayısı
+        
+    Returns:
+        dict: Tablo isimlerine göre satır sayıları
+    """
+    counts = {'categories': CATEGORY_COUNT}
+    for table_name, share in TABLE_SHARES.items():
+        counts[table_name] = max(1, int(total_rows * share))
+    return counts
+
+
+def _text(rng: random.Random, min_words: int, max_words: int) -> str:
+    """
+    Rastgele uzunlukta metin üretir.
+    """
+    return ' '.join(rng.choice(WORDS) for _ in range(rng.randint(min_words, max_words)))
+
+
+def _datetime(rng: random.Random, days: int = 1800) -> datetime:
+    """
+    BASE_DATE'ten sonra rastgele bir zaman üretir.
+    """
+    return BASE_DATE + timedelta(seconds=rng.randint(0, days * 86400))
+
+
+def generate_rows(table_name: str, counts: Dict[str, int],
+                  rng: random.Random) -> Iterator[Tuple[Any, ...]]:
+    """
+    Tablo için sentetik satırlar üretir (AUTO_INCREMENT PK'ler 1'den başlar).
+    
+    Args:
+        table_name: Tablo ismi
+        counts: Tablo satır sayıları
+        rng: Deterministik rastgele sayı üreteci
+        
+    Yields:
+        tuple: INSERT sırasına göre kolon değerleri
+    """
+    if table_name == 'users':
+        for i in range(1, counts['users'] + 1):
+            yield (
+                i, f"user{i}", f"user{i}@example.com", f"{rng.getrandbits(256):064x}",
+                rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES),
+                f"+90 5{rng.randint(300000000, 599999999)}" if rng.random() < 0.8 else None,
+                _datetime(rng, 20000).date() if rng.random() < 0.7 else None,
+                _datetime(rng), rng.random() < 0.9, round(rng.uniform(0, 5000), 2)
+            )
+    elif table_name == 'categories':
+        for i in range(1, counts['categories'] + 1):
+            parent = rng.randint(1, i - 1) if i > 10 else None
+            yield (i, f"Kategori {i}", _text(rng, 5, 30), parent, _datetime(rng))
+    elif table_name == 'products':
+        for i in range(1, counts['products'] + 1):
+            # Açıklamaların bir kısmı uzun (TEXT ağırlıklı satırlar)
+            description = _text(rng, 200, 400) if rng.random() < 0.1 else _text(rng, 10, 60)
+            created = _datetime(rng)
+            yield (
+                i, f"Ürün {i} {_text(rng, 1, 3)}", description,
+                rng.randint(1, counts['categories']), round(rng.uniform(5, 20000), 2),
+                rng.randint(0, 1000), f"SKU-{i:010d}", created,
+                created + timedelta(days=rng.randint(0, 365))
+            )
+    elif table_name == 'orders':
+        for i in range(1, counts['orders'] + 1):
+            yield (
+                i, rng.randint(1, counts['users']), _datetime(rng),
+                round(rng.uniform(10, 10000), 2), rng.choice(ORDER_STATUSES),
+                f"{rng.randint(1, 200)}. Sokak No:{rng.randint(1, 99)} {rng.choice(CITIES)}",
+                _text(rng, 3, 15) if rng.random() < 0.2 else None
+            )
+    elif table_name == 'order_items':
+        for i in range(1, counts['order_items'] + 1):
+            quantity = rng.randint(1, 10)
+            unit_price = round(rng.uniform(5, 2000), 2)
+            yield (
+                i, rng.randint(1, counts['orders']), rng.randint(1, counts['products']),
+                quantity, unit_price, round(quantity * unit_price, 2)
+            )
+    elif table_name == 'payments':
+        for i in range(1, counts['payments'] + 1):
+            yield (
+                i, rng.randint(1, counts['orders']), rng.choice(PAYMENT_METHODS),
+                round(rng.uniform(10, 10000), 2), _datetime(rng),
+                rng.choice(PAYMENT_STATUSES), f"TXN-{i:012d}"
+            )
+
+
+INSERT_COLUMNS = {
+    'users': ['user_id', 'username', 'email', 'password_hash', 'first_name', 'last_name',
+              'phone', 'birth_date', 'registration_date', 'is_active', 'balance'],
+    'categories': ['category_id', 'category_name', 'description', 'parent_category_id', 'created_at'],
+    'products': ['product_id', 'product_name', 'description', 'category_id', 'price',
+                 'stock_quantity', 'sku', 'created_at', 'updated_at'],
+    'orders': ['order_id', 'user_id', 'order_date', 'total_amount', 'status',
+               'shipping_address', 'notes'],
+    'order_items': ['order_item_id', 'order_id', 'product_id', 'quantity', 'unit_price', 'subtotal'],
+    'payments': ['payment_id', 'order_id', 'payment_method', 'amount', 'payment_date',
+                 'status', 'transaction_id']
+}
+
+
+def build_database(connection_url: str, total_rows: int, seed: int = 42) -> Dict[str, int]:
+    """
+    Benchmark şemasını oluşturur ve sentetik verilerle doldurur.
+    Mevcut benchmark tabloları silinir.
+    
+    Args:
+        connection_url: Hedef MySQL veritabanının SQLAlchemy URL'i
+        total_rows: Hedef toplam satır sayısı
+        seed: Rastgele sayı üreteci tohumu
+        
+    Returns:
+        dict: Tablo isimlerine göre yüklenen satır sayıları
+    """
+    counts = table_row_counts(total_rows)
+    rng = random.Random(seed)
+    engine = create_engine(connection_url)
+    
+    with engine.begin() as conn:
+        conn.execute(text("SET FOREIGN_KEY_CHECKS = 0"))
+        for table_name in DROP_ORDER:
+            conn.execute(text(f"DROP TABLE IF EXISTS `{table_name}`"))
+        for ddl in SCHEMA_DDL:
+            conn.execute(text(ddl))
+    
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        # Yükleme sırasında kontroller kapatılır (veri zaten tutarlı üretilir)
+        cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+        cursor.execute("SET UNIQUE_CHECKS = 0")
+        for table_name in reversed(DROP_ORDER):
+            columns = INSERT_COLUMNS[table_name]
+            query = (f"INSERT INTO `{table_name}` ({', '.join(columns)}) "
+                     f"VALUES ({', '.join(['%s'] * len(columns))})")
+            chunk: List[Tuple[Any, ...]] = []
+            for row in generate_rows(table_name, counts, rng):
+                chunk.append(row)
+                if len(chunk) >= INSERT_CHUNK_SIZE:
+                    cursor.executemany(query, chunk)
+                    raw.commit()
+                    chunk = []
+            if chunk:
+                cursor.executemany(query, chunk)
+                raw.commit()
+            logger.info(f"{table_name}: {counts[table_name]} satır yüklendi")
+        cursor.execute("SET UNIQUE_CHECKS = 1")
+        cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+        cursor.execute(f"ANALYZE TABLE {', '.join(f'`{t}`' for t in DROP_ORDER)}")
+        cursor.fetchall()
+    finally:
+        raw.close()
+        engine.dispose()
+    
+    return counts
+
+
+def main():
+    """
+    Komut satırından sentetik veritabanı oluşturur.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark için sentetik e-ticaret verisi üretir")
+    parser.add_argument('--rows', type=int, default=1_000_000, help="Hedef toplam satır sayısı")
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=3306)
+    parser.add_argument('--username', default='root')
+    parser.add_argument('--password', default='')
+    parser.add_argument('--database', default='migration_bench')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    url = (f"mysql+pymysql://{args.username}:{args.password}@{args.host}:{args.port}/"
+           f"{args.database}?charset=utf8mb4")
+    counts = build_database(url, args.rows, args.seed)
+    print(f"Toplam {sum(counts.values())} satır üretildi: {counts}")
+
+
+if __name__ == "__main__":
+    main()
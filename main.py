@@ -11,6 +11,7 @@ Bu uygulama:
 
 import sys
 import os
+import argparse
 import logging
 import yaml
 from pathlib import Path
@@ -25,6 +26,10 @@ from src.database.sql_connector import SQLConnector
 from src.database.schema_discovery import SchemaDiscovery
 from src.database.mongodb_connector import MongoDBConnector
 from src.migration.migrator import DataMigrator
+from src.migration.orchestrator import AsyncOrchestrator, ORCHESTRATORS
+from src.migration.distributed import DistributedMigration, ROLES
+from src.migration.consolidation import MultiSourceMigration
+from src.migration.profiling import MigrationProfiler, PROFILE_MODES
 from src.reporting.report_generator import ReportGenerator
 
 
@@ -103,11 +108,113 @@ def load_config(config_path: str = 'config.yaml') -> dict:
         sys.exit(1)
 
 
+def parse_args() -> argparse.Namespace:
+    """
+    Komut satırı argümanlarını okur.
+    
+    Returns:
+        Namespace: Argümanlar
+    """
+    parser = argparse.ArgumentParser(description="SQL → MongoDB Migration Tool")
+    parser.add_argument(
+        '--profile',
+        nargs='?',
+        const='sampling',
+        choices=PROFILE_MODES,
+        help="Tablo aktarımlarını profiller ve rapor dizinine collapsed stack "
+             "(flame graph) çıktısı yazar (varsayılan mod: sampling)"
+    )
+    parser.add_argument(
+        '--role',
+        choices=ROLES,
+        help="Dağıtık mod: coordinator iş birimlerini oluşturur ve raporu yazar, "
+             "worker birimleri kiralayıp çalıştırır"
+    )
+    parser.add_argument(
+        '--run-id',
+        help="Dağıtık çalıştırma kimliği (worker'da verilmezse son aktif çalıştırma)"
+    )
+    parser.add_argument(
+        '--worker-id',
+        help="Worker kimliği (varsayılan: host:pid)"
+    )
+    return parser.parse_args()
+
+
+def migrate_sources(args: argparse.Namespace, config: dict) -> None:
+    """
+    sql_sources listesindeki veritabanlarını tek MongoDB hedefine aktarır
+    ve birleştirilmiş raporu oluşturur.
+    
+    Args:
+        args: Komut satırı argümanları
+        config: Konfigürasyon bilgileri
+    """
+    logger = logging.getLogger(__name__)
+    sql_config = config.get('sql_database', {})
+    mongodb_config = config.get('mongodb', {})
+    migration_config = config.get('migration', {})
+    reporting_config = config.get('reporting', {})
+    
+    if args.role or migration_config.get('target', 'mongodb') == 'file':
+        logger.error("sql_sources dağıtık mod ve dosyaya aktarım ile kullanılamaz")
+        sys.exit(1)
+    if args.profile:
+        logger.warning("--profile çoklu kaynak aktarımında desteklenmez, atlandı")
+    if migration_config.get('orchestrator', 'threads') != 'threads':
+        logger.warning("Çoklu kaynak aktarımı kendi thread orkestrasyonunu kullanır")
+    
+    try:
+        consolidation = MultiSourceMigration(
+            sql_config, config['sql_sources'], mongodb_config, migration_config
+        )
+    except ValueError as e:
+        logger.error(str(e))
+        sys.exit(1)
+    migration_stats = consolidation.run()
+    
+    # Rapordaki kaynak bilgisi tüm kaynakları özetler
+    sources = consolidation.sources
+    report_sql_config = dict(sql_config)
+    report_sql_config['host'] = ', '.join(sorted({str(s.get('host')) for s in sources}))
+    report_sql_config['database'] = f"{len(sources)} kaynak"
+    
+    report_generator = ReportGenerator(
+        output_dir=reporting_config.get('output_dir', 'reports'),
+        format=reporting_config.get('format', 'markdown')
+    )
+    logger.info("Birleştirilmiş teknik rapor oluşturuluyor...")
+    report_path = report_generator.generate_report(
+        consolidation.schema_info,
+        migration_stats,
+        report_sql_config,
+        mongodb_config
+    )
+    logger.info(f"Rapor oluşturuldu: {report_path}")
+    
+    failed_sources = [name for name, source in migration_stats['sources'].items()
+                      if source['status'] == 'failed']
+    print()
+    print("=" * 60)
+    print("MIGRATION TAMAMLANDI")
+    print("=" * 60)
+    print(f"Kaynak Sayısı: {len(sources)} ({len(failed_sources)} hatalı)")
+    print(f"Aktarılan Tablo Sayısı: {migration_stats.get('tables_migrated', 0)}")
+    print(f"Aktarılan Belge Sayısı: {migration_stats.get('total_documents', 0)}")
+    print(f"Hata Sayısı: {len(migration_stats.get('errors', []))}")
+    if migration_stats.get('cancelled'):
+        print("Durum: İPTAL EDİLDİ (yarım kalan kaynaklar tekrar çalıştırmada tamamlanır)")
+    print(f"Rapor: {report_path}")
+    print("=" * 60)
+
+
 def main():
     """
     Ana uygulama fonksiyonu.
     Migration sürecini yönetir.
     """
+    args = parse_args()
+    
     print("=" * 60)
     print("SQL → MongoDB Migration Tool")
     print("=" * 60)
@@ -123,6 +230,12 @@ def main():
     logger.info("Migration uygulaması başlatılıyor...")
     logger.info(f"Başlangıç zamanı: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
+    # Çoklu kaynak: sql_sources verilmişse her kaynak sql_database ayarlarını ezer
+    if config.get('sql_sources'):
+        migrate_sources(args, config)
+        logger.info("Migration uygulaması başarıyla tamamlandı.")
+        return
+    
     # SQL veritabanı bağlantısı
     sql_config = config.get('sql_database', {})
     sql_connector = SQLConnector(sql_config)
@@ -131,37 +244,91 @@ def main():
         logger.error("SQL veritabanına bağlanılamadı. Uygulama sonlandırılıyor.")
         sys.exit(1)
     
+    migration_config = config.get('migration', {})
+    orchestrator = None
+    orchestrator_mode = migration_config.get('orchestrator', 'threads')
+    if orchestrator_mode not in ORCHESTRATORS:
+        logger.error(f"Desteklenmeyen orchestrator: {orchestrator_mode}")
+        sys.exit(1)
+    if orchestrator_mode == 'asyncio' and not args.role:
+        orchestrator = AsyncOrchestrator(migration_config)
+    if args.role and migration_config.get('target', 'mongodb') == 'file':
+        logger.error("Dağıtık mod yalnızca MongoDB hedefiyle kullanılabilir")
+        sys.exit(1)
+    
     try:
-        # Şema keşfi
-        logger.info("Şema keşfi başlatılıyor...")
-        schema_discovery = SchemaDiscovery(sql_connector)
-        schema_info = schema_discovery.discover_all()
-        
-        # Keşfedilen nesneleri logla
-        logger.info(f"Keşif tamamlandı:")
-        logger.info(f"  - Tablolar: {len(schema_info.get('tables', []))}")
-        logger.info(f"  - Trigger'ler: {sum(len(v) for v in schema_info.get('triggers', {}).values())}")
-        logger.info(f"  - Stored Procedure'ler: {len(schema_info.get('stored_procedures', []))}")
-        logger.info(f"  - Function'lar: {len(schema_info.get('functions', []))}")
+        # Şema keşfi (dağıtık worker şemayı koordinatörün kontrol collection'ından okur)
+        schema_info = {}
+        if args.role == 'worker':
+            logger.info("Worker modu: şema keşfi atlandı")
+        else:
+            logger.info("Şema keşfi başlatılıyor...")
+            schema_discovery = SchemaDiscovery(sql_connector)
+            if orchestrator is not None:
+                schema_info = orchestrator.run_discovery(schema_discovery)
+                if orchestrator.cancelled:
+                    logger.warning("Şema keşfi sırasında iptal edildi, aktarım başlatılmadı")
+                    return
+            else:
+                schema_info = schema_discovery.discover_all()
+            
+            # Keşfedilen nesneleri logla
+            logger.info(f"Keşif tamamlandı:")
+            logger.info(f"  - Tablolar: {len(schema_info.get('tables', []))}")
+            logger.info(f"  - Trigger'ler: {sum(len(v) for v in schema_info.get('triggers', {}).values())}")
+            logger.info(f"  - Stored Procedure'ler: {len(schema_info.get('stored_procedures', []))}")
+            logger.info(f"  - Function'lar: {len(schema_info.get('functions', []))}")
         
-        # MongoDB bağlantısı
+        # MongoDB bağlantısı (dosyaya aktarım modunda gerekmez)
         mongodb_config = config.get('mongodb', {})
-        mongodb_connector = MongoDBConnector(mongodb_config)
+        reporting_config = config.get('reporting', {})
+        mongodb_connector = None
         
-        if not mongodb_connector.connect():
-            logger.error("MongoDB'ye bağlanılamadı. Uygulama sonlandırılıyor.")
-            sys.exit(1)
+        if migration_config.get('target', 'mongodb') == 'file':
+            logger.info("Dosyaya aktarım modu: MongoDB bağlantısı kurulmayacak")
+        else:
+            mongodb_connector = MongoDBConnector(mongodb_config)
+            if not mongodb_connector.connect():
+                logger.error("MongoDB'ye bağlanılamadı. Uygulama sonlandırılıyor.")
+                sys.exit(1)
         
         try:
             # Veri aktarımı
-            migration_config = config.get('migration', {})
-            migrator = DataMigrator(sql_connector, mongodb_connector, migration_config)
+            
+            # Profiling (--profile)
+            profiler = None
+            if args.profile:
+                profiler = MigrationProfiler(
+                    reporting_config.get('output_dir', 'reports'),
+                    mode=args.profile
+                )
+                logger.info(f"Profiling aktif ({args.profile}): {profiler.output_dir}")
+                if args.profile == 'cprofile' and migration_config.get('table_workers', 1) > 1:
+                    # Aynı anda yalnızca bir cProfile etkin olabilir
+                    logger.warning("--profile cprofile ile tablolar sırayla aktarılır (table_workers: 1)")
+                    migration_config['table_workers'] = 1
+            
+            migrator = DataMigrator(sql_connector, mongodb_connector, migration_config, profiler)
             
             logger.info("Veri aktarımı başlatılıyor...")
-            migration_stats = migrator.migrate_all(schema_info)
+            if args.role == 'worker':
+                # Worker yalnızca birimleri çalıştırır; raporu koordinatör oluşturur
+                distributed = DistributedMigration(migrator, migration_config,
+                                                   args.run_id, args.worker_id)
+                completed = distributed.work()
+                print(f"Worker {distributed.worker_id}: {completed} iş birimi tamamlandı "
+                      f"(çalıştırma {distributed.run_id})")
+                return
+            if args.role == 'coordinator':
+                distributed = DistributedMigration(migrator, migration_config,
+                                                   args.run_id, args.worker_id)
+                migration_stats = distributed.coordinate(schema_info)
+            elif orchestrator is not None:
+                migration_stats = orchestrator.run_migration(migrator, schema_info)
+            else:
+                migration_stats = migrator.migrate_all(schema_info)
             
             # Rapor oluşturma
-            reporting_config = config.get('reporting', {})
             report_generator = ReportGenerator(
                 output_dir=reporting_config.get('output_dir', 'reports'),
                 format=reporting_config.get('format', 'markdown')
@@ -185,11 +352,16 @@ def main():
             print(f"Aktarılan Tablo Sayısı: {migration_stats.get('tables_migrated', 0)}")
             print(f"Aktarılan Belge Sayısı: {migration_stats.get('total_documents', 0)}")
             print(f"Hata Sayısı: {len(migration_stats.get('errors', []))}")
+            if migration_stats.get('cancelled'):
+                print("Durum: İPTAL EDİLDİ (yarım kalan tablolar tekrar çalıştırmada tamamlanır)")
+            if 'export' in migration_stats:
+                print(f"Export Manifest: {migration_stats['export']['manifest']}")
             print(f"Rapor: {report_path}")
             print("=" * 60)
             
         finally:
-            mongodb_connector.close()
+            if mongodb_connector is not None:
+                mongodb_connector.close()
     
     finally:
         sql_connector.close()
@@ -3,14 +3,25 @@ MongoDB Connector Module
 MongoDB veritabanına bağlanmak ve işlem yapmak için kullanılır.
 """
 
+import json
 import logging
+import time
+from datetime import datetime
 from typing import Dict, Any, Optional, List
-from pymongo import MongoClient
+from pymongo import MongoClient, InsertOne
 from pymongo.database import Database
 from pymongo.collection import Collection
+from pymongo.errors import BulkWriteError, AutoReconnect, ConnectionFailure
 
 logger = logging.getLogger(__name__)
 
+# Tekrar denenebilecek geçici hatalar (AutoReconnect; NotPrimaryError ve
+# NetworkTimeout hatalarını da kapsar)
+TRANSIENT_ERRORS = (AutoReconnect, ConnectionFailure)
+
+# MongoDB duplicate key hata kodu
+DUPLICATE_KEY_ERROR = 11000
+
 
 class MongoDBConnector:
     """
@@ -29,6 +40,12 @@ class MongoDBConnector:
         self.client: Optional[MongoClient] = None
         self.database: Optional[Database] = None
         
+        # Hata toleransı ayarları
+        self.max_retries = config.get('max_retries', 3)
+        self.retry_backoff = config.get('retry_backoff', 0.5)
+        self.dead_letter_collection = config.get('dead_letter_collection', '_dead_letters')
+        self.dead_letter_file = config.get('dead_letter_file', '')
+        
     def connect(self) -> bool:
         """
         MongoDB'ye bağlanır.
@@ -122,6 +139,26 @@ class MongoDBConnector:
             logger.error(f"Collection silme hatası: {str(e)}")
             return False
     
+    def create_collection(self, collection_name: str, options: Dict[str, Any]) -> bool:
+        """
+        Collection'ı verilen seçeneklerle (timeseries, clusteredIndex vb.) oluşturur.
+        
+        Args:
+            collection_name: Collection ismi
+            options: create komutu seçenekleri
+        
+        Returns:
+            bool: Oluşturma başarılı ise True
+        """
+        try:
+            if self.database is not None:
+                self.database.create_collection(collection_name, **options)
+                return True
+            return False
+        except Exception as e:
+            logger.error(f"Collection oluşturma hatası ({collection_name}): {str(e)}")
+            return False
+    
     def collection_exists(self, collection_name: str) -> bool:
         """
         Collection'ın var olup olmadığını kontrol eder.
@@ -136,14 +173,16 @@ class MongoDBConnector:
             return collection_name in self.database.list_collection_names()
         return False
     
-    def create_index(self, collection_name: str, index_fields: List[str], unique: bool = False) -> bool:
+    def create_index(self, collection_name: str, index_fields: List[Any], unique: bool = False,
+                     partial_filter: Optional[Dict[str, Any]] = None) -> bool:
         """
         Collection'da index oluşturur.
         
         Args:
             collection_name: Collection ismi
-            index_fields: Index oluşturulacak alanlar
+            index_fields: Index oluşturulacak alanlar (alan ismi veya (alan, yön) çifti)
             unique: Unique index ise True
+            partial_filter: Partial index filtresi (partialFilterExpression)
             
         Returns:
             bool: Index oluşturma başarılı ise True
@@ -151,10 +190,14 @@ class MongoDBConnector:
         try:
             collection = self.get_collection(collection_name)
             if collection is not None:
-                index_spec = [(field, 1) for field in index_fields]
+                index_spec = [tuple(field) if isinstance(field, (list, tuple)) else (field, 1)
+                              for field in index_fields]
+                options: Dict[str, Any] = {'unique': unique}
+                if partial_filter:
+                    options['partialFilterExpression'] = partial_filter
                 # Index zaten varsa hata verme (idempotent çalışma için)
                 try:
-                    collection.create_index(index_spec, unique=unique)
+                    collection.create_index(index_spec, **options)
                     logger.debug(f"Index oluşturuldu: {collection_name}.{index_fields}")
                 except Exception as idx_error:
                     # Index zaten varsa sadece logla, hata olarak sayma
@@ -173,6 +216,9 @@ class MongoDBConnector:
         """
         Collection'a belgeler ekler (batch insert).
         
+        Hatalı belgeler dead-letter hedefine yazılır, geri kalan batch'ler
+        eklenmeye devam eder.
+        
         Args:
             collection_name: Collection ismi
             documents: Eklenecek belgeler listesi
@@ -181,27 +227,213 @@ class MongoDBConnector:
         Returns:
             int: Eklenen belge sayısı
         """
+        collection = self.get_collection(collection_name)
+        if collection is None:
+            return 0
+        
+        inserted_count = 0
+        total_docs = len(documents)
+        
+        # Batch'ler halinde ekle
+        for i in range(0, total_docs, batch_size):
+            batch = documents[i:i + batch_size]
+            try:
+                counts = self._write_batch(collection, collection_name, batch, is_insert=True)
+            except TRANSIENT_ERRORS + (BulkWriteError,) as e:
+                # Tekrar denemeler tükendi; batch dead-letter'a yazılır, sonraki batch'lerle devam edilir
+                logger.error(f"Belge ekleme hatası ({collection_name}), "
+                             f"{len(batch)} belge yazılamadı: {str(e)}")
+                self._dead_letter_batch(collection_name, batch, e, batch)
+                continue
+            inserted_count += counts['inserted']
+            logger.debug(f"{collection_name}: {inserted_count}/{total_docs} belge eklendi")
+        
+        logger.info(f"{collection_name} collection'ına {inserted_count} belge eklendi")
+        return inserted_count
+    
+    def bulk_write_operations(self, collection_name: str, operations: List[Any],
+                              batch_size: int = 1000,
+                              payloads: Optional[List[Any]] = None) -> Dict[str, int]:
+        """
+        Bulk write operasyonlarını batch'ler halinde çalıştırır.
+        
+        Geçici hatalar (ağ, NotPrimary) batch seviyesinde tekrar denenir,
+        BulkWriteError içindeki başarılı yazımlar sayılır ve hatalı
+        operasyonlar dead-letter hedefine yazılır.
+        
+        Args:
+            collection_name: Collection ismi
+            operations: InsertOne/UpdateOne gibi bulk write operasyonları
+            batch_size: Her batch'teki operasyon sayısı
+            payloads: Operasyonlarla aynı sırada dead-letter kayıtları
+                (insert için belge, diğerleri için {'q', 'u', 'upsert'}) (opsiyonel)
+        
+        Returns:
+            dict: inserted, matched, modified, upserted, deleted ve failed sayıları
+        """
+        totals = _empty_write_counts()
+        collection = self.get_collection(collection_name)
+        if collection is None:
+            totals['failed'] = len(operations)
+            return totals
+        
+        for i in range(0, len(operations), batch_size):
+            batch = operations[i:i + batch_size]
+            try:
+                counts = self._write_batch(collection, collection_name, batch, is_insert=False)
+            except TRANSIENT_ERRORS + (BulkWriteError,) as e:
+                # Tekrar denemeler tükendi; batch dead-letter'a yazılır, sonraki batch'lerle devam edilir
+                logger.error(f"Bulk write hatası ({collection_name}), "
+                             f"{len(batch)} operasyon yazılamadı: {str(e)}")
+                totals['failed'] += len(batch)
+                self._dead_letter_batch(collection_name, batch, e,
+                                        payloads[i:i + batch_size] if payloads is not None else None)
+                continue
+            for key, value in counts.items():
+                totals[key] += value
+            logger.debug(f"{collection_name}: {i + len(batch)}/{len(operations)} belge işlendi")
+        
+        return totals
+    
+    def _write_batch(self, collection: Collection, collection_name: str,
+                     batch: List[Any], is_insert: bool) -> Dict[str, int]:
+        """
+        Tek bir batch'i yazar; geçici hatalarda exponential backoff ile tekrar dener.
+        
+        Args:
+            collection: Hedef collection
+            collection_name: Collection ismi
+            batch: Belgeler (insert) veya bulk write operasyonları
+            is_insert: True ise insert_many, değilse bulk_write kullanılır
+        
+        Returns:
+            dict: Yazım sayıları
+        """
+        for attempt in range(self.max_retries + 1):
+            counts = _empty_write_counts()
+            try:
+                if is_insert:
+                    result = collection.insert_many(batch, ordered=False)
+                    counts['inserted'] = len(result.inserted_ids)
+                else:
+                    result = collection.bulk_write(batch, ordered=False)
+                    counts['inserted'] = result.inserted_count
+                    counts['matched'] = result.matched_count
+                    counts['modified'] = result.modified_count
+                    counts['upserted'] = result.upserted_count
+                    counts['deleted'] = result.deleted_count
+                return counts
+            except BulkWriteError as e:
+                return self._handle_bulk_write_error(
+                    collection_name, batch, e.details, is_insert, retried=attempt > 0
+                )
+            except TRANSIENT_ERRORS as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.retry_backoff * (2 ** attempt)
+                logger.warning(f"{collection_name}: geçici yazma hatası, "
+                               f"{delay:.1f} sn sonra tekrar denenecek "
+                               f"({attempt + 1}/{self.max_retries}): {str(e)}")
+                time.sleep(delay)
+        return _empty_write_counts()
+    
+    def _handle_bulk_write_error(self, collection_name: str, batch: List[Any],
+                                 details: Dict[str, Any], is_insert: bool,
+                                 retried: bool) -> Dict[str, int]:
+        """
+        BulkWriteError detaylarını ayrıştırır.
+        
+        Args:
+            collection_name: Collection ismi
+            batch: Yazılmaya çalışılan batch
+            details: BulkWriteError.details
+            is_insert: Batch insert_many ile yazıldıysa True
+            retried: Batch tekrar deneme sonucunda yazıldıysa True
+        
+        Returns:
+            dict: Başarılı ve başarısız yazım sayıları
+        """
+        counts = _empty_write_counts()
+        counts['inserted'] = details.get('nInserted', 0)
+        counts['matched'] = details.get('nMatched', 0)
+        counts['modified'] = details.get('nModified', 0)
+        counts['upserted'] = details.get('nUpserted', 0)
+        counts['deleted'] = details.get('nRemoved', 0)
+        
+        failed = []
+        for write_error in details.get('writeErrors', []):
+            # Tekrar denemede duplicate key, belgenin önceki denemede
+            # yazıldığını gösterir
+            if retried and write_error.get('code') == DUPLICATE_KEY_ERROR:
+                index = write_error.get('index', -1)
+                if is_insert or (0 <= index < len(batch) and isinstance(batch[index], InsertOne)):
+                    counts['inserted'] += 1
+                    continue
+            failed.append(write_error)
+        
+        counts['failed'] = len(failed)
+        if failed:
+            logger.warning(f"{collection_name}: {len(failed)} belge yazılamadı "
+                           f"(ilk hata: {failed[0].get('errmsg', '')})")
+            self._write_dead_letters(collection_name, failed)
+        
+        for concern_error in details.get('writeConcernErrors', []):
+            logger.warning(f"{collection_name}: write concern hatası: "
+                           f"{concern_error.get('errmsg', '')}")
+        
+        return counts
+    
+    def _dead_letter_batch(self, collection_name: str, batch: List[Any], error: Exception,
+                           payloads: Optional[List[Any]] = None):
+        """
+        Hiç yazılamayan bir batch'in tüm operasyonlarını, BulkWriteError
+        writeErrors kayıtlarıyla aynı biçimde dead-letter hedefine yazar.
+        
+        Args:
+            collection_name: Collection ismi
+            batch: Belgeler veya bulk write operasyonları
+            error: Tekrar denemeler sonunda alınan hata
+            payloads: Batch ile aynı sırada yazılacak operasyon kayıtları; verilmezse
+                operasyonların metin gösterimi yazılır
+        """
+        if payloads is None:
+            payloads = [str(operation) for operation in batch]
+        code = getattr(error, 'code', None)
+        write_errors = [
+            {'index': index, 'code': code, 'errmsg': str(error), 'op': payload}
+            for index, payload in enumerate(payloads)
+        ]
+        self._write_dead_letters(collection_name, write_errors)
+    
+    def _write_dead_letters(self, collection_name: str, write_errors: List[Dict[str, Any]]):
+        """
+        Yazılamayan belgeleri dead-letter collection'ına veya dosyasına kaydeder.
+        
+        Args:
+            collection_name: Kaynak collection ismi
+            write_errors: BulkWriteError writeErrors listesi
+        """
+        failed_at = datetime.now()
+        entries = [
+            {
+                'collection': collection_name,
+                'code': write_error.get('code'),
+                'errmsg': write_error.get('errmsg', ''),
+                'operation': write_error.get('op'),
+                'failed_at': failed_at
+            }
+            for write_error in write_errors
+        ]
+        
         try:
-            collection = self.get_collection(collection_name)
-            if collection is None:
-                return 0
-            
-            inserted_count = 0
-            total_docs = len(documents)
-            
-            # Batch'ler halinde ekle
-            for i in range(0, total_docs, batch_size):
-                batch = documents[i:i + batch_size]
-                result = collection.insert_many(batch, ordered=False)
-                inserted_count += len(result.inserted_ids)
-                logger.debug(f"{collection_name}: {inserted_count}/{total_docs} belge eklendi")
-            
-            logger.info(f"{collection_name} collection'ına {inserted_count} belge eklendi")
-            return inserted_count
-            
+            if self.dead_letter_file:
+                with open(self.dead_letter_file, 'a', encoding='utf-8') as f:
+                    for entry in entries:
+                        f.write(json.dumps(entry, default=str, ensure_ascii=False) + "\n")
+            elif self.database is not None:
+                self.database[self.dead_letter_collection].insert_many(entries, ordered=False)
         except Exception as e:
-            logger.error(f"Belge ekleme hatası ({collection_name}): {str(e)}")
-            return 0
+            logger.error(f"Dead-letter kaydı yazılamadı ({collection_name}): {str(e)}")
     
     def close(self):
         """
@@ -211,3 +443,13 @@ class MongoDBConnector:
             self.client.close()
             logger.info("MongoDB bağlantısı kapatıldı")
 
+
+
+def _empty_write_counts() -> Dict[str, int]:
+    """
+    Boş yazım sayaçları döndürür.
+    
+    Returns:
+        dict: Sıfırlanmış yazım sayaçları
+    """
+    return {'inserted': 0, 'matched': 0, 'modified': 0, 'upserted': 0, 'deleted': 0, 'failed': 0}
@@ -0,0 +1,108 @@
+"""
+ODBC Output Converters Module
+MSSQL hızlı yolu için pyodbc output converter'ları. Değerler pyodbc'nin
+Decimal / datetime / UUID nesnelerine dönüştürülmeden ham ODBC yapılarından
+doğrudan MongoDB'ye yazılacak biçime (DataMigrator._convert_value çıktısıyla
+aynı) çevrilir.
+"""
+
+import struct
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+
+# ODBC SQL tip kodları (pyodbc sabitleriyle aynı)
+SQL_NUMERIC = 2
+SQL_DECIMAL = 3
+SQL_TYPE_DATE = 91
+SQL_TYPE_TIMESTAMP = 93
+SQL_GUID = -11
+SQL_SS_TIMESTAMPOFFSET = -155
+
+# SQL_C_BINARY ile okunan ODBC yapıları
+NUMERIC_STRUCT_SIZE = 19  # precision, scale, sign, 16 byte little-endian değer
+TIMESTAMP_STRUCT = struct.Struct('<6hI')
+DATE_STRUCT = struct.Struct('<3h')
+TIMESTAMPOFFSET_STRUCT = struct.Struct('<6hI2h')
+
+
+def install_output_converters(dbapi_connection):
+    """
+    pyodbc bağlantısına DECIMAL/NUMERIC, DATE, DATETIME/DATETIME2,
+    DATETIMEOFFSET ve UNIQUEIDENTIFIER converter'larını ekler.
+    
+    Args:
+        dbapi_connection: pyodbc Connection
+    """
+    dbapi_connection.add_output_converter(SQL_NUMERIC, convert_decimal)
+    dbapi_connection.add_output_converter(SQL_DECIMAL, convert_decimal)
+    dbapi_connection.add_output_converter(SQL_TYPE_DATE, convert_date)
+    dbapi_connection.add_output_converter(SQL_TYPE_TIMESTAMP, convert_timestamp)
+    dbapi_connection.add_output_converter(SQL_SS_TIMESTAMPOFFSET, convert_timestamp_offset)
+    dbapi_connection.add_output_converter(SQL_GUID, convert_guid)
+
+
+def convert_decimal(raw: Optional[bytes]) -> Optional[float]:
+    """
+    SQL_NUMERIC_STRUCT (veya sürücü metin döndürürse ondalık metni) float'a çevirir.
+    """
+    if raw is None:
+        return None
+    # Yapıdaki işaret byte'ı 0/1'dir; metin gösteriminde bu pozisyon hiçbir zaman 0/1 olmaz
+    if len(raw) == NUMERIC_STRUCT_SIZE and raw[2] in (0, 1):
+        scale = raw[1]
+        value = int.from_bytes(raw[3:], 'little')
+        # int / int doğru yuvarlanır; float(Decimal) ile aynı sonucu verir
+        result = value / 10 ** scale if scale else float(value)
+        return result if raw[2] else -result
+    return float(raw.decode('ascii'))
+
+
+def convert_date(raw: Optional[bytes]) -> Optional[str]:
+    """
+    SQL_DATE_STRUCT değerini ISO 8601 string'e çevirir.
+    """
+    if raw is None:
+        return None
+    if len(raw) != DATE_STRUCT.size:
+        return raw.decode('ascii')
+    return date(*DATE_STRUCT.unpack(raw)).isoformat()
+
+
+def convert_timestamp(raw: Optional[bytes]) -> Optional[str]:
+    """
+    SQL_TIMESTAMP_STRUCT değerini (DATETIME, DATETIME2, SMALLDATETIME) ISO 8601
+    string'e çevirir. Nanosaniye kesri pyodbc gibi mikrosaniyeye kırpılır.
+    """
+    if raw is None:
+        return None
+    if len(raw) != TIMESTAMP_STRUCT.size:
+        return raw.decode('ascii')
+    year, month, day, hour, minute, second, fraction = TIMESTAMP_STRUCT.unpack(raw)
+    return datetime(year, month, day, hour, minute, second, fraction // 1000).isoformat()
+
+
+def convert_timestamp_offset(raw: Optional[bytes]) -> Optional[str]:
+    """
+    SQL_SS_TIMESTAMPOFFSET_STRUCT değerini (DATETIMEOFFSET) zaman dilimli ISO 8601
+    string'e çevirir; pyodbc bu tipi converter olmadan okuyamaz.
+    """
+    if raw is None:
+        return None
+    (year, month, day, hour, minute, second, fraction,
+     offset_hour, offset_minute) = TIMESTAMPOFFSET_STRUCT.unpack(raw)
+    offset = timezone(timedelta(hours=offset_hour, minutes=offset_minute))
+    return datetime(year, month, day, hour, minute, second, fraction // 1000,
+                    tzinfo=offset).isoformat()
+
+
+def convert_guid(raw: Optional[bytes]) -> Optional[str]:
+    """
+    UNIQUEIDENTIFIER değerini pyodbc'nin varsayılan gösterimiyle (büyük harfli
+    string) döndürür.
+    """
+    if raw is None:
+        return None
+    if len(raw) != 16:
+        return raw.decode('ascii').upper()
+    return str(uuid.UUID(bytes_le=raw)).upper()
@@ -50,7 +50,8 @@ class SchemaDiscovery:
             'triggers': self.discover_triggers(),
             'stored_procedures': self.discover_stored_procedures(),
             'functions': self.discover_functions(),
-            'views': self.discover_views()
+            'views': self.discover_views(),
+            'row_estimates': self.discover_row_estimates()
         }
         
         logger.info("Şema keşfi tamamlandı")
@@ -411,7 +412,9 @@ class SchemaDiscovery:
     
     def discover_views(self) -> List[Dict[str, Any]]:
         """
-        Tüm view'leri keşfeder.
+        Tüm view'leri tanımlarıyla birlikte keşfeder.
+        MySQL'de INFORMATION_SCHEMA.VIEWS, MSSQL'de OBJECT_DEFINITION kullanılır;
+        diğer veritabanlarında tanım SQLAlchemy inspector'dan okunur.
         
         Returns:
             list: View bilgileri
@@ -419,13 +422,37 @@ class SchemaDiscovery:
         views = []
         
         try:
-            view_names = self.inspector.get_view_names()
-            for view_name in view_names:
-                view_data = {
-                    'name': view_name,
-                    'definition': ''  # View definition'ı almak için ek sorgu gerekebilir
-                }
-                views.append(view_data)
+            if self.db_type == 'mysql':
+                query = """
+                    SELECT 
+                        TABLE_NAME,
+                        VIEW_DEFINITION
+                    FROM INFORMATION_SCHEMA.VIEWS
+                    WHERE TABLE_SCHEMA = DATABASE()
+                """
+            elif self.db_type == 'mssql':
+                query = """
+                    SELECT 
+                        name AS TABLE_NAME,
+                        OBJECT_DEFINITION(object_id) AS VIEW_DEFINITION
+                    FROM sys.views
+                    WHERE is_ms_shipped = 0
+                """
+            else:
+                query = None
+            
+            if query:
+                with self.engine.connect() as conn:
+                    result = conn.execute(text(query))
+                    for row in result.fetchall():
+                        views.append({'name': row[0], 'definition': row[1] or ''})
+            else:
+                for view_name in self.inspector.get_view_names():
+                    try:
+                        definition = self.inspector.get_view_definition(view_name) or ''
+                    except Exception:
+                        definition = ''
+                    views.append({'name': view_name, 'definition': str(definition)})
             
             logger.info(f"{len(views)} view bulundu")
             return views
@@ -434,6 +461,51 @@ class SchemaDiscovery:
             logger.warning(f"View keşif hatası: {str(e)}")
             return []
     
+    def discover_row_estimates(self) -> Dict[str, int]:
+        """
+        Tabloların tahmini satır sayılarını istatistiklerden okur.
+        COUNT(*) çalıştırmaz; MySQL'de TABLE_ROWS, MSSQL'de sys.partitions kullanılır.
+        
+        Returns:
+            dict: Tablo isimlerine göre tahmini satır sayısı
+        """
+        estimates = {}
+        
+        try:
+            if self.db_type == 'mysql':
+                query = """
+                    SELECT 
+                        TABLE_NAME,
+                        TABLE_ROWS
+                    FROM INFORMATION_SCHEMA.TABLES
+                    WHERE TABLE_SCHEMA = DATABASE()
+                    AND TABLE_TYPE = 'BASE TABLE'
+                """
+            elif self.db_type == 'mssql':
+                query = """
+                    SELECT 
+                        t.name AS TABLE_NAME,
+                        SUM(p.rows) AS TABLE_ROWS
+                    FROM sys.tables t
+                    INNER JOIN sys.partitions p ON t.object_id = p.object_id
+                    WHERE p.index_id IN (0, 1)
+                    GROUP BY t.name
+                """
+            else:
+                return {}
+            
+            with self.engine.connect() as conn:
+                result = conn.execute(text(query))
+                for row in result.fetchall():
+                    estimates[row[0]] = int(row[1] or 0)
+            
+            logger.info(f"Tahmini toplam satır sayısı: {sum(estimates.values())}")
+            return estimates
+        
+        except Exception as e:
+            logger.warning(f"Satır sayısı tahmini alınamadı: {str(e)}")
+            return {}
+    
     def get_schema_info(self) -> Dict[str, Any]:
         """
         Keşfedilen şema bilgilerini döndürür.
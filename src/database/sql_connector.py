@@ -5,10 +5,12 @@ MySQL ve MSSQL veritabanlarına bağlanmak için kullanılır.
 
 import logging
 from typing import Optional, Dict, Any
-from sqlalchemy import create_engine, inspect, text
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.engine import Engine
 import pymysql
 
+from src.database.odbc_converters import install_output_converters
+
 # pyodbc sadece MSSQL için gerekli, conditional import
 try:
     import pyodbc
@@ -35,6 +37,10 @@ class SQLConnector:
         self.engine: Optional[Engine] = None
         self.inspector = None
         self.db_type = config.get('type', 'mysql').lower()
+        # MSSQL hızlı yolu: native output converter'lar ve büyük cursor arraysize
+        self.fast_path = self.db_type == 'mssql' and config.get('fast_path', False)
+        self.arraysize = config.get('arraysize', 10000)
+        self.fast_executemany = config.get('fast_executemany', False)
         
     def connect(self) -> bool:
         """
@@ -48,7 +54,13 @@ class SQLConnector:
             logger.info(f"{self.db_type.upper()} veritabanına bağlanılıyor...")
             
             # SQLAlchemy engine oluştur
-            self.engine = create_engine(connection_string, echo=False)
+            engine_options = {}
+            if self.db_type == 'mssql' and self.fast_executemany:
+                # Yalnızca executemany ile yazılan (write-back) ifadeleri etkiler
+                engine_options['fast_executemany'] = True
+            self.engine = create_engine(connection_string, echo=False, **engine_options)
+            if self.fast_path:
+                self._install_fast_path()
             
             # Bağlantıyı test et
             with self.engine.connect() as conn:
@@ -94,6 +106,23 @@ class SQLConnector:
         else:
             raise ValueError(f"Desteklenmeyen veritabanı tipi: {self.db_type}")
     
+    def _install_fast_path(self):
+        """
+        MSSQL hızlı yolunu engine'e bağlar: her yeni pyodbc bağlantısına output
+        converter'lar eklenir, her cursor'ın arraysize'ı büyütülür.
+        """
+        arraysize = self.arraysize
+        
+        @event.listens_for(self.engine, 'connect')
+        def on_connect(dbapi_connection, connection_record):
+            install_output_converters(dbapi_connection)
+        
+        @event.listens_for(self.engine, 'before_cursor_execute')
+        def on_execute(conn, cursor, statement, parameters, context, executemany):
+            cursor.arraysize = arraysize
+        
+        logger.info(f"MSSQL hızlı yolu aktif (native converter'lar, arraysize {arraysize})")
+    
     def get_engine(self) -> Optional[Engine]:
         """
         SQLAlchemy engine'i döndürür.
@@ -112,6 +141,24 @@ class SQLConnector:
         """
         return self.inspector
     
+    def quote_identifier(self, name: str) -> str:
+        """
+        Tablo/kolon ismini veritabanı tipine göre quote eder.
+        
+        Args:
+            name: Quote edilecek isim
+        
+        Returns:
+            str: Quote edilmiş isim
+        """
+        if self.db_type == 'mysql':
+            # MySQL için backtick kullan
+            return f"`{name}`"
+        elif self.db_type == 'mssql':
+            # MSSQL için köşeli parantez kullan
+            return f"[{name}]"
+        return name
+    
     def execute_query(self, query: str) -> list:
         """
         SQL sorgusu çalıştırır ve sonuçları döndürür.
@@ -0,0 +1,184 @@
+"""
+Adaptive Batching Module
+Bulk write batch boyutunu belge byte boyutuna ve yazma gecikmesine göre ayarlar.
+"""
+
+import logging
+from collections import deque
+from typing import Dict, List, Any, Iterator, Tuple
+
+import bson
+
+logger = logging.getLogger(__name__)
+
+# MongoDB wire protocol mesaj limiti 48 MB; driver'ın batch'i bölmesini
+# önlemek için varsayılan üst sınır bunun altında tutulur
+DEFAULT_MAX_BATCH_BYTES = 16 * 1024 * 1024
+
+
+class AdaptiveBatchSizer:
+    """
+    Adaptif batch boyutlandırma sınıfı.
+    Batch'leri tahmini BSON boyutuna göre keser ve son bulk_write
+    gecikmelerine göre batch satır sayısını sürekli günceller.
+    """
+    
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Batch boyutlandırıcıyı başlatır.
+        
+        Args:
+            config: Migration konfigürasyonu
+        """
+        self.enabled = config.get('adaptive_batching', True)
+        self.batch_size = config.get('batch_size', 1000)
+        self.min_batch_size = config.get('min_batch_size', 100)
+        self.max_batch_size = config.get('max_batch_size', 50000)
+        self.target_batch_bytes = config.get('target_batch_bytes', 4 * 1024 * 1024)
+        self.max_batch_bytes = config.get('max_batch_bytes', DEFAULT_MAX_BATCH_BYTES)
+        self.target_latency = config.get('target_batch_latency_ms', 500) / 1000.0
+        
+        # Boyut tahmini için örnekleme durumu
+        self._sample_every = 100
+        self._seen = 0
+        self._sampled = 0
+        self._sampled_bytes = 0
+        
+        # Gecikme kontrolü için durum; farklı boyuttaki batch'ler karşılaştırılabilsin
+        # diye belge başına gecikme tutulur
+        self._latencies = deque(maxlen=config.get('latency_window', 20))
+        self._last_throughput = 0.0
+        self._direction = 1
+        self._initialized = False
+    
+    @property
+    def avg_doc_bytes(self) -> int:
+        """
+        Örneklenen belgelerin ortalama BSON boyutunu döndürür.
+        
+        Returns:
+            int: Ortalama belge boyutu (byte)
+        """
+        if self._sampled == 0:
+            return 0
+        return self._sampled_bytes // self._sampled
+    
+    def estimate_size(self, doc: Dict[str, Any]) -> int:
+        """
+        Belgenin yaklaşık BSON boyutunu tahmin eder.
+        İlk belgeler ve sonrasında her N. belge gerçekten encode edilir,
+        diğerleri için ortalama kullanılır.
+        
+        Args:
+            doc: MongoDB belgesi
+        
+        Returns:
+            int: Tahmini boyut (byte)
+        """
+        self._seen += 1
+        if self._sampled < self._sample_every or self._seen % self._sample_every == 0:
+            try:
+                size = len(bson.encode(doc))
+            except Exception:
+                return self.avg_doc_bytes
+            self._sampled += 1
+            self._sampled_bytes += size
+            return size
+        return self.avg_doc_bytes
+    
+    def split(self, items: List[Any], sizes: List[int]) -> Iterator[Tuple[List[Any], int]]:
+        """
+        Operasyonları satır sayısı ve byte sınırına göre batch'lere böler.
+        
+        Args:
+            items: Yazılacak operasyonlar
+            sizes: Her operasyonun tahmini byte boyutu
+        
+        Yields:
+            tuple: (batch, batch byte boyutu)
+        """
+        if not self.enabled:
+            for i in range(0, len(items), self.batch_size):
+                yield items[i:i + self.batch_size], sum(sizes[i:i + self.batch_size])
+            return
+        
+        self._initialize_from_doc_size()
+        
+        start = 0
+        while start < len(items):
+            limit = self.batch_size
+            end = start
+            batch_bytes = 0
+            while end < len(items) and end - start < limit:
+                if end > start and batch_bytes + sizes[end] > self.max_batch_bytes:
+                    break
+                batch_bytes += sizes[end]
+                end += 1
+            yield items[start:end], batch_bytes
+            start = end
+    
+    def record(self, count: int, seconds: float):
+        """
+        Tamamlanan bir batch'in gecikmesini kaydeder ve batch boyutunu günceller.
+        
+        Belge başına gecikmenin p95 değeriyle mevcut batch boyutu için tahmin
+        edilen gecikme hedefi aşarsa batch küçültülür ve pencere sıfırlanır
+        (eski örnekler yeni boyutta tekrar küçültmeye yol açmaz); aksi halde
+        throughput'u artıran yönde (hill climbing) ilerlenir.
+        
+        Args:
+            count: Batch'teki operasyon sayısı
+            seconds: bulk_write süresi (saniye)
+        """
+        if not self.enabled or count == 0 or seconds <= 0:
+            return
+        
+        self._latencies.append(seconds / count)
+        throughput = count / seconds
+        
+        if self._p95_latency() * self.batch_size > self.target_latency:
+            # Kuyruk gecikmesi yükseliyor, batch'i küçült; gecikme düzelince
+            # tırmanma yeniden büyüme yönünde başlar
+            self._direction = 1
+            new_size = int(self.batch_size * 0.7)
+            self._latencies.clear()
+            throughput = 0.0
+        else:
+            if throughput < self._last_throughput * 0.95:
+                # Son adım throughput'u düşürdü, yönü değiştir
+                self._direction = -self._direction
+            if self._direction > 0:
+                new_size = int(self.batch_size * 1.25) + 1
+            else:
+                new_size = int(self.batch_size * 0.8)
+        
+        self._last_throughput = throughput
+        new_size = max(self.min_batch_size, min(self.max_batch_size, new_size))
+        if new_size != self.batch_size:
+            logger.debug(f"Batch boyutu güncellendi: {self.batch_size} → {new_size} "
+                         f"({seconds * 1000:.0f} ms, {throughput:.0f} belge/sn)")
+            self.batch_size = new_size
+    
+    def _initialize_from_doc_size(self):
+        """
+        İlk batch'ten önce başlangıç batch boyutunu ortalama belge boyutundan hesaplar.
+        """
+        if self._initialized or self.avg_doc_bytes == 0:
+            return
+        self._initialized = True
+        initial = self.target_batch_bytes // self.avg_doc_bytes
+        self.batch_size = max(self.min_batch_size, min(self.max_batch_size, initial))
+        logger.debug(f"Başlangıç batch boyutu: {self.batch_size} "
+                     f"(ortalama belge {self.avg_doc_bytes} byte)")
+    
+    def _p95_latency(self) -> float:
+        """
+        Son batch'lerin belge başına gecikmelerinin p95 değerini döndürür.
+        
+        Returns:
+            float: Belge başına p95 gecikme (saniye)
+        """
+        if not self._latencies:
+            return 0.0
+        ordered = sorted(self._latencies)
+        return ordered[int(0.95 * (len(ordered) - 1))]
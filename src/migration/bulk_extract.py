@@ -0,0 +1,366 @@
+"""
+Bulk Extraction Module
+Büyük tabloları satır satır fetch etmek yerine veritabanının native bulk
+export aracıyla dosyaya çıkarır (MySQL SELECT ... INTO OUTFILE, MSSQL bcp),
+dosyayı memory-map edip parse eder ve satırları normal aktarım hattına verir.
+"""
+
+import logging
+import mmap
+import os
+import re
+import subprocess
+import uuid
+from datetime import datetime, date
+from decimal import Decimal
+from typing import Dict, List, Any, Callable, Iterator, Optional, Tuple
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+# MySQL INTO OUTFILE formatı: tab ile ayrılmış, '\' ile escape edilmiş, NULL = \N
+MYSQL_NULL = b'\\N'
+MYSQL_ESCAPES = {b'0': b'\0', b'b': b'\b', b'n': b'\n', b'r': b'\r', b't': b'\t', b'Z': b'\x1a'}
+MYSQL_ESCAPE_PATTERN = re.compile(rb'\\(.)', re.S)
+
+# bcp karakter modu escape yapmaz; veride geçmesi beklenmeyen ayraçlar kullanılır.
+# bcp -c NULL'u boş alan, boş string'i tek NUL karakteri olarak yazar.
+BCP_FIELD_TERMINATOR = '|~|'
+BCP_ROW_TERMINATOR = '~|~\\n'
+BCP_FIELD_SEPARATOR = b'|~|'
+BCP_ROW_SEPARATOR = b'~|~\n'
+
+# Kolon tiplerinin (SQLAlchemy tip isminin ilk kelimesi) metinden dönüşümleri
+INTEGER_TYPES = {'INT', 'INTEGER', 'TINYINT', 'SMALLINT', 'MEDIUMINT', 'BIGINT', 'YEAR'}
+DECIMAL_TYPES = {'DECIMAL', 'NUMERIC', 'MONEY', 'SMALLMONEY'}
+FLOAT_TYPES = {'FLOAT', 'DOUBLE', 'REAL'}
+DATETIME_TYPES = {'DATETIME', 'DATETIME2', 'SMALLDATETIME', 'TIMESTAMP', 'DATETIMEOFFSET'}
+BINARY_TYPES = {'BLOB', 'TINYBLOB', 'MEDIUMBLOB', 'LONGBLOB', 'BINARY', 'VARBINARY', 'IMAGE'}
+
+
+class BulkExtractor:
+    """
+    Native bulk export ile çıkarma sınıfı.
+    Tahmini satır sayısı eşiği aşan tabloları dosyaya export eder ve
+    dosyayı fetch boyutunda parçalar halinde tuple satırlara çevirir.
+    """
+    
+    def __init__(self, sql_connector, config: Dict[str, Any]):
+        """
+        Bulk extractor'ı başlatır.
+        
+        Args:
+            sql_connector: SQLConnector instance
+            config: Migration konfigürasyonu
+        """
+        self.sql_connector = sql_connector
+        self.db_type = sql_connector.db_type
+        self.enabled = config.get('bulk_extract', False)
+        self.min_rows = config.get('bulk_extract_min_rows', 1000000)
+        # MySQL dosyayı sunucu tarafında yazar: server_dir sunucunun gördüğü yol
+        # (secure_file_priv), local_dir aynı dizinin bu makinedeki karşılığıdır
+        self.local_dir = config.get('bulk_extract_dir', 'bulk_extract')
+        self.server_dir = config.get('bulk_extract_server_dir', self.local_dir)
+        self.bcp_path = config.get('bcp_path', 'bcp')
+        self.bcp_extra_args = list(config.get('bcp_extra_args', []))
+        # true ise bcp Windows/Kerberos kimliğiyle (-T) bağlanır, parola kullanılmaz
+        self.bcp_trusted_connection = config.get('bcp_trusted_connection', False)
+    
+    def should_use(self, estimated_rows: int) -> bool:
+        """
+        Tablonun bulk export ile çıkarılıp çıkarılmayacağını belirler.
+        
+        Args:
+            estimated_rows: Tablonun tahmini satır sayısı
+        
+        Returns:
+            bool: Bulk export kullanılacaksa True
+        """
+        return (self.enabled and self.db_type in ('mysql', 'mssql')
+                and estimated_rows >= self.min_rows)
+    
+    def read_table(self, table_name: str, columns: List[Dict], metrics,
+                   fetch_size: Callable[[], int],
+                   where: str = '') -> Iterator[Tuple[List[str], List[Tuple[Any, ...]]]]:
+        """
+        Tabloyu export edip satırları parçalar halinde döndürür.
+        
+        Args:
+            table_name: Tablo ismi
+            columns: Tablo kolon bilgileri (kolon sırası ve tip dönüşümü için)
+            metrics: Tablo performans metrikleri (export ve parse süresi 'extract' sayılır)
+            fetch_size: Güncel parça boyutunu döndüren fonksiyon
+            where: Satır filtresi (SQL predicate, opsiyonel)
+        
+        Yields:
+            tuple: (kolon isimleri, satır tuple'ları)
+        """
+        column_names = [col['name'] for col in columns]
+        casters = [_caster(col.get('type', ''), self.db_type) for col in columns]
+        file_name = f"{table_name}_{uuid.uuid4().hex}.dat"
+        local_path = os.path.join(self.local_dir, file_name)
+        
+        with metrics.stage('extract'):
+            if self.db_type == 'mysql':
+                self._export_mysql(table_name, column_names, file_name, where)
+                records = _mysql_records
+            else:
+                self._export_mssql(table_name, column_names, local_path, where)
+                records = _bcp_records
+            logger.info(f"{table_name}: bulk export tamamlandı "
+                        f"({os.path.getsize(local_path) / (1024 * 1024):.1f} MB)")
+        
+        try:
+            with open(local_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    iterator = records(mm)
+                    while True:
+                        rows = []
+                        limit = fetch_size()
+                        with metrics.stage('extract'):
+                            for fields in iterator:
+                                rows.append(tuple(
+                                    None if value is None else cast(value)
+                                    for cast, value in zip(casters, fields)
+                                ))
+                                if len(rows) >= limit:
+                                    break
+                        if not rows:
+                            break
+                        yield column_names, rows
+        finally:
+            try:
+                os.remove(local_path)
+            except OSError as e:
+                logger.warning(f"Export dosyası silinemedi ({local_path}): {str(e)}")
+    
+    def _export_mysql(self, table_name: str, column_names: List[str], file_name: str,
+                      where: str = ''):
+        """
+        Tabloyu SELECT ... INTO OUTFILE ile sunucu tarafında dosyaya yazar.
+        
+        Args:
+            table_name: Tablo ismi
+            column_names: Export edilecek kolonlar
+            file_name: Export dizinindeki dosya ismi
+            where: Satır filtresi
+        """
+        quote = self.sql_connector.quote_identifier
+        server_path = f"{self.server_dir.rstrip('/')}/{file_name}"
+        query = (
+            f"SELECT {', '.join(quote(name) for name in column_names)} "
+            f"INTO OUTFILE '{server_path}' CHARACTER SET utf8mb4 "
+            f"FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' LINES TERMINATED BY '\\n' "
+            f"FROM {quote(table_name)}"
+        )
+        if where:
+            # ':' karakterleri text() bind parametresi sanılmasın
+            escaped = where.replace(':', '\\:')
+            query += f" WHERE ({escaped})"
+        with self.sql_connector.get_engine().connect() as conn:
+            conn.execute(text(query))
+    
+    def _export_mssql(self, table_name: str, column_names: List[str], local_path: str,
+                      where: str = ''):
+        """
+        Tabloyu bcp queryout ile bu makinedeki dosyaya yazar.
+        Parola komut satırına (-P) yazılmaz; process listesinde görünmemesi için
+        SQLCMDPASSWORD ortam değişkeni ve parola istemine stdin ile verilir.
+        
+        Args:
+            table_name: Tablo ismi
+            column_names: Export edilecek kolonlar
+            local_path: Çıktı dosyası
+            where: Satır filtresi
+        """
+        quote = self.sql_connector.quote_identifier
+        config = self.sql_connector.config
+        os.makedirs(os.path.dirname(local_path) or '.', exist_ok=True)
+        query = f"SELECT {', '.join(quote(name) for name in column_names)} FROM {quote(table_name)}"
+        if where:
+            query += f" WHERE ({where})"
+        command = [
+            self.bcp_path, query, 'queryout', local_path,
+            '-c', '-C', '65001',
+            '-t', BCP_FIELD_TERMINATOR, '-r', BCP_ROW_TERMINATOR,
+            '-S', f"{config.get('host', 'localhost')},{config.get('port', 1433)}",
+            '-d', str(config.get('database')),
+        ]
+        env = None
+        password_input = None
+        if self.bcp_trusted_connection:
+            command.append('-T')
+        else:
+            command += ['-U', str(config.get('username'))]
+            password = str(config.get('password') or '')
+            env = dict(os.environ, SQLCMDPASSWORD=password)
+            password_input = password + '\n'
+        command += self.bcp_extra_args
+        logger.debug(f"bcp komutu: {' '.join(_redact_command(command))}")
+        result = subprocess.run(command, capture_output=True, text=True, env=env,
+                                input=password_input)
+        if result.returncode != 0:
+            output = (result.stdout + result.stderr).strip()
+            if password_input and password_input.strip():
+                output = output.replace(password_input.strip(), '***')
+            raise Exception(f"bcp hatası: {output}")
+
+
+def _redact_command(command: List[str]) -> List[str]:
+    """
+    Loglanacak komuttaki parola argümanlarını (-P <parola>) gizler.
+    
+    Args:
+        command: Komut argümanları
+    
+    Returns:
+        list: Parolası gizlenmiş argümanlar
+    """
+    redacted = list(command)
+    for i, arg in enumerate(redacted):
+        if arg == '-P' and i + 1 < len(redacted):
+            redacted[i + 1] = '***'
+        elif arg.startswith('-P') and len(arg) > 2:
+            redacted[i] = '-P***'
+    return redacted
+
+
+def _mysql_records(mm: mmap.mmap) -> Iterator[List[Optional[bytes]]]:
+    """
+    INTO OUTFILE dosyasını satır satır parse eder.
+    
+    Args:
+        mm: Memory-map edilmiş export dosyası
+    
+    Yields:
+        list: Unescape edilmiş alan değerleri (NULL için None)
+    """
+    pending = b''
+    for line in iter(mm.readline, b''):
+        line = pending + line[:-1] if line.endswith(b'\n') else pending + line
+        # Escape edilmiş satır sonu: kayıt bir sonraki satırda devam eder
+        if _ends_with_escape(line):
+            pending = line + b'\n'
+            continue
+        pending = b''
+        
+        fields = line.split(b'\t')
+        if any(_ends_with_escape(field) for field in fields):
+            fields = _join_escaped(fields, b'\t')
+        yield [_unescape_mysql(field) for field in fields]
+
+
+def _bcp_records(mm: mmap.mmap) -> Iterator[List[Optional[bytes]]]:
+    """
+    bcp karakter modu dosyasını kayıt kayıt parse eder.
+    
+    Args:
+        mm: Memory-map edilmiş export dosyası
+    
+    Yields:
+        list: Alan değerleri (NULL için None)
+    """
+    start = 0
+    size = len(mm)
+    while start < size:
+        end = mm.find(BCP_ROW_SEPARATOR, start)
+        if end < 0:
+            end = size
+        fields = mm[start:end].split(BCP_FIELD_SEPARATOR)
+        start = end + len(BCP_ROW_SEPARATOR)
+        yield [None if field == b'' else (b'' if field == b'\0' else field) for field in fields]
+
+
+def _ends_with_escape(value: bytes) -> bool:
+    """
+    Değerin tek sayıda '\\' ile bitip bitmediğini (sonraki ayracın escape
+    edildiğini) kontrol eder.
+    """
+    if not value.endswith(b'\\'):
+        return False
+    return (len(value) - len(value.rstrip(b'\\'))) % 2 == 1
+
+
+def _join_escaped(fields: List[bytes], separator: bytes) -> List[bytes]:
+    """
+    Escape edilmiş ayraçtan yanlışlıkla bölünen alanları birleştirir.
+    """
+    joined = []
+    pending = None
+    for field in fields:
+        field = field if pending is None else pending + separator + field
+        if _ends_with_escape(field):
+            pending = field
+        else:
+            joined.append(field)
+            pending = None
+    if pending is not None:
+        joined.append(pending)
+    return joined
+
+
+def _unescape_mysql(field: bytes) -> Optional[bytes]:
+    """
+    INTO OUTFILE escape'lerini çözer.
+    """
+    if field == MYSQL_NULL:
+        return None
+    if b'\\' not in field:
+        return field
+    return MYSQL_ESCAPE_PATTERN.sub(lambda m: MYSQL_ESCAPES.get(m.group(1), m.group(1)), field)
+
+
+def _caster(type_name: str, db_type: str) -> Callable[[bytes], Any]:
+    """
+    Kolon tipine göre metin değerini driver'ın döndüreceği Python tipine
+    çeviren fonksiyonu seçer (dönüşüm kuralları iki yolda aynı sonucu versin diye).
+    
+    Args:
+        type_name: Kolon tipi (örn. 'DECIMAL(10, 2)')
+        db_type: 'mysql' veya 'mssql'
+    
+    Returns:
+        callable: bytes → değer
+    """
+    base = type_name.split('(')[0].strip().upper()
+    if base in INTEGER_TYPES:
+        return int
+    if base == 'BIT':
+        # MySQL BIT değerini ham byte olarak yazar (pymysql de bytes döndürür), bcp 0/1 olarak
+        return int if db_type == 'mssql' else bytes
+    if base in DECIMAL_TYPES:
+        return lambda value: Decimal(value.decode('ascii'))
+    if base in FLOAT_TYPES:
+        return float
+    if base in DATETIME_TYPES:
+        return _parse_datetime
+    if base == 'DATE':
+        return lambda value: date.fromisoformat(value.decode('ascii'))
+    if base in BINARY_TYPES:
+        # bcp karakter modu binary kolonları hex olarak yazar
+        if db_type == 'mssql':
+            return lambda value: bytes.fromhex(value.decode('ascii'))
+        return bytes
+    return lambda value: value.decode('utf-8')
+
+
+def _parse_datetime(value: bytes) -> Any:
+    """
+    Tarih-saat metnini datetime'a çevirir; MSSQL'in 7 haneli kesirlerini kırpar.
+    Parse edilemeyen değerler metin olarak bırakılır.
+    """
+    text_value = value.decode('ascii')
+    try:
+        return datetime.fromisoformat(text_value)
+    except ValueError:
+        pass
+    match = re.match(r'^(\S+ \S+?\.\d{6})\d*( ?[+-]\d{2}:\d{2})?$', text_value)
+    if match:
+        try:
+            return datetime.fromisoformat(match.group(1) + (match.group(2) or '').strip())
+        except ValueError:
+            pass
+    return text_value
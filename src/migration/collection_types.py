@@ -0,0 +1,250 @@
+"""
+Collection Types Module
+Tablo bazında hedef collection tipini belirler: append-only, zamana göre
+anahtarlanmış tablolar için MongoDB time-series collection'ları, PK ile
+erişilen büyük tablolar için clustered collection'lar. Collection'lar
+yükleme başlamadan önce uygun seçeneklerle oluşturulur.
+"""
+
+import logging
+import threading
+from datetime import date, datetime
+from typing import Dict, List, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+COLLECTION_TYPES = ('timeseries', 'clustered')
+TIME_TYPE_MARKERS = ('DATETIME', 'TIMESTAMP', 'DATE')
+GRANULARITIES = ('seconds', 'minutes', 'hours')
+
+
+class CollectionTypes:
+    """
+    Collection tipi sınıfı.
+    migration.table_options altındaki collection_type, time_field,
+    meta_field, granularity ve expire_after_seconds ayarlarını okur.
+    time_field verilmezse ilk tarih/zaman kolonu (NOT NULL olanlar önce),
+    meta_field verilmezse tablonun ilk tek kolonlu foreign key'i kullanılır.
+    Time-series collection'lar unique index ve upsert desteklemediğinden bu
+    tablolar insert ile yazılır ve her tam aktarımda yeniden oluşturulur.
+    """
+    
+    def __init__(self, mongodb_connector, config: Dict[str, Any]):
+        """
+        Collection tipi ayarlarını başlatır.
+        
+        Args:
+            mongodb_connector: MongoDBConnector instance (dosyaya aktarımda None)
+            config: Migration konfigürasyonu
+        """
+        self.mongodb_connector = mongodb_connector
+        self.table_options: Dict[str, Dict[str, Any]] = config.get('table_options') or {}
+        self.preserve_ids = config.get('preserve_ids', True)
+        # Ortak (tenant) collection'lar kaynak başına silinemez; yalnızca yoksa oluşturulur
+        # ve yüklemeden önce kaynağın önceki belgeleri temizlenir
+        self.recreate_timeseries = not config.get('tenant')
+        self.tenant = config.get('tenant')
+        self.tenant_field = config.get('tenant_field', '_tenant')
+        self.specs: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+    
+    def kind(self, table_name: str) -> Optional[str]:
+        """
+        Tablonun collection tipini döndürür ('timeseries', 'clustered' veya None).
+        
+        Args:
+            table_name: Tablo ismi
+        
+        Returns:
+            str: Collection tipi (normal collection için None)
+        """
+        if table_name in self.specs:
+            spec = self.specs[table_name]
+            return spec['type'] if spec else None
+        kind = self.table_options.get(table_name, {}).get('collection_type')
+        return kind if kind in COLLECTION_TYPES else None
+    
+    def time_field(self, table_name: str) -> Optional[str]:
+        """
+        Time-series tablosunun zaman alanını döndürür.
+        
+        Args:
+            table_name: Tablo ismi
+        
+        Returns:
+            str: Zaman alanı (time-series değilse None)
+        """
+        spec = self.specs.get(table_name)
+        return spec['time_field'] if spec and spec['type'] == 'timeseries' else None
+    
+    def resolve(self, table_name: str, columns: List[Dict], primary_keys: List[str],
+                foreign_keys: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Tablonun collection tipi ayarlarını keşfedilen kolonlara göre çözümler.
+        Ayar geçersizse uyarı verilir ve normal collection kullanılır.
+        
+        Args:
+            table_name: Tablo ismi
+            columns: Seçilen kolon bilgileri
+            primary_keys: Primary key kolonları
+            foreign_keys: Tablonun foreign key bilgileri
+        
+        Returns:
+            dict: Collection tipi ayarları (normal collection için None)
+        """
+        with self._lock:
+            if table_name in self.specs:
+                return self.specs[table_name]
+            spec = self._build_spec(table_name, columns, primary_keys, foreign_keys)
+            self.specs[table_name] = spec
+            return spec
+    
+    def create(self, table_name: str, spec: Dict[str, Any]):
+        """
+        Collection'ı tipine uygun seçeneklerle oluşturur. Time-series
+        collection'lar idempotent yazılamadığı için mevcutsa silinip yeniden
+        oluşturulur; ortak (tenant) collection'da yalnızca bu kaynağın
+        belgeleri silinir. Mevcut clustered collection'lar korunur.
+        
+        Args:
+            table_name: Tablo ismi
+            spec: resolve ile çözümlenmiş ayarlar
+        """
+        exists = self.mongodb_connector.collection_exists(table_name)
+        if spec['type'] == 'timeseries':
+            if exists and not self.recreate_timeseries:
+                self._clear_tenant(table_name)
+                return
+            if exists:
+                self.mongodb_connector.drop_collection(table_name)
+            timeseries = {'timeField': spec['time_field'], 'granularity': spec['granularity']}
+            if spec['meta_field']:
+                timeseries['metaField'] = spec['meta_field']
+            options: Dict[str, Any] = {'timeseries': timeseries}
+            if spec['expire_after_seconds']:
+                options['expireAfterSeconds'] = spec['expire_after_seconds']
+        else:
+            if exists:
+                return
+            options = {'clusteredIndex': {'key': {'_id': 1}, 'unique': True}}
+        
+        if self.mongodb_connector.create_collection(table_name, options):
+            logger.info(f"{table_name}: {spec['type']} collection oluşturuldu")
+    
+    def _clear_tenant(self, table_name: str):
+        """
+        Ortak time-series collection'ında bu kaynağın önceki aktarımda
+        yazdığı belgeleri siler (insert ile tekrar yüklemede kopya oluşmasın).
+        
+        Args:
+            table_name: Tablo ismi
+        """
+        collection = self.mongodb_connector.get_collection(table_name)
+        if collection is None:
+            return
+        deleted = collection.delete_many({self.tenant_field: self.tenant}).deleted_count
+        if deleted:
+            logger.info(f"{table_name}: {self.tenant} kaynağının önceki {deleted} belgesi silindi")
+    
+    def apply(self, table_name: str, column_names: List[str], rows: List[Any],
+              documents: List[Dict[str, Any]]):
+        """
+        Time-series belgelerinin zaman alanını string yerine BSON date olarak yazar.
+        
+        Args:
+            table_name: Tablo ismi
+            column_names: Veri kolonları
+            rows: Kaynak satırlar
+            documents: Satırlardan üretilen belgeler (aynı sırada)
+        """
+        time_field = self.time_field(table_name)
+        if time_field is None:
+            return
+        position = column_names.index(time_field)
+        for row, doc in zip(rows, documents):
+            doc[time_field] = to_datetime(row[position])
+    
+    def _build_spec(self, table_name: str, columns: List[Dict], primary_keys: List[str],
+                    foreign_keys: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Tablo ayarlarını doğrular ve eksik alanları kolonlardan seçer.
+        """
+        options = self.table_options.get(table_name, {})
+        kind = options.get('collection_type')
+        if not kind:
+            return None
+        if kind not in COLLECTION_TYPES:
+            logger.warning(f"{table_name}: desteklenmeyen collection_type '{kind}', "
+                           f"normal collection kullanılacak")
+            return None
+        
+        if kind == 'clustered':
+            if not primary_keys or not self.preserve_ids:
+                logger.warning(f"{table_name}: clustered collection için primary key ve "
+                               f"preserve_ids gerekli, normal collection kullanılacak")
+                return None
+            return {'type': 'clustered'}
+        
+        names = [col['name'] for col in columns]
+        time_field = options.get('time_field') or _time_column(columns)
+        if time_field not in names:
+            logger.warning(f"{table_name}: time-series için zaman kolonu bulunamadı, "
+                           f"normal collection kullanılacak")
+            return None
+        
+        meta_field = options.get('meta_field')
+        if meta_field is None:
+            meta_field = next((fk['constrained_columns'][0] for fk in foreign_keys
+                               if len(fk.get('constrained_columns', [])) == 1), '')
+        if meta_field and (meta_field not in names or meta_field == time_field):
+            logger.warning(f"{table_name}: meta_field '{meta_field}' kullanılamıyor, atlandı")
+            meta_field = ''
+        
+        granularity = options.get('granularity', 'seconds')
+        if granularity not in GRANULARITIES:
+            logger.warning(f"{table_name}: geçersiz granularity '{granularity}', seconds kullanılacak")
+            granularity = 'seconds'
+        
+        logger.info(f"{table_name}: time-series (timeField: {time_field}, "
+                    f"metaField: {meta_field or '-'}, granularity: {granularity})")
+        return {
+            'type': 'timeseries',
+            'time_field': time_field,
+            'meta_field': meta_field,
+            'granularity': granularity,
+            'expire_after_seconds': int(options.get('expire_after_seconds') or 0)
+        }
+
+
+def _time_column(columns: List[Dict]) -> Optional[str]:
+    """
+    Zaman alanı olarak kullanılabilecek ilk tarih/zaman kolonunu döndürür;
+    NOT NULL kolonlar tercih edilir (zaman alanı boş olan belge yazılamaz).
+    
+    Args:
+        columns: Kolon bilgileri
+    
+    Returns:
+        str: Kolon ismi veya None
+    """
+    candidates = [col for col in columns
+                  if any(marker in str(col.get('type', '')).upper() for marker in TIME_TYPE_MARKERS)]
+    candidates.sort(key=lambda col: bool(col.get('nullable', True)))
+    return candidates[0]['name'] if candidates else None
+
+
+def to_datetime(value: Any) -> Optional[datetime]:
+    """
+    Kaynak tarih/zaman değerini BSON date'e yazılabilecek datetime'a çevirir.
+    
+    Args:
+        value: datetime, date veya ISO 8601 string (MSSQL hızlı yolu)
+    
+    Returns:
+        datetime: Değer (NULL ise None)
+    """
+    if value is None or isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    return datetime.fromisoformat(str(value))
@@ -0,0 +1,416 @@
+"""
+Multi-Source Consolidation Module
+Aynı şemaya sahip birden fazla SQL veritabanını (ör. tenant veritabanları)
+tek bir MongoDB hedefine eşzamanlı aktarır. Kaynaklar ortak bir tablo worker
+bütçesini paylaşır; şema keşfi aynı şema parmak izine sahip kaynaklar için
+bir kez yapılır ve sonuçlar tek bir raporda birleştirilir.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
+
+from sqlalchemy import text
+
+from src.database.sql_connector import SQLConnector
+from src.database.schema_discovery import SchemaDiscovery
+from src.database.mongodb_connector import MongoDBConnector
+from src.migration.migrator import DataMigrator
+
+logger = logging.getLogger(__name__)
+
+TENANT_ROUTINGS = ('field', 'database')
+
+# Şema parmak izi sorguları: kolonlar, anahtar kolonları ve index kolonları
+SCHEMA_FINGERPRINT_QUERIES = {
+    'mysql': (
+        """
+        SELECT TABLE_NAME, COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE, COLUMN_KEY
+        FROM INFORMATION_SCHEMA.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE()
+        ORDER BY TABLE_NAME, ORDINAL_POSITION
+        """,
+        """
+        SELECT TABLE_NAME, CONSTRAINT_NAME, COLUMN_NAME, ORDINAL_POSITION, REFERENCED_TABLE_NAME
+        FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE
+        WHERE TABLE_SCHEMA = DATABASE()
+        ORDER BY TABLE_NAME, CONSTRAINT_NAME, ORDINAL_POSITION
+        """,
+        """
+        SELECT TABLE_NAME, INDEX_NAME, COLUMN_NAME, SEQ_IN_INDEX, NON_UNIQUE
+        FROM INFORMATION_SCHEMA.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE()
+        ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX
+        """
+    ),
+    'mssql': (
+        """
+        SELECT TABLE_NAME, COLUMN_NAME, DATA_TYPE, CHARACTER_MAXIMUM_LENGTH,
+               NUMERIC_PRECISION, NUMERIC_SCALE, IS_NULLABLE
+        FROM INFORMATION_SCHEMA.COLUMNS
+        ORDER BY TABLE_NAME, ORDINAL_POSITION
+        """,
+        """
+        SELECT TABLE_NAME, CONSTRAINT_NAME, COLUMN_NAME, ORDINAL_POSITION
+        FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE
+        ORDER BY TABLE_NAME, CONSTRAINT_NAME, ORDINAL_POSITION
+        """,
+        """
+        SELECT t.name, i.name, c.name, ic.key_ordinal, i.is_unique
+        FROM sys.indexes i
+        INNER JOIN sys.tables t ON i.object_id = t.object_id
+        INNER JOIN sys.index_columns ic ON i.object_id = ic.object_id AND i.index_id = ic.index_id
+        INNER JOIN sys.columns c ON ic.object_id = c.object_id AND ic.column_id = c.column_id
+        ORDER BY t.name, i.name, ic.key_ordinal
+        """
+    )
+}
+
+
+class MultiSourceMigration:
+    """
+    Çoklu kaynak birleştirme sınıfı.
+    tenant_routing: field iken tüm kaynaklar aynı MongoDB veritabanına yazılır;
+    belgeler tenant alanıyla etiketlenir ve _id'lerin başına kaynak ismi eklenir
+    (tenant, primary key'in ilk kolonu gibi davranır). tenant_routing: database
+    iken her kaynak kendi MongoDB veritabanına yazılır ve tüm özellikler tek
+    kaynaklı aktarımdaki gibi çalışır.
+    """
+    
+    def __init__(self, base_sql_config: Dict[str, Any], sources: List[Dict[str, Any]],
+                 mongodb_config: Dict[str, Any], config: Dict[str, Any]):
+        """
+        Çoklu kaynak aktarımını başlatır.
+        
+        Args:
+            base_sql_config: Ortak SQL ayarları (sql_database bloğu)
+            sources: Kaynak listesi (sql_sources); her kaynak ortak ayarları ezer
+            mongodb_config: MongoDB konfigürasyonu
+            config: Migration konfigürasyonu
+        """
+        self.mongodb_config = mongodb_config
+        self.config = config
+        self.routing = config.get('tenant_routing', 'field')
+        self.tenant_field = config.get('tenant_field', '_tenant')
+        self.database_template = config.get('tenant_database', '{database}_{tenant}')
+        self.source_workers = max(1, config.get('source_workers', 4))
+        if self.routing not in TENANT_ROUTINGS:
+            raise ValueError(f"Desteklenmeyen tenant_routing: {self.routing}")
+        
+        self.sources = []
+        for source in sources:
+            sql_config = dict(base_sql_config)
+            sql_config.update(source)
+            sql_config['name'] = str(source.get('name') or sql_config.get('database'))
+            self.sources.append(sql_config)
+        names = [source['name'] for source in self.sources]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"Kaynak isimleri benzersiz olmalı: {', '.join(duplicates)}")
+        
+        # table_workers tüm kaynaklar için ortak bütçedir
+        self.worker_budget = threading.BoundedSemaphore(max(1, config.get('table_workers', 1)))
+        self.mongodb_connector: Optional[MongoDBConnector] = None
+        self.schema_info: Dict[str, Any] = {}
+        self._schemas: Dict[str, Dict[str, Any]] = {}
+        self._schema_locks: Dict[str, threading.Lock] = {}
+        self._dropped: set = set()
+        self._migrators: Dict[str, DataMigrator] = {}
+        self._lock = threading.Lock()
+        self._cancel = threading.Event()
+        self.results: Dict[str, Dict[str, Any]] = {}
+    
+    def run(self) -> Dict[str, Any]:
+        """
+        Tüm kaynakları source_workers kadar eşzamanlı aktarır.
+        İlk Ctrl-C çalışan kaynakları kooperatif olarak iptal eder.
+        
+        Returns:
+            dict: Birleştirilmiş migration istatistikleri
+        """
+        started_at = datetime.now()
+        logger.info(f"{len(self.sources)} kaynak aktarılacak "
+                    f"(tenant_routing: {self.routing}, {self.source_workers} eşzamanlı kaynak)")
+        if self.routing == 'field':
+            for key in ('reconcile_deletes', 'verify', 'sample_validation'):
+                if self.config.get(key):
+                    logger.warning(f"{key} tenant_routing: field ile desteklenmez, atlanacak")
+            self.mongodb_connector = MongoDBConnector(self.mongodb_config)
+            if not self.mongodb_connector.connect():
+                raise Exception("MongoDB'ye bağlanılamadı")
+        
+        try:
+            with ThreadPoolExecutor(max_workers=self.source_workers,
+                                    thread_name_prefix='source') as executor:
+                futures = [executor.submit(self._run_source, source) for source in self.sources]
+                try:
+                    for future in futures:
+                        future.result()
+                except KeyboardInterrupt:
+                    logger.warning("İptal istendi; çalışan kaynaklar o anki parçayı yazıp duracak")
+                    self.cancel()
+                    for future in futures:
+                        future.result()
+        finally:
+            if self.mongodb_connector is not None:
+                self.mongodb_connector.close()
+        
+        return self._consolidate(started_at)
+    
+    def cancel(self):
+        """
+        Başlamamış kaynakları atlar ve çalışan kaynakların aktarımını iptal eder.
+        """
+        self._cancel.set()
+        with self._lock:
+            for migrator in self._migrators.values():
+                migrator.cancel()
+    
+    def _run_source(self, source: Dict[str, Any]):
+        """
+        Tek bir kaynağı keşfeder ve aktarır; sonucu results'a yazar.
+        
+        Args:
+            source: Kaynağın SQL konfigürasyonu
+        """
+        name = source['name']
+        result = {'status': 'not_started', 'database': self._target_database(name)}
+        self.results[name] = result
+        if self._cancel.is_set():
+            return
+        
+        started = time.perf_counter()
+        sql_connector = SQLConnector(source)
+        mongodb_connector = self.mongodb_connector
+        try:
+            if not sql_connector.connect():
+                raise Exception("SQL veritabanına bağlanılamadı")
+            if mongodb_connector is None:
+                mongodb_config = dict(self.mongodb_config)
+                mongodb_config['database'] = result['database']
+                mongodb_connector = MongoDBConnector(mongodb_config)
+                if not mongodb_connector.connect():
+                    raise Exception("MongoDB'ye bağlanılamadı")
+            
+            schema_info, result['schema_reused'] = self._discover(name, sql_connector)
+            result['schema'] = schema_info.pop('fingerprint', None)
+            if self.routing == 'field' and self.config.get('drop_existing', False):
+                self._drop_shared(mongodb_connector, schema_info.get('tables', []))
+            
+            migrator = DataMigrator(sql_connector, mongodb_connector, self._source_config(name),
+                                    worker_budget=self.worker_budget)
+            with self._lock:
+                self._migrators[name] = migrator
+                if self._cancel.is_set():
+                    migrator.cancel()
+            
+            result['status'] = 'running'
+            stats = migrator.migrate_all(schema_info)
+            result['stats'] = stats
+            if stats.get('cancelled'):
+                result['status'] = 'cancelled'
+            else:
+                result['status'] = 'failed' if stats['errors'] else 'ok'
+            if not self.schema_info:
+                self.schema_info = schema_info
+        except Exception as e:
+            logger.error(f"[{name}] kaynak aktarım hatası: {str(e)}")
+            result['status'] = 'failed'
+            result['error'] = str(e)
+        finally:
+            result['duration'] = time.perf_counter() - started
+            if mongodb_connector is not None and mongodb_connector is not self.mongodb_connector:
+                mongodb_connector.close()
+            sql_connector.close()
+        logger.info(f"[{name}] kaynak tamamlandı: {result['status']} ({result['duration']:.2f} sn)")
+    
+    def _discover(self, name: str, sql_connector: SQLConnector) -> Tuple[Dict[str, Any], bool]:
+        """
+        Kaynağın şemasını keşfeder. Aynı şema parmak izine sahip bir kaynak daha önce
+        keşfedildiyse yalnızca satır tahminleri okunur, diğer bilgiler tekrar kullanılır.
+        
+        Args:
+            name: Kaynak ismi
+            sql_connector: Kaynağın SQLConnector instance'ı
+        
+        Returns:
+            tuple: (şema bilgileri, şema tekrar kullanıldıysa True)
+        """
+        discovery = SchemaDiscovery(sql_connector)
+        fingerprint = self._schema_fingerprint(name, sql_connector)
+        if fingerprint is None:
+            return discovery.discover_all(), False
+        
+        with self._lock:
+            schema_lock = self._schema_locks.setdefault(fingerprint, threading.Lock())
+        # Aynı şemalı kaynaklar ilk keşfin bitmesini bekler
+        with schema_lock:
+            cached = self._schemas.get(fingerprint)
+            if cached is None:
+                logger.info(f"[{name}] şema keşfediliyor (parmak izi {fingerprint[:12]})")
+                self._schemas[fingerprint] = discovery.discover_all()
+                return dict(self._schemas[fingerprint], fingerprint=fingerprint), False
+        
+        logger.info(f"[{name}] şema parmak izi eşleşti, keşif tekrar kullanılıyor")
+        schema_info = dict(cached, fingerprint=fingerprint)
+        schema_info['row_estimates'] = discovery.discover_row_estimates()
+        return schema_info, True
+    
+    def _schema_fingerprint(self, name: str, sql_connector: SQLConnector) -> Optional[str]:
+        """
+        Kolon, anahtar ve index tanımlarından şema parmak izi üretir.
+        
+        Args:
+            name: Kaynak ismi
+            sql_connector: Kaynağın SQLConnector instance'ı
+        
+        Returns:
+            str: SHA-1 özeti (hesaplanamazsa None)
+        """
+        queries = SCHEMA_FINGERPRINT_QUERIES.get(sql_connector.db_type)
+        if not queries:
+            return None
+        digest = hashlib.sha1(sql_connector.db_type.encode('utf-8'))
+        try:
+            with sql_connector.get_engine().connect() as conn:
+                for query in queries:
+                    for row in conn.execute(text(query)):
+                        digest.update(repr(tuple(row)).encode('utf-8'))
+        except Exception as e:
+            logger.warning(f"[{name}] şema parmak izi hesaplanamadı, tam keşif yapılacak: {str(e)}")
+            return None
+        return digest.hexdigest()
+    
+    def _drop_shared(self, mongodb_connector: MongoDBConnector, tables: List[str]):
+        """
+        Ortak collection'ları ilk kullanan kaynak yazmaya başlamadan önce bir kez siler.
+        
+        Args:
+            mongodb_connector: Ortak MongoDBConnector instance
+            tables: Kaynağın tabloları
+        """
+        with self._lock:
+            for table_name in tables:
+                if table_name in self._dropped:
+                    continue
+                self._dropped.add(table_name)
+                if mongodb_connector.collection_exists(table_name):
+                    mongodb_connector.drop_collection(table_name)
+                    logger.info(f"Mevcut collection '{table_name}' silindi")
+    
+    def _source_config(self, name: str) -> Dict[str, Any]:
+        """
+        Kaynağa özgü migration konfigürasyonunu oluşturur.
+        
+        Args:
+            name: Kaynak ismi
+        
+        Returns:
+            dict: Migration konfigürasyonu
+        """
+        config = dict(self.config)
+        # Metrik portu paylaşılamaz; durum dosyası kaynak başına ayrı yazılır
+        config['progress_http_port'] = 0
+        status_file = config.get('progress_status_file', '')
+        if status_file:
+            base, dot, extension = status_file.rpartition('.')
+            config['progress_status_file'] = (f"{base}.{name}.{extension}" if dot
+                                              else f"{status_file}.{name}")
+        if self.routing == 'field':
+            config['tenant'] = name
+            config['tenant_field'] = self.tenant_field
+            # Ortak collection'lar kaynak başına silinemez ve tek kaynakla karşılaştırılamaz
+            config['drop_existing'] = False
+            config['reconcile_deletes'] = False
+            config['verify'] = False
+            config['sample_validation'] = False
+        return config
+    
+    def _target_database(self, name: str) -> str:
+        """
+        Kaynağın yazılacağı MongoDB veritabanı ismini döndürür.
+        """
+        database = self.mongodb_config.get('database', 'migrated_database')
+        if self.routing == 'field':
+            return database
+        return self.database_template.format(database=database, tenant=name)
+    
+    def _consolidate(self, started_at: datetime) -> Dict[str, Any]:
+        """
+        Kaynak istatistiklerini tek bir migration istatistiğinde birleştirir.
+        Tablo metrikleri ve görevler "kaynak.tablo" anahtarlarıyla tutulur.
+        
+        Args:
+            started_at: Başlangıç zamanı
+        
+        Returns:
+            dict: Birleştirilmiş migration istatistikleri
+        """
+        stats = {
+            'tables_migrated': 0,
+            'tables_skipped': 0,
+            'total_documents': 0,
+            'failed_documents': 0,
+            'unchanged_documents': 0,
+            'table_metrics': {},
+            'tasks': {},
+            'errors': [],
+            'start_time': started_at,
+            'end_time': None
+        }
+        sources = {}
+        for source in self.sources:
+            name = source['name']
+            result = self.results.get(name, {'status': 'not_started'})
+            source_stats = result.get('stats', {})
+            for key in ('tables_migrated', 'tables_skipped', 'total_documents',
+                        'failed_documents', 'unchanged_documents'):
+                stats[key] += source_stats.get(key, 0)
+            for table_name, metrics in source_stats.get('table_metrics', {}).items():
+                stats['table_metrics'][f"{name}.{table_name}"] = metrics
+            for table_name, task in source_stats.get('tasks', {}).items():
+                stats['tasks'][f"{name}.{table_name}"] = task
+            stats['errors'].extend(f"[{name}] {error}" for error in source_stats.get('errors', []))
+            advice = source_stats.get('index_advice')
+            if advice:
+                merged = stats.setdefault('index_advice', {'mode': advice['mode'], 'definitions': 0,
+                                                           'created': 0, 'proposals': []})
+                merged['definitions'] += advice['definitions']
+                merged['created'] += advice['created']
+                merged['proposals'].extend(dict(proposal, table=f"{name}.{proposal['table']}")
+                                           for proposal in advice['proposals'])
+            if 'error' in result:
+                stats['errors'].append(f"[{name}] {result['error']}")
+            sources[name] = {
+                'status': result['status'],
+                'host': source.get('host'),
+                'database': source.get('database'),
+                'target_database': result.get('database'),
+                'schema': (result.get('schema') or '')[:12],
+                'schema_reused': result.get('schema_reused', False),
+                'tables': source_stats.get('tables_migrated', 0),
+                'documents': source_stats.get('total_documents', 0),
+                'failed_documents': source_stats.get('failed_documents', 0),
+                'duration': result.get('duration', 0.0)
+            }
+        
+        stats['sources'] = sources
+        stats['consolidation'] = {
+            'routing': self.routing,
+            'tenant_field': self.tenant_field if self.routing == 'field' else None,
+            'sources': len(self.sources),
+            'schemas': len({s['schema'] or name for name, s in sources.items()}),
+            'source_workers': self.source_workers
+        }
+        stats['end_time'] = datetime.now()
+        if self._cancel.is_set():
+            stats['cancelled'] = True
+        
+        failed = sum(1 for s in sources.values() if s['status'] == 'failed')
+        logger.info(f"Çoklu kaynak aktarımı tamamlandı: {len(sources)} kaynak ({failed} hatalı), "
+                    f"{stats['total_documents']} belge, {stats['consolidation']['schemas']} farklı şema")
+        return stats
@@ -0,0 +1,561 @@
+"""
+Distributed Migration Module
+Tabloları ve büyük tabloların PK aralıklarını iş birimlerine böler ve bir
+MongoDB kontrol collection'ında saklar. Farklı makinelerde çalışan worker
+süreçleri birimleri süreli kiralama (lease) ile alır, heartbeat ile kiralamayı
+uzatır ve sonucu yazar; koordinatör tüm birimler bitince raporu oluşturur.
+"""
+
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Any, Optional, Tuple
+
+from pymongo import ReturnDocument
+from sqlalchemy import text
+
+from src.migration.metrics import TableMetrics
+
+logger = logging.getLogger(__name__)
+
+ROLES = ('coordinator', 'worker')
+
+
+class DistributedMigration:
+    """
+    Dağıtık aktarım sınıfı.
+    Kiralaması süresi dolan (worker'ı ölen) birimler başka bir worker
+    tarafından tekrar alınır. Upsert ile yazılan birimler tekrar
+    çalıştırılabilir; insert ile yazılan (PK'siz / preserve_ids kapalı /
+    time-series) tablolar tek birimdir ve tekrar denemeden önce önceki
+    çıktıları silinir. Aynı run_id ile yeniden başlatılan koordinatör
+    kaldığı yerden devam eder. FK sırası dağıtık modda gözetilmez.
+    """
+    
+    def __init__(self, migrator, config: Dict[str, Any], run_id: Optional[str] = None,
+                 worker_id: Optional[str] = None):
+        """
+        Dağıtık aktarımı başlatır.
+        
+        Args:
+            migrator: DataMigrator instance (bu süreçteki bağlantılar)
+            config: Migration konfigürasyonu
+            run_id: Çalıştırma kimliği (worker'da verilmezse son aktif çalıştırma)
+            worker_id: Worker kimliği (varsayılan: host:pid)
+        """
+        self.migrator = migrator
+        self.config = config
+        self.run_id = run_id
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.collection_name = config.get('distributed_collection', '_migration_work')
+        self.lease_seconds = config.get('lease_seconds', 60)
+        self.heartbeat_seconds = config.get('heartbeat_seconds', 15)
+        self.poll_seconds = config.get('poll_seconds', 5)
+        self.unit_rows = config.get('work_unit_rows', 1000000)
+        self.max_attempts = config.get('max_unit_attempts', 3)
+        
+        self.collection = migrator.mongodb_connector.get_collection(self.collection_name)
+        if self.collection is None:
+            raise Exception("Dağıtık mod için MongoDB bağlantısı gerekli")
+    
+    def coordinate(self, schema_info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Koordinatör akışı: iş birimlerini oluşturur, kendisi de worker olarak
+        çalışır, tüm birimlerin bitmesini bekler ve istatistikleri birleştirir.
+        
+        Args:
+            schema_info: Keşfedilen şema bilgileri
+        
+        Returns:
+            dict: Birleştirilmiş migration istatistikleri
+        """
+        self.migrator.migration_stats['start_time'] = datetime.now()
+        self.run_id = self.run_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.plan(schema_info)
+        self.work(schema_info)
+        self.wait()
+        self.collect(schema_info)
+        self._set_run_status('finished')
+        return self.migrator._finish_run(schema_info)
+    
+    def plan(self, schema_info: Dict[str, Any]):
+        """
+        Tabloları iş birimlerine böler ve kontrol collection'ına yazar.
+        Tahmini satır sayısı work_unit_rows'u aşan, tam sayı tek kolonlu
+        PK'li tablolar PK aralıklarına bölünür. Planı yazılmış bir run_id
+        ile tekrar çağrılırsa plan değiştirilmez ve çalıştırma devam ettirilir.
+        
+        Args:
+            schema_info: Keşfedilen şema bilgileri
+        """
+        self.collection.create_index([('run_id', 1), ('status', 1), ('priority', -1)])
+        self.migrator.foreign_keys = schema_info.get('foreign_keys', {})
+        run = self.collection.find_one({'_id': f"run:{self.run_id}"})
+        if run is not None and run.get('planned'):
+            self._resume()
+            return
+        
+        # Yarıda kalmış bir planlamanın birimleri (henüz hiçbir worker almamıştır) silinir
+        self.collection.delete_many({'type': 'unit', 'run_id': self.run_id})
+        units = self._build_units(schema_info)
+        if units:
+            self.collection.insert_many(units)
+        
+        # Şema JSON olarak saklanır; tablo isimleri BSON anahtarı olarak kısıtlı olabilir.
+        # Çalıştırma kaydı birimlerden sonra yazılır ki worker'lar eksik plan görmesin
+        self.collection.replace_one({'_id': f"run:{self.run_id}"}, {
+            'type': 'run',
+            'run_id': self.run_id,
+            'status': 'running',
+            'planned': True,
+            'created_at': datetime.now(timezone.utc),
+            'schema': json.dumps(schema_info, default=str)
+        }, upsert=True)
+        logger.info(f"Dağıtık çalıştırma {self.run_id}: {len(units)} iş birimi oluşturuldu")
+    
+    def _resume(self):
+        """
+        Planı daha önce yazılmış çalıştırmayı devam ettirir. Collection'lar
+        silinmez; başarısız birimler tekrar denenmek üzere serbest bırakılır,
+        tamamlanan birimler tekrar çalıştırılmaz.
+        """
+        reset = self.collection.update_many(
+            {'type': 'unit', 'run_id': self.run_id, 'status': 'failed'},
+            {'$set': {'status': 'pending', 'owner': None, 'lease_expires': None,
+                      'attempts': 0, 'resumed': True}}
+        )
+        self.collection.update_one({'_id': f"run:{self.run_id}"}, {'$set': {'status': 'running'}})
+        logger.info(f"Dağıtık çalıştırma {self.run_id} devam ettiriliyor "
+                    f"({reset.modified_count} başarısız birim tekrar denenecek)")
+    
+    def _build_units(self, schema_info: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Collection'ları hazırlar ve tabloların iş birimlerini oluşturur.
+        
+        Args:
+            schema_info: Keşfedilen şema bilgileri
+        
+        Returns:
+            list: İş birimleri
+        """
+        columns_info = schema_info.get('columns', {})
+        primary_keys = schema_info.get('primary_keys', {})
+        row_estimates = schema_info.get('row_estimates', {})
+        
+        units = []
+        for table_name in schema_info.get('tables', []):
+            if self.migrator.drop_existing and self.migrator.mongodb_connector.collection_exists(table_name):
+                self.migrator.mongodb_connector.drop_collection(table_name)
+                logger.info(f"Mevcut collection '{table_name}' silindi")
+            
+            # Time-series / clustered collection'lar birimler başlamadan oluşturulur
+            self.migrator._prepare_collection(
+                table_name,
+                self.migrator.selection.columns(table_name, columns_info.get(table_name, []),
+                                                primary_keys.get(table_name, [])),
+                primary_keys.get(table_name, [])
+            )
+            
+            estimate = int(row_estimates.get(table_name, 0))
+            range_column = self._range_column(columns_info.get(table_name, []),
+                                              primary_keys.get(table_name, []))
+            if self._insert_only(table_name, primary_keys.get(table_name, [])):
+                # Insert ile yazılan tablolar tekrar denemede bütünüyle silinip yeniden yüklenir
+                range_column = None
+            ranges = [(None, None)]
+            if range_column and estimate > self.unit_rows:
+                ranges = self._split_ranges(table_name, range_column, -(-estimate // self.unit_rows))
+            
+            for index, (low, high) in enumerate(ranges):
+                units.append({
+                    '_id': f"{self.run_id}:{table_name}:{index:05d}",
+                    'type': 'unit',
+                    'run_id': self.run_id,
+                    'table': table_name,
+                    'range_column': range_column if len(ranges) > 1 else None,
+                    'low': low,
+                    'high': high,
+                    # Büyük birimler önce alınır ki sonda tek uzun birim kalmasın
+                    'priority': estimate // len(ranges),
+                    'status': 'pending',
+                    'owner': None,
+                    'lease_expires': None,
+                    'attempts': 0
+                })
+        return units
+    
+    def load_schema(self) -> Dict[str, Any]:
+        """
+        Worker için çalıştırmanın şemasını kontrol collection'ından okur.
+        run_id verilmemişse en son başlatılan aktif çalıştırma kullanılır.
+        
+        Returns:
+            dict: Koordinatörün keşfettiği şema bilgileri
+        """
+        query = {'type': 'run', 'status': 'running'}
+        if self.run_id:
+            query['run_id'] = self.run_id
+        deadline = time.monotonic() + self.lease_seconds
+        while True:
+            run = self.collection.find_one(query, sort=[('created_at', -1)])
+            if run is not None:
+                self.run_id = run['run_id']
+                return json.loads(run['schema'])
+            if time.monotonic() > deadline:
+                raise Exception("Aktif dağıtık çalıştırma bulunamadı")
+            time.sleep(self.poll_seconds)
+    
+    def work(self, schema_info: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Kiralanabilir birim kalmayana kadar birimleri alıp çalıştırır.
+        Başka worker'larda çalışan birimler varsa, kiralamaları düşebileceği
+        için onlar bitene kadar beklemeye devam eder.
+        
+        Args:
+            schema_info: Şema bilgileri (verilmezse kontrol collection'ından okunur)
+        
+        Returns:
+            int: Bu worker'ın tamamladığı birim sayısı
+        """
+        if schema_info is None:
+            schema_info = self.load_schema()
+        self.migrator.foreign_keys = schema_info.get('foreign_keys', {})
+        logger.info(f"Worker {self.worker_id} çalıştırma {self.run_id} için başladı")
+        
+        completed = 0
+        while True:
+            unit = self._lease()
+            if unit is None:
+                if not self._remaining(leased_only=True):
+                    break
+                time.sleep(self.poll_seconds)
+                continue
+            if self._run_unit(unit, schema_info):
+                completed += 1
+        
+        logger.info(f"Worker {self.worker_id}: {completed} birim tamamlandı")
+        return completed
+    
+    def wait(self):
+        """
+        Tüm birimlerin bitmesini (done / failed) bekler.
+        """
+        while True:
+            remaining = self._remaining()
+            if not remaining:
+                return
+            logger.info(f"Dağıtık çalıştırma {self.run_id}: {remaining} birim bekleniyor")
+            time.sleep(self.poll_seconds)
+    
+    def collect(self, schema_info: Dict[str, Any]):
+        """
+        Birim sonuçlarını koordinatörün migration istatistiklerinde birleştirir.
+        
+        Args:
+            schema_info: Keşfedilen şema bilgileri
+        """
+        stats = self.migrator.migration_stats
+        # Koordinatörün kendi çalıştırdığı birimler de birim sonuçlarından sayılır
+        stats['total_documents'] = 0
+        stats['failed_documents'] = 0
+        stats['errors'] = []
+        table_units: Dict[str, List[Dict[str, Any]]] = {}
+        for unit in self.collection.find({'type': 'unit', 'run_id': self.run_id}):
+            table_units.setdefault(unit['table'], []).append(unit)
+        
+        for table_name in schema_info.get('tables', []):
+            units = table_units.get(table_name, [])
+            failed = [u for u in units if u['status'] != 'done']
+            results = [u.get('result') or {} for u in units]
+            
+            stats['total_documents'] += sum(r.get('documents', 0) for r in results)
+            stats['failed_documents'] += sum(r.get('failed', 0) for r in results)
+            for result in results:
+                stats['errors'].extend(result.get('errors', []))
+            for unit in failed:
+                stats['errors'].append(f"{table_name} tablosu birim {unit['_id']} başarısız: "
+                                       f"{unit.get('error', '')}")
+            
+            stats['table_metrics'][table_name] = _merge_metrics(
+                [r['metrics'] for r in results if r.get('metrics')]
+            )
+            stats['tasks'][table_name] = {
+                'status': 'failed' if failed else 'ok',
+                'units': len(units),
+                'workers': sorted({u['owner'] for u in units if u.get('owner')}),
+                'rows': stats['table_metrics'][table_name]['rows']
+            }
+            if not failed:
+                stats['tables_migrated'] += 1
+        
+        stats['distributed'] = {
+            'run_id': self.run_id,
+            'units': sum(len(u) for u in table_units.values()),
+            'workers': sorted({u['owner'] for units in table_units.values()
+                               for u in units if u.get('owner')})
+        }
+    
+    def _lease(self) -> Optional[Dict[str, Any]]:
+        """
+        Bekleyen veya kiralaması dolmuş bir birimi atomik olarak kiralar.
+        
+        Returns:
+            dict: Kiralanan birim (yoksa None)
+        """
+        while True:
+            now = datetime.now(timezone.utc)
+            unit = self.collection.find_one_and_update(
+                {
+                    'type': 'unit',
+                    'run_id': self.run_id,
+                    '$or': [
+                        {'status': 'pending'},
+                        {'status': 'leased', 'lease_expires': {'$lt': now}}
+                    ]
+                },
+                {
+                    '$set': {
+                        'status': 'leased',
+                        'owner': self.worker_id,
+                        'lease_expires': now + timedelta(seconds=self.lease_seconds)
+                    },
+                    '$inc': {'attempts': 1}
+                },
+                sort=[('priority', -1), ('_id', 1)],
+                return_document=ReturnDocument.AFTER
+            )
+            if unit is None:
+                return None
+            if unit['attempts'] > self.max_attempts:
+                self._finish_unit(unit, 'failed', error=f"{self.max_attempts} denemede tamamlanamadı")
+                continue
+            if unit['attempts'] > 1:
+                logger.warning(f"{unit['_id']} tekrar kiralandı (deneme {unit['attempts']})")
+            return unit
+    
+    def _run_unit(self, unit: Dict[str, Any], schema_info: Dict[str, Any]) -> bool:
+        """
+        Kiralanan birimi heartbeat ile çalıştırır ve sonucunu yazar.
+        
+        Args:
+            unit: Kiralanan birim
+            schema_info: Şema bilgileri
+        
+        Returns:
+            bool: Birim başarıyla tamamlandıysa True
+        """
+        table_name = unit['table']
+        primary_keys = schema_info.get('primary_keys', {}).get(table_name, [])
+        key_range = None
+        if unit.get('range_column'):
+            key_range = (unit['range_column'], unit['low'], unit['high'])
+        
+        stats = self.migrator.migration_stats
+        documents_before = stats['total_documents']
+        failed_before = stats['failed_documents']
+        errors_before = len(stats['errors'])
+        metrics = TableMetrics(table_name)
+        
+        stop = threading.Event()
+        lost = threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat, args=(unit['_id'], stop, lost),
+                                     daemon=True)
+        heartbeat.start()
+        logger.info(f"{unit['_id']} çalıştırılıyor")
+        try:
+            # Insert ile yazılan birimin önceki denemesinin yazdığı belgeler silinir
+            if ((unit['attempts'] > 1 or unit.get('resumed'))
+                    and self._insert_only(table_name, primary_keys)):
+                self._clear_output(table_name)
+            self.migrator._migrate_table(
+                table_name,
+                schema_info.get('columns', {}).get(table_name, []),
+                primary_keys,
+                metrics,
+                key_range,
+                abort=lost
+            )
+            # Birim, GridFS'e aktarılan LOB'ları da bitmeden tamamlanmış sayılmaz
+            self.migrator.lob.wait()
+        except Exception as e:
+            logger.error(f"{unit['_id']} hatası: {str(e)}")
+            self._finish_unit(unit, 'pending' if unit['attempts'] < self.max_attempts else 'failed',
+                              error=str(e))
+            return False
+        finally:
+            stop.set()
+            heartbeat.join()
+        
+        self._finish_unit(unit, 'done', result={
+            'metrics': metrics.to_dict(),
+            'documents': stats['total_documents'] - documents_before,
+            'failed': stats['failed_documents'] - failed_before,
+            'errors': stats['errors'][errors_before:]
+        })
+        return True
+    
+    def _heartbeat(self, unit_id: str, stop: threading.Event, lost: threading.Event):
+        """
+        Birim çalıştığı sürece kiralamayı uzatır.
+        
+        Args:
+            unit_id: Birim id'si
+            stop: Birim bittiğinde set edilen event
+            lost: Kiralama kaybedildiğinde set edilen event
+        """
+        while not stop.wait(self.heartbeat_seconds):
+            result = self.collection.update_one(
+                {'_id': unit_id, 'owner': self.worker_id, 'status': 'leased'},
+                {'$set': {'lease_expires': datetime.now(timezone.utc)
+                          + timedelta(seconds=self.lease_seconds)}}
+            )
+            if result.matched_count == 0:
+                # Kiralama düştü ve başka worker aldı; birim bir sonraki parça sınırında
+                # durdurulur ki yeni sahibin sildiği belgeler tekrar yazılmasın
+                logger.warning(f"{unit_id} kiralaması kaybedildi, birim durduruluyor")
+                lost.set()
+                return
+    
+    def _finish_unit(self, unit: Dict[str, Any], status: str,
+                     result: Optional[Dict[str, Any]] = None, error: Optional[str] = None):
+        """
+        Birimin durumunu yazar ('pending' tekrar denenmek üzere serbest bırakır).
+        
+        Args:
+            unit: Birim
+            status: 'done', 'failed' veya 'pending'
+            result: Birim sonucu
+            error: Hata mesajı
+        """
+        update = {'status': status, 'lease_expires': None, 'finished_at': datetime.now(timezone.utc)}
+        if result is not None:
+            update['result'] = result
+        if error is not None:
+            update['error'] = error
+        self.collection.update_one({'_id': unit['_id'], 'owner': unit['owner']}, {'$set': update})
+    
+    def _insert_only(self, table_name: str, primary_keys: List[str]) -> bool:
+        """
+        Tablo upsert yerine insert ile yazılıyorsa True döndürür
+        (PK'siz tablolar, preserve_ids kapalıyken ve time-series collection'lar).
+        
+        Args:
+            table_name: Tablo ismi
+            primary_keys: Primary key kolonları
+        """
+        return not (self.migrator.preserve_ids and primary_keys
+                    and self.migrator.collections.kind(table_name) != 'timeseries')
+    
+    def _clear_output(self, table_name: str):
+        """
+        Insert ile yazılan tek birimli tablonun önceki denemede yazılan
+        belgelerini siler. Ortak (tenant) collection'larda yalnızca bu
+        kaynağın belgeleri silinir; diğer time-series collection'lar
+        _migrate_table tarafından zaten yeniden oluşturulur.
+        
+        Args:
+            table_name: Tablo ismi
+        """
+        # Önceki deneme tamamlanıp parmak izini kaydetmiş olabilir; silinen tablo atlanmamalı
+        self.migrator.fingerprints.discard(table_name)
+        if self.migrator.tenant:
+            query = {self.migrator.tenant_field: self.migrator.tenant}
+        elif self.migrator.collections.kind(table_name) == 'timeseries':
+            return
+        else:
+            query = {}
+        collection = self.migrator.mongodb_connector.get_collection(table_name)
+        if collection is None:
+            return
+        deleted = collection.delete_many(query).deleted_count
+        if deleted:
+            logger.warning(f"{table_name}: önceki denemeden kalan {deleted} belge silindi")
+    
+    def _remaining(self, leased_only: bool = False) -> int:
+        """
+        Bitmemiş birim sayısını döndürür.
+        
+        Args:
+            leased_only: True ise yalnızca kiralanmış birimler sayılır
+        
+        Returns:
+            int: Birim sayısı
+        """
+        statuses = ['leased'] if leased_only else ['pending', 'leased']
+        return self.collection.count_documents(
+            {'type': 'unit', 'run_id': self.run_id, 'status': {'$in': statuses}}
+        )
+    
+    def _set_run_status(self, status: str):
+        """
+        Çalıştırma kaydının durumunu günceller.
+        """
+        self.collection.update_one({'_id': f"run:{self.run_id}"}, {'$set': {'status': status}})
+    
+    def _range_column(self, columns: List[Dict], primary_keys: List[str]) -> Optional[str]:
+        """
+        Aralıklara bölmek için kullanılabilecek tam sayı PK kolonunu döndürür.
+        """
+        if len(primary_keys) != 1:
+            return None
+        for col in columns:
+            if col['name'] == primary_keys[0] and 'INT' in col.get('type', '').upper():
+                return col['name']
+        return None
+    
+    def _split_ranges(self, table_name: str, range_column: str,
+                      count: int) -> List[Tuple[Optional[int], Optional[int]]]:
+        """
+        PK değer aralığını eşit parçalara böler. İlk ve son aralık açık uçludur;
+        böylece planlamadan sonra eklenen satırlar da bir birime düşer.
+        
+        Args:
+            table_name: Tablo ismi
+            range_column: Aralık kolonu
+            count: Parça sayısı
+        
+        Returns:
+            list: [başlangıç, bitiş) aralıkları (None = sınırsız)
+        """
+        quote = self.migrator.sql_connector.quote_identifier
+        with self.migrator.sql_connector.get_engine().connect() as conn:
+            low, high = conn.execute(text(
+                f"SELECT MIN({quote(range_column)}), MAX({quote(range_column)}) FROM {quote(table_name)}"
+                f"{self.migrator.selection.where_clause(table_name)}"
+            )).fetchone()
+        if low is None or count <= 1:
+            return [(None, None)]
+        
+        step = max(1, -(-(high + 1 - low) // count))
+        bounds = list(range(low + step, high + 1, step))
+        starts = [None] + bounds
+        ends = bounds + [None]
+        return list(zip(starts, ends))
+
+
+def _merge_metrics(unit_metrics: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Bir tablonun birim metriklerini tek tablo metriğinde birleştirir.
+    Toplanabilen değerler toplanır; gecikme yüzdelikleri için birimlerin
+    en kötü değeri alınır (yaklaşık).
+    
+    Args:
+        unit_metrics: TableMetrics.to_dict çıktıları
+    
+    Returns:
+        dict: Tablo metrikleri
+    """
+    merged = TableMetrics('').to_dict()
+    for metrics in unit_metrics:
+        for key in ('rows', 'extract_seconds', 'convert_seconds', 'write_seconds',
+                    'total_seconds', 'bytes_read', 'bytes_written', 'batch_count'):
+            merged[key] += metrics.get(key, 0)
+        for key in ('batch_latency_p50', 'batch_latency_p95', 'batch_latency_p99'):
+            merged[key] = max(merged[key], metrics.get(key, 0))
+    if merged['total_seconds'] > 0:
+        merged['rows_per_second'] = merged['rows'] / merged['total_seconds']
+    return merged
@@ -0,0 +1,248 @@
+"""
+File Export Module
+Dönüştürülen belgeleri canlı MongoDB yerine sıkıştırılmış BSON veya JSONL
+dosyalarına yazar (mongorestore / mongoimport ile çevrimdışı yükleme için).
+Her tablo boyuta göre parçalara bölünür ve satır sayısı ile checksum'lar
+bir manifest dosyasına kaydedilir.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+
+import bson
+from bson import json_util
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = ('bson', 'jsonl')
+EXPORT_COMPRESSIONS = ('gzip', 'zstd', 'none')
+COMPRESSION_EXTENSIONS = {'gzip': '.gz', 'zstd': '.zst', 'none': ''}
+
+
+class FileExporter:
+    """
+    Dosyaya dışa aktarım sınıfı.
+    Tablo başına açık bir parça dosyasına belgeleri streaming olarak yazar;
+    parça sıkıştırılmamış boyut sınırını aşınca yeni parçaya geçer.
+    """
+    
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Dışa aktarım hedefini başlatır.
+        
+        Args:
+            config: Migration konfigürasyonu
+        """
+        self.format = config.get('export_format', 'bson')
+        self.compression = config.get('export_compression', 'gzip')
+        self.max_file_bytes = int(config.get('export_max_file_mb', 256) * 1024 * 1024)
+        
+        if self.format not in EXPORT_FORMATS:
+            raise ValueError(f"Desteklenmeyen export formatı: {self.format}")
+        if self.compression not in EXPORT_COMPRESSIONS:
+            raise ValueError(f"Desteklenmeyen sıkıştırma: {self.compression}")
+        if self.compression == 'zstd':
+            try:
+                import zstandard  # noqa: F401
+            except ImportError:
+                raise ImportError("zstd sıkıştırma için 'zstandard' paketi gerekli "
+                                  "(pip install zstandard)")
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.output_dir = os.path.join(config.get('export_dir', 'exports'), timestamp)
+        os.makedirs(self.output_dir, exist_ok=True)
+        
+        self.tables: Dict[str, Dict[str, Any]] = {}
+        self._parts: Dict[str, _PartWriter] = {}
+    
+    def write_documents(self, table_name: str, documents: List[Dict[str, Any]]) -> int:
+        """
+        Belgeleri tablonun açık parça dosyasına yazar.
+        
+        Args:
+            table_name: Tablo (collection) ismi
+            documents: Yazılacak belgeler
+        
+        Returns:
+            int: Yazılan sıkıştırılmamış byte miktarı
+        """
+        table = self.tables.setdefault(table_name, {'rows': 0, 'bytes': 0, 'files': []})
+        written = 0
+        for doc in documents:
+            part = self._parts.get(table_name)
+            if part is None or part.bytes >= self.max_file_bytes:
+                if part is not None:
+                    table['files'].append(part.close())
+                part = self._open_part(table_name, len(table['files']))
+            written += part.write_document(self._encode(doc))
+        
+        table['rows'] += len(documents)
+        table['bytes'] += written
+        return written
+    
+    def close_table(self, table_name: str):
+        """
+        Tablonun açık parça dosyasını kapatır.
+        
+        Args:
+            table_name: Tablo (collection) ismi
+        """
+        table = self.tables.setdefault(table_name, {'rows': 0, 'bytes': 0, 'files': []})
+        part = self._parts.pop(table_name, None)
+        if part is not None:
+            table['files'].append(part.close())
+        logger.info(f"{table_name}: {table['rows']} belge {len(table['files'])} dosyaya yazıldı")
+    
+    def write_manifest(self, schema_info: Dict[str, Any], source: Optional[str] = None) -> str:
+        """
+        Satır sayıları, checksum'lar ve index tanımlarını içeren manifest'i yazar.
+        
+        Args:
+            schema_info: Keşfedilen şema bilgileri (index tanımları için)
+            source: Kaynak veritabanı tipi
+        
+        Returns:
+            str: Manifest dosyasının yolu
+        """
+        for table_name in list(self._parts):
+            self.close_table(table_name)
+        
+        primary_keys = schema_info.get('primary_keys', {})
+        indexes = schema_info.get('indexes', {})
+        manifest = {
+            'created_at': datetime.now().isoformat(),
+            'source': source,
+            'format': self.format,
+            'compression': self.compression,
+            'tables': {
+                name: {
+                    **table,
+                    'primary_key': primary_keys.get(name, []),
+                    'indexes': [
+                        {'columns': index.get('columns', []), 'unique': index.get('unique', False)}
+                        for index in indexes.get(name, [])
+                    ]
+                }
+                for name, table in self.tables.items()
+            }
+        }
+        path = os.path.join(self.output_dir, 'manifest.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        logger.info(f"Export manifest'i kaydedildi: {path}")
+        return path
+    
+    def _open_part(self, table_name: str, index: int) -> '_PartWriter':
+        """
+        Tablo için yeni bir parça dosyası açar.
+        
+        Args:
+            table_name: Tablo ismi
+            index: Parça numarası
+        
+        Returns:
+            _PartWriter: Açık parça
+        """
+        file_name = (f"{table_name}.{index:04d}.{self.format}"
+                     f"{COMPRESSION_EXTENSIONS[self.compression]}")
+        part = _PartWriter(os.path.join(self.output_dir, file_name), self.compression)
+        self._parts[table_name] = part
+        return part
+    
+    def _encode(self, doc: Dict[str, Any]) -> bytes:
+        """
+        Belgeyi seçilen formatta encode eder.
+        
+        Args:
+            doc: MongoDB belgesi
+        
+        Returns:
+            bytes: BSON veya tek satırlık extended JSON
+        """
+        if self.format == 'bson':
+            return bson.encode(doc)
+        return (json_util.dumps(doc, json_options=json_util.RELAXED_JSON_OPTIONS) + "\n").encode('utf-8')
+
+
+class _PartWriter:
+    """
+    Tek bir sıkıştırılmış parça dosyası; yazılan sıkıştırılmış byte'ların
+    SHA-256 özetini dosya kapanırken hazır olacak şekilde tutar.
+    """
+    
+    def __init__(self, path: str, compression: str):
+        """
+        Parça dosyasını açar.
+        
+        Args:
+            path: Dosya yolu
+            compression: 'gzip', 'zstd' veya 'none'
+        """
+        self.path = path
+        self.rows = 0
+        self.bytes = 0
+        self._raw = open(path, 'wb')
+        self._sha256 = hashlib.sha256()
+        self._compressed_bytes = 0
+        
+        if compression == 'gzip':
+            self._stream = gzip.GzipFile(fileobj=self, mode='wb')
+        elif compression == 'zstd':
+            import zstandard
+            self._stream = zstandard.ZstdCompressor().stream_writer(self, closefd=False)
+        else:
+            self._stream = self
+    
+    def write_document(self, data: bytes) -> int:
+        """
+        Encode edilmiş bir belgeyi parçaya yazar.
+        
+        Args:
+            data: Encode edilmiş belge
+        
+        Returns:
+            int: Sıkıştırılmamış byte miktarı
+        """
+        self._stream.write(data)
+        self.rows += 1
+        self.bytes += len(data)
+        return len(data)
+    
+    def write(self, data: bytes) -> int:
+        """
+        Sıkıştırıcının çıktısını dosyaya yazar ve özetini günceller.
+        Sıkıştırma yoksa belge doğrudan buradan yazılır.
+        """
+        self._raw.write(data)
+        self._sha256.update(data)
+        self._compressed_bytes += len(data)
+        return len(data)
+    
+    def flush(self):
+        """
+        Dosya tamponunu boşaltır.
+        """
+        self._raw.flush()
+    
+    def close(self) -> Dict[str, Any]:
+        """
+        Parçayı kapatır.
+        
+        Returns:
+            dict: Dosya ismi, satır sayısı, boyutlar ve SHA-256 checksum'ı
+        """
+        if self._stream is not self:
+            self._stream.close()
+        self._raw.close()
+        return {
+            'file': os.path.basename(self.path),
+            'rows': self.rows,
+            'bytes': self.bytes,
+            'compressed_bytes': self._compressed_bytes,
+            'sha256': self._sha256.hexdigest()
+        }
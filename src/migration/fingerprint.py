@@ -0,0 +1,198 @@
+"""
+Table Fingerprint Module
+Kaynak tabloların içerik parmak izlerini hesaplar ve MongoDB'deki bir metadata
+collection'ında saklar. Tekrar çalıştırmada parmak izi değişmemiş tablolar atlanır.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+# Collection tipini belirleyen table_options ayarları (collection_types modülü)
+COLLECTION_OPTION_KEYS = ('collection_type', 'time_field', 'meta_field', 'granularity',
+                          'expire_after_seconds')
+
+
+class TableFingerprints:
+    """
+    Tablo parmak izi sınıfı.
+    MySQL'de CHECKSUM TABLE, MSSQL'de COUNT_BIG(*) ve
+    CHECKSUM_AGG(BINARY_CHECKSUM(*)) kullanılır. Parmak izine kolon
+    projeksiyonu, satır filtresi, preserve_ids, LOB ve collection tipi
+    ayarları da katılır; böylece ayar değişikliği de tablonun yeniden
+    aktarılmasına yol açar.
+    """
+    
+    def __init__(self, sql_connector, mongodb_connector, selection, config: Dict[str, Any]):
+        """
+        Parmak izi deposunu başlatır.
+        
+        Args:
+            sql_connector: SQLConnector instance
+            mongodb_connector: MongoDBConnector instance
+            selection: TableSelection instance
+            config: Migration konfigürasyonu
+        """
+        self.sql_connector = sql_connector
+        self.mongodb_connector = mongodb_connector
+        self.selection = selection
+        self.skip_unchanged = config.get('skip_unchanged', False)
+        self.collection_name = config.get('metadata_collection', '_migration_metadata')
+        self.preserve_ids = config.get('preserve_ids', True)
+        # Belge düzenini değiştiren LOB ayarları (GridFS referansı veya gömülü değer)
+        self.lob_options = {
+            'mode': config.get('lob_mode', 'inline'),
+            'threshold': config.get('lob_threshold_bytes', 1024 * 1024),
+            'bucket': config.get('lob_bucket', 'fs')
+        }
+        self.table_options: Dict[str, Dict[str, Any]] = config.get('table_options') or {}
+        # Ortak collection'lara yazan kaynakların kayıtları kaynak ismiyle ayrılır
+        self.key_prefix = f"{config['tenant']}/" if config.get('tenant') else ''
+        self._stored: Optional[Dict[str, Dict[str, Any]]] = None
+        self._lock = threading.RLock()
+    
+    @property
+    def enabled(self) -> bool:
+        """
+        skip_unchanged açık, MongoDB hedefi var ve kaynak destekleniyorsa True döndürür.
+        """
+        return (self.skip_unchanged and self.mongodb_connector is not None
+                and self.sql_connector.db_type in ('mysql', 'mssql'))
+    
+    def compute(self, table_name: str, columns: List[Dict]) -> Optional[Dict[str, Any]]:
+        """
+        Tablonun güncel parmak izini hesaplar.
+        
+        Args:
+            table_name: Tablo ismi
+            columns: Seçilen kolon bilgileri
+        
+        Returns:
+            dict: Kaynak checksum'ı ve ayar özeti (hesaplanamazsa None)
+        """
+        quote = self.sql_connector.quote_identifier
+        try:
+            with self.sql_connector.get_engine().connect() as conn:
+                if self.sql_connector.db_type == 'mysql':
+                    # CHECKSUM TABLE tüm tabloyu kapsar; filtreli tablolarda da güvenli taraftadır
+                    row = conn.execute(text(f"CHECKSUM TABLE {quote(table_name)}")).fetchone()
+                    checksum = row[1] if row else None
+                    rows = None
+                else:
+                    query = (f"SELECT COUNT_BIG(*), CHECKSUM_AGG(BINARY_CHECKSUM(*)) "
+                             f"FROM {quote(table_name)}{self.selection.where_clause(table_name)}")
+                    rows, checksum = conn.execute(text(query)).fetchone()
+        except Exception as e:
+            logger.warning(f"{table_name}: parmak izi hesaplanamadı, tablo aktarılacak: {str(e)}")
+            return None
+        
+        if checksum is None and rows is None:
+            return None
+        return {
+            'checksum': int(checksum) if checksum is not None else None,
+            'rows': int(rows) if rows is not None else None,
+            'options': self._options_digest(table_name, columns)
+        }
+    
+    def is_unchanged(self, table_name: str, fingerprint: Dict[str, Any]) -> bool:
+        """
+        Tablonun parmak izi son başarılı aktarımdakiyle aynı ve collection
+        hâlâ mevcutsa True döndürür.
+        
+        Args:
+            table_name: Tablo ismi
+            fingerprint: Güncel parmak izi
+        
+        Returns:
+            bool: Tablo atlanabilirse True
+        """
+        stored = self._load().get(self.key_prefix + table_name)
+        if not stored or stored.get('fingerprint') != fingerprint:
+            return False
+        return self.mongodb_connector.collection_exists(table_name)
+    
+    def save(self, table_name: str, fingerprint: Dict[str, Any]):
+        """
+        Başarılı aktarımdan sonra tablonun parmak izini kaydeder.
+        
+        Args:
+            table_name: Tablo ismi
+            fingerprint: Aktarım başlamadan önce hesaplanan parmak izi
+        """
+        collection = self.mongodb_connector.get_collection(self.collection_name)
+        if collection is None:
+            return
+        record = {'fingerprint': fingerprint, 'migrated_at': datetime.now()}
+        try:
+            collection.replace_one({'_id': self.key_prefix + table_name}, record, upsert=True)
+        except Exception as e:
+            logger.warning(f"{table_name}: parmak izi kaydedilemedi: {str(e)}")
+            return
+        with self._lock:
+            self._load()[self.key_prefix + table_name] = record
+    
+    def discard(self, table_name: str):
+        """
+        Tablonun kayıtlı parmak izini siler; tablo bir sonraki aktarımda atlanmaz.
+        
+        Args:
+            table_name: Tablo ismi
+        """
+        collection = self.mongodb_connector.get_collection(self.collection_name)
+        if collection is None:
+            return
+        try:
+            collection.delete_one({'_id': self.key_prefix + table_name})
+        except Exception as e:
+            logger.warning(f"{table_name}: parmak izi silinemedi: {str(e)}")
+            return
+        with self._lock:
+            self._load().pop(self.key_prefix + table_name, None)
+    
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Kayıtlı parmak izlerini ilk kullanımda tek sorguyla okur.
+        
+        Returns:
+            dict: Tablo isimlerine göre kayıtlar
+        """
+        with self._lock:
+            if self._stored is None:
+                stored = {}
+                collection = self.mongodb_connector.get_collection(self.collection_name)
+                if collection is not None:
+                    try:
+                        for doc in collection.find({}):
+                            stored[doc['_id']] = doc
+                    except Exception as e:
+                        logger.warning(f"Parmak izleri okunamadı: {str(e)}")
+                self._stored = stored
+            return self._stored
+    
+    def _options_digest(self, table_name: str, columns: List[Dict]) -> str:
+        """
+        Tablonun aktarılma biçimini belirleyen ayarların özetini döndürür.
+        
+        Args:
+            table_name: Tablo ismi
+            columns: Seçilen kolon bilgileri
+        
+        Returns:
+            str: SHA-1 özeti
+        """
+        table_options = self.table_options.get(table_name, {})
+        options = {
+            'columns': [[col['name'], str(col.get('type', ''))] for col in columns],
+            'where': self.selection.where(table_name),
+            'preserve_ids': self.preserve_ids,
+            'lob': self.lob_options,
+            'collection': {key: table_options.get(key) for key in COLLECTION_OPTION_KEYS}
+        }
+        return hashlib.sha1(json.dumps(options, sort_keys=True).encode('utf-8')).hexdigest()
@@ -0,0 +1,378 @@
+"""
+Index Advisor Module
+View, stored procedure ve function tanımlarındaki sorguları inceleyerek
+MongoDB için compound ve partial index önerileri üretir. Filtre (WHERE),
+join (ON) ve sıralama (ORDER BY) kolonları Equality-Sort-Range kuralına göre
+sıralanır; sabit değerli koşullar partial index filtresine dönüştürülür.
+"""
+
+import logging
+import re
+from typing import Dict, List, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ADVISOR_MODES = ('off', 'report', 'create')
+
+# Yorumlar, ifadeler ve cümlecikler için düzenli ifadeler
+COMMENT_PATTERN = re.compile(r'--[^\n]*|/\*.*?\*/', re.DOTALL)
+STATEMENT_SPLIT = re.compile(r';|\bUNION(?:\s+ALL)?\b', re.IGNORECASE)
+TABLE_PATTERN = re.compile(
+    r'\b(?:FROM|JOIN|UPDATE|INTO)\s+\(*\s*([\w.]+)(?:\s+(?:AS\s+)?(\w+))?', re.IGNORECASE
+)
+WHERE_PATTERN = re.compile(
+    r'\bWHERE\b(.*?)(?=\bGROUP\s+BY\b|\bORDER\s+BY\b|\bHAVING\b|\bLIMIT\b|\bOFFSET\b|\bFETCH\b|$)',
+    re.IGNORECASE | re.DOTALL
+)
+ON_PATTERN = re.compile(
+    r'\bON\b(.*?)(?=\b(?:INNER|LEFT|RIGHT|FULL|CROSS|OUTER|JOIN|WHERE|GROUP|ORDER|HAVING|LIMIT)\b|$)',
+    re.IGNORECASE | re.DOTALL
+)
+ORDER_PATTERN = re.compile(
+    r'\bORDER\s+BY\b(.*?)(?=\bLIMIT\b|\bOFFSET\b|\bFETCH\b|\bFOR\b|$)', re.IGNORECASE | re.DOTALL
+)
+PREDICATE_PATTERN = re.compile(
+    r'^\(*\s*(?:(\w+)\.)?(\w+)\s*(<=|>=|<>|!=|=|<|>|\bNOT\s+LIKE\b|\bLIKE\b|\bBETWEEN\b|\bIN\b)\s*(.*)$',
+    re.IGNORECASE | re.DOTALL
+)
+COLUMN_REF = re.compile(r'^(?:(\w+)\.)?(\w+)$')
+NUMBER_PATTERN = re.compile(r'^-?\d+(?:\.\d+)?$')
+
+# Tablo takma adı olamayacak anahtar kelimeler
+KEYWORDS = {
+    'WHERE', 'JOIN', 'INNER', 'LEFT', 'RIGHT', 'FULL', 'CROSS', 'OUTER', 'ON', 'GROUP',
+    'ORDER', 'HAVING', 'LIMIT', 'OFFSET', 'FETCH', 'UNION', 'SET', 'VALUES', 'SELECT',
+    'WITH', 'AND', 'OR', 'FOR', 'USING', 'NATURAL', 'AS', 'WHEN', 'THEN', 'END'
+}
+RANGE_OPERATORS = {'<': '$lt', '>': '$gt', '<=': '$lte', '>=': '$gte'}
+
+
+class IndexAdvisor:
+    """
+    Index danışmanı sınıfı.
+    Tanımlar tam bir SQL ayrıştırıcısı yerine düzenli ifadelerle incelenir;
+    yalnızca keşfedilen tablolara ve belgeye yazılan kolonlara çözümlenebilen
+    referanslar kullanılır. Mevcut SQL index'lerinin (veya primary key'in)
+    önekiyle karşılanan ve başka bir önerinin öneki olan öneriler elenir.
+    'report' modunda öneriler yalnızca rapora yazılır, 'create' modunda
+    MongoDB'de oluşturulur.
+    """
+    
+    def __init__(self, migrator, config: Dict[str, Any]):
+        """
+        Index danışmanını başlatır.
+        
+        Args:
+            migrator: DataMigrator instance (kolon seçimi ve index alanları için)
+            config: Migration konfigürasyonu
+        """
+        self.migrator = migrator
+        self.mongodb_connector = migrator.mongodb_connector
+        self.mode = config.get('index_advisor') or 'off'
+        if self.mode not in ADVISOR_MODES:
+            logger.warning(f"Geçersiz index_advisor değeri '{self.mode}', report kullanılacak")
+            self.mode = 'report'
+        self.max_per_table = int(config.get('index_advisor_max_per_table', 3))
+    
+    def advise_all(self, schema_info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Tüm tanımları inceler, önerileri üretir ve create modunda oluşturur.
+        
+        Args:
+            schema_info: Keşfedilen şema bilgileri
+        
+        Returns:
+            dict: Öneriler ve özet bilgiler
+        """
+        logger.info("Index önerileri hazırlanıyor...")
+        
+        fields = self._document_fields(schema_info)
+        definitions = self._definitions(schema_info)
+        candidates: Dict[Tuple, Dict[str, Any]] = {}
+        
+        for source, definition in definitions:
+            for statement in STATEMENT_SPLIT.split(COMMENT_PATTERN.sub(' ', definition)):
+                for proposal in self._analyze(statement, fields):
+                    key = (proposal['table'], tuple(proposal['fields']),
+                           repr(sorted(proposal['partial_filter'].items()))
+                           if proposal['partial_filter'] else '')
+                    entry = candidates.setdefault(key, proposal)
+                    if source not in entry['sources']:
+                        entry['sources'].append(source)
+        
+        proposals = self._select(list(candidates.values()), schema_info)
+        build = self.mode == 'create' and self.migrator.exporter is None
+        created = 0
+        for proposal in proposals:
+            if build:
+                proposal['status'] = 'created' if self._create(proposal) else 'failed'
+                created += proposal['status'] == 'created'
+            else:
+                proposal['status'] = 'proposed'
+        
+        if self.mode == 'create' and not build:
+            logger.warning("Dosyaya aktarım modunda önerilen index'ler oluşturulmadı")
+        logger.info(f"Index önerileri: {len(definitions)} tanım incelendi, "
+                    f"{len(proposals)} öneri, {created} index oluşturuldu")
+        return {
+            'mode': self.mode,
+            'definitions': len(definitions),
+            'created': created,
+            'proposals': proposals
+        }
+    
+    def _definitions(self, schema_info: Dict[str, Any]) -> List[Tuple[str, str]]:
+        """
+        İncelenecek view, stored procedure ve function tanımlarını döndürür.
+        """
+        definitions = []
+        for kind, key in (('view', 'views'), ('procedure', 'stored_procedures'),
+                          ('function', 'functions')):
+            for item in schema_info.get(key, []):
+                if item.get('definition'):
+                    definitions.append((f"{kind}:{item['name']}", str(item['definition'])))
+        return definitions
+    
+    def _document_fields(self, schema_info: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
+        """
+        Tablo başına belgeye yazılan alanları döndürür (küçük harfli isimden
+        gerçek isme). preserve_ids kapalıyken PK kolonları belgede yer almaz.
+        """
+        columns_info = schema_info.get('columns', {})
+        primary_keys = schema_info.get('primary_keys', {})
+        fields = {}
+        for table_name in schema_info.get('tables', []):
+            pks = primary_keys.get(table_name, [])
+            selected = self.migrator.selection.columns(
+                table_name, columns_info.get(table_name, []), pks
+            )
+            fields[table_name] = {
+                col['name'].lower(): col['name'] for col in selected
+                if self.migrator.preserve_ids or col['name'] not in pks
+            }
+        return fields
+    
+    def _analyze(self, statement: str, fields: Dict[str, Dict[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Tek bir sorgu ifadesinden tablo başına index önerisi üretir.
+        
+        Args:
+            statement: SQL ifadesi
+            fields: Tablo başına belge alanları
+        
+        Returns:
+            list: Öneriler
+        """
+        # Tırnaklı tanımlayıcılar sadeleştirilir; string sabitler korunur
+        statement = re.sub(r'[`\[\]"]', '', statement)
+        tables = {name.lower(): name for name in fields}
+        aliases: Dict[str, str] = {}
+        for match in TABLE_PATTERN.finditer(statement):
+            table_name = tables.get(match.group(1).split('.')[-1].lower())
+            if table_name is None:
+                continue
+            aliases[table_name.lower()] = table_name
+            alias = match.group(2)
+            if alias and alias.upper() not in KEYWORDS:
+                aliases[alias.lower()] = table_name
+        if not aliases:
+            return []
+        
+        usage: Dict[str, Dict[str, Any]] = {}
+        
+        def use(table_name: str) -> Dict[str, Any]:
+            return usage.setdefault(table_name, {'equality': [], 'sort': [], 'range': [],
+                                                 'partial': {}})
+        
+        def resolve(alias: Optional[str], column: str) -> Optional[Tuple[str, str]]:
+            if alias:
+                table_name = aliases.get(alias.lower())
+                field = fields[table_name].get(column.lower()) if table_name else None
+                return (table_name, field) if field else None
+            for table_name in dict.fromkeys(aliases.values()):
+                field = fields[table_name].get(column.lower())
+                if field:
+                    return table_name, field
+            return None
+        
+        for clause in WHERE_PATTERN.findall(statement) + ON_PATTERN.findall(statement):
+            for predicate in re.split(r'\bAND\b', clause, flags=re.IGNORECASE):
+                # OR içeren koşullar tek bir index ile karşılanamaz
+                if re.search(r'\bOR\b', predicate, re.IGNORECASE):
+                    continue
+                match = PREDICATE_PATTERN.match(predicate.strip())
+                if not match:
+                    continue
+                left = resolve(match.group(1), match.group(2))
+                if left is None:
+                    continue
+                operator = ' '.join(match.group(3).upper().split())
+                value = match.group(4).strip().rstrip(')').strip()
+                self._classify(use(left[0]), left, operator, value, resolve, use)
+        
+        for clause in ORDER_PATTERN.findall(statement):
+            for item in clause.split(','):
+                parts = item.split()
+                ref = COLUMN_REF.match(parts[0]) if parts else None
+                target = resolve(ref.group(1), ref.group(2)) if ref else None
+                if target:
+                    direction = -1 if len(parts) > 1 and parts[1].upper() == 'DESC' else 1
+                    use(target[0])['sort'].append((target[1], direction))
+        
+        return [proposal for proposal in (self._compose(table_name, used)
+                                          for table_name, used in usage.items())
+                if proposal]
+    
+    def _classify(self, used: Dict[str, Any], left: Tuple[str, str], operator: str, value: str,
+                  resolve, use):
+        """
+        Koşulu equality, range, join veya partial filtre olarak sınıflandırır.
+        """
+        field = left[1]
+        constant = _constant(value)
+        ref = COLUMN_REF.match(value)
+        right = resolve(ref.group(1), ref.group(2)) if ref and not constant[0] else None
+        
+        if right is not None and right != left:
+            # Join koşulu: her iki taraf da lookup anahtarı olarak kullanılır
+            if operator == '=':
+                used['equality'].append(field)
+                use(right[0])['equality'].append(right[1])
+            return
+        
+        if constant[0]:
+            if operator == '=':
+                used['partial'][field] = constant[1]
+            elif operator in RANGE_OPERATORS:
+                used['partial'][field] = {RANGE_OPERATORS[operator]: constant[1]}
+            elif operator == 'IN':
+                used['equality'].append(field)
+            elif operator in ('LIKE', 'BETWEEN') and not str(constant[1]).startswith('%'):
+                used['range'].append(field)
+            return
+        
+        # Parametre, değişken veya ifade ile karşılaştırma
+        if operator in ('=', 'IN'):
+            used['equality'].append(field)
+        elif operator in RANGE_OPERATORS or operator in ('BETWEEN', 'LIKE'):
+            used['range'].append(field)
+    
+    def _compose(self, table_name: str, used: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Kullanım bilgisinden Equality-Sort-Range sırasıyla index önerisi oluşturur.
+        """
+        partial = dict(used['partial'])
+        index_fields: List[Tuple[str, int]] = []
+        seen = set()
+        for field, direction in ([(f, 1) for f in used['equality']] + used['sort'] +
+                                 [(f, 1) for f in used['range'][:1]]):
+            if field not in seen and field not in partial:
+                seen.add(field)
+                index_fields.append((field, direction))
+        
+        if not index_fields:
+            if not partial:
+                return None
+            # Yalnızca sabit koşullar varsa koşul kolonları index anahtarı olur
+            index_fields = [(field, 1) for field in partial]
+            partial = {}
+        
+        return {
+            'table': table_name,
+            'fields': index_fields,
+            'partial_filter': partial or None,
+            'sources': []
+        }
+    
+    def _select(self, proposals: List[Dict[str, Any]],
+                schema_info: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Mevcut index'lerle veya başka önerilerle karşılanan önerileri eler ve
+        tablo başına en çok kaynakta kullanılanları seçer.
+        """
+        primary_keys = schema_info.get('primary_keys', {})
+        indexes_info = schema_info.get('indexes', {})
+        selected = []
+        # Kısa öneriler önce incelenir; böylece kaynakları en geniş index'te toplanır
+        proposals = sorted(proposals, key=lambda p: len(p['fields']))
+        
+        for table_name in dict.fromkeys(p['table'] for p in proposals):
+            existing = [index.get('columns', []) for index in indexes_info.get(table_name, [])]
+            if self.migrator.preserve_ids and primary_keys.get(table_name):
+                existing.append(primary_keys[table_name])
+            table_proposals = [p for p in proposals if p['table'] == table_name]
+            
+            kept = []
+            for proposal in table_proposals:
+                names = [field for field, _ in proposal['fields']]
+                ascending = all(direction == 1 for _, direction in proposal['fields'])
+                if ascending and any(columns[:len(names)] == names for columns in existing):
+                    continue
+                coverers = [other for other in table_proposals if _covers(other, proposal)]
+                if coverers:
+                    # Kaynaklar öneriyi karşılayan en geniş index'e aktarılır
+                    coverer = max(coverers, key=lambda o: (len(o['fields']), o['partial_filter'] is None))
+                    coverer['sources'].extend(source for source in proposal['sources']
+                                              if source not in coverer['sources'])
+                    continue
+                kept.append(proposal)
+            
+            kept.sort(key=lambda p: len(p['sources']), reverse=True)
+            selected.extend(kept[:self.max_per_table])
+        
+        for proposal in selected:
+            logger.info(f"Index önerisi: {proposal['table']} {proposal['fields']}"
+                        f"{' partial: ' + str(proposal['partial_filter']) if proposal['partial_filter'] else ''}"
+                        f" ({', '.join(proposal['sources'])})")
+        return selected
+    
+    def _create(self, proposal: Dict[str, Any]) -> bool:
+        """
+        Öneriyi MongoDB'de oluşturur; ortak collection'larda tenant alanı başa eklenir.
+        """
+        table_name = proposal['table']
+        partial_filter = proposal['partial_filter']
+        if partial_filter and self.migrator.collections.kind(table_name) == 'timeseries':
+            logger.warning(f"{table_name}: time-series collection'da partial filtre atlandı")
+            partial_filter = None
+        return self.mongodb_connector.create_index(
+            table_name, self.migrator._index_fields(proposal['fields']),
+            partial_filter=partial_filter
+        )
+
+
+def _covers(index: Dict[str, Any], proposal: Dict[str, Any]) -> bool:
+    """
+    index önerisinin proposal'ı karşılayıp karşılamadığını döndürür: alanları
+    proposal'ın alanlarıyla başlamalı ve filtresiz (veya aynı filtreli) olmalıdır.
+    
+    Args:
+        index: Karşılayabilecek öneri
+        proposal: Karşılanacak öneri
+    
+    Returns:
+        bool: Karşılıyorsa True
+    """
+    if index is proposal or index['fields'][:len(proposal['fields'])] != proposal['fields']:
+        return False
+    if index['partial_filter'] is None:
+        return len(index['fields']) > len(proposal['fields']) or proposal['partial_filter'] is not None
+    return (index['partial_filter'] == proposal['partial_filter']
+            and len(index['fields']) > len(proposal['fields']))
+
+
+def _constant(value: str) -> Tuple[bool, Any]:
+    """
+    Değerin sabit (string veya sayı) olup olmadığını ve Python karşılığını döndürür.
+    
+    Args:
+        value: Koşulun sağ tarafı
+    
+    Returns:
+        tuple: (sabit ise True, değer)
+    """
+    if len(value) >= 2 and value[0] == "'" and value[-1] == "'" and "'" not in value[1:-1].replace("''", ''):
+        return True, value[1:-1].replace("''", "'")
+    if NUMBER_PATTERN.match(value):
+        return True, float(value) if '.' in value else int(value)
+    return False, None
@@ -0,0 +1,278 @@
+"""
+Large Object Module
+Büyük BLOB/TEXT değerlerini ana belgeye base64 olarak gömmek yerine SQL'den
+SUBSTRING ile parça parça okuyup GridFS'e stream eder. Ana belgede yalnızca
+GridFS referansı kalır; aktarım ayrı bir worker havuzunda çalışır.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+import gridfs
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+LOB_MODES = ('inline', 'gridfs')
+
+# Kolon tipinin ilk kelimesine göre LOB kolonları
+BINARY_LOB_TYPES = {'BLOB', 'MEDIUMBLOB', 'LONGBLOB', 'IMAGE'}
+TEXT_LOB_TYPES = {'TEXT', 'MEDIUMTEXT', 'LONGTEXT', 'NTEXT'}
+# MSSQL (MAX) tipleri; SQLAlchemy bunları uzunluksuz (length=None) yansıtır
+MAX_BINARY_TYPES = {'VARBINARY'}
+MAX_TEXT_TYPES = {'VARCHAR', 'NVARCHAR'}
+
+# Kaynak satırda LOB uzunluğunun taşındığı ek kolonun son eki
+LENGTH_SUFFIX = '__lob_length'
+
+
+class LobHandler:
+    """
+    LOB aktarım sınıfı.
+    Ana sorguda eşiği aşan LOB değerlerinin yerine NULL ve uzunluğu çekilir;
+    bu değerler belgeye referans olarak yazılır ve içerik arka planda
+    primary key ile SUBSTRING sayfalaması yapılarak GridFS'e aktarılır.
+    """
+    
+    def __init__(self, sql_connector, mongodb_connector, config: Dict[str, Any]):
+        """
+        LOB aktarımını başlatır.
+        
+        Args:
+            sql_connector: SQLConnector instance
+            mongodb_connector: MongoDBConnector instance
+            config: Migration konfigürasyonu
+        """
+        self.sql_connector = sql_connector
+        self.mongodb_connector = mongodb_connector
+        self.mode = config.get('lob_mode', 'inline')
+        self.threshold = int(config.get('lob_threshold_bytes', 1024 * 1024))
+        self.chunk_size = int(config.get('lob_chunk_bytes', 1024 * 1024))
+        self.workers = config.get('lob_workers', 4)
+        # Kuyrukta bekleyen (henüz bitmemiş) aktarım sınırı; dolunca satır üretimi bekler
+        self.max_pending = max(1, int(config.get('lob_max_pending', self.workers * 4)))
+        self.bucket_name = config.get('lob_bucket', 'fs')
+        # Ortak collection'lara yazan kaynakların dosya id'leri çakışmasın
+        self.id_prefix = f"{config['tenant']}/" if config.get('tenant') else ''
+        
+        if self.mode not in LOB_MODES:
+            raise ValueError(f"Desteklenmeyen LOB modu: {self.mode}")
+        
+        self.table_columns: Dict[str, List[str]] = {}
+        self.stats = {'files': 0, 'bytes': 0, 'failed': 0}
+        self.failed_tables = set()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures: Set[Future] = set()
+        self._pending = threading.BoundedSemaphore(self.max_pending)
+    
+    @property
+    def enabled(self) -> bool:
+        """
+        GridFS modu açık ve MongoDB hedefi varsa True döndürür.
+        """
+        return self.mode == 'gridfs' and self.mongodb_connector is not None
+    
+    def lob_columns(self, table_name: str, columns: List[Dict],
+                    primary_keys: List[str]) -> List[str]:
+        """
+        Tablonun GridFS'e aktarılacak LOB kolonlarını belirler.
+        Primary key'i olmayan tablolarda değer tekrar okunamayacağı için LOB'lar gömülür.
+        
+        Args:
+            table_name: Tablo ismi
+            columns: Seçilen kolon bilgileri
+            primary_keys: Primary key kolonları
+        
+        Returns:
+            list: LOB kolon isimleri
+        """
+        if not self.enabled or not primary_keys:
+            return []
+        db_type = self.sql_connector.db_type
+        names = [col['name'] for col in columns
+                 if _lob_kind(col.get('type', ''), db_type) and col['name'] not in primary_keys]
+        if names:
+            self.table_columns[table_name] = names
+        return names
+    
+    def select_list(self, columns: List[Dict], lob_columns: List[str]) -> str:
+        """
+        Eşiği aşan LOB değerlerini NULL'a çeviren ve uzunluklarını ek kolon
+        olarak döndüren SELECT listesini oluşturur.
+        
+        Args:
+            columns: Seçilen kolon bilgileri
+            lob_columns: LOB kolonları
+        
+        Returns:
+            str: SELECT listesi
+        """
+        quote = self.sql_connector.quote_identifier
+        length = 'DATALENGTH' if self.sql_connector.db_type == 'mssql' else 'LENGTH'
+        expressions = []
+        for col in columns:
+            name = quote(col['name'])
+            if col['name'] in lob_columns:
+                expressions.append(
+                    f"CASE WHEN {length}({name}) > {self.threshold} THEN NULL ELSE {name} END AS {name}"
+                )
+            else:
+                expressions.append(name)
+        # Uzunluk kolonları sona eklenir; satır düzeni bunları belgeye yazmaz
+        for lob in lob_columns:
+            expressions.append(f"{length}({quote(lob)}) AS {quote(lob + LENGTH_SUFFIX)}")
+        return ', '.join(expressions)
+    
+    def attach(self, table_name: str, column_names: List[str], primary_keys: List[str],
+               rows: List[Any], documents: List[Dict[str, Any]]):
+        """
+        Eşiği aşan LOB alanlarını GridFS referansıyla değiştirir ve aktarımlarını kuyruğa ekler.
+        
+        Args:
+            table_name: Tablo ismi
+            column_names: Veri kolonları (uzunluk kolonları satırda bunlardan sonra gelir)
+            primary_keys: Primary key kolonları
+            rows: Kaynak satırlar
+            documents: Satırlardan üretilen belgeler (aynı sırada)
+        """
+        lobs = self.table_columns.get(table_name, [])
+        positions = {name: i for i, name in enumerate(column_names)}
+        key_positions = [positions[pk] for pk in primary_keys]
+        length_positions = [(lob, len(column_names) + i) for i, lob in enumerate(lobs)]
+        
+        for row, doc in zip(rows, documents):
+            for lob, length_position in length_positions:
+                length = row[length_position]
+                if length is None or length <= self.threshold:
+                    continue
+                key = tuple(row[i] for i in key_positions)
+                file_id = f"{self.id_prefix}{table_name}/{'_'.join(str(k) for k in key)}/{lob}"
+                doc[lob] = {'gridfs_id': file_id, 'bucket': self.bucket_name, 'length': int(length)}
+                self._submit(table_name, lob, primary_keys, key, file_id)
+    
+    def wait(self) -> Dict[str, int]:
+        """
+        Kuyruktaki tüm LOB aktarımlarının bitmesini bekler.
+        
+        Returns:
+            dict: Aktarılan dosya sayısı, byte miktarı ve hata sayısı
+        """
+        with self._lock:
+            futures = list(self._futures)
+        for future in futures:
+            future.result()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        return dict(self.stats)
+    
+    def _submit(self, table_name: str, column: str, primary_keys: List[str],
+                key: Tuple[Any, ...], file_id: str):
+        """
+        Bir LOB değerinin aktarımını worker havuzuna ekler. Bekleyen aktarım
+        sayısı max_pending'e ulaşınca biri bitene kadar bekler; biten
+        aktarımların Future'ları hemen bırakılır.
+        """
+        self._pending.acquire()
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers)
+            future = self._executor.submit(
+                self._transfer, table_name, column, primary_keys, key, file_id
+            )
+            self._futures.add(future)
+        future.add_done_callback(self._finished)
+    
+    def _finished(self, future: Future):
+        """
+        Tamamlanan aktarımın Future'ını bırakır ve kuyrukta yer açar.
+        """
+        with self._lock:
+            self._futures.discard(future)
+        self._pending.release()
+    
+    def _transfer(self, table_name: str, column: str, primary_keys: List[str],
+                  key: Tuple[Any, ...], file_id: str):
+        """
+        LOB değerini SUBSTRING ile sayfalayarak GridFS'e yazar.
+        Aynı id ile önceki çalıştırmadan kalan dosya önce silinir (idempotent).
+        
+        Args:
+            table_name: Tablo ismi
+            column: LOB kolonu
+            primary_keys: Primary key kolonları
+            key: Satırın primary key değerleri
+            file_id: GridFS dosya id'si
+        """
+        quote = self.sql_connector.quote_identifier
+        where = ' AND '.join(f"{quote(pk)} = :k{i}" for i, pk in enumerate(primary_keys))
+        query = text(
+            f"SELECT SUBSTRING({quote(column)}, :offset, :size) "
+            f"FROM {quote(table_name)} WHERE {where}"
+        )
+        params = {f"k{i}": value for i, value in enumerate(key)}
+        
+        try:
+            bucket = gridfs.GridFSBucket(self.mongodb_connector.get_database(),
+                                         bucket_name=self.bucket_name)
+            try:
+                bucket.delete(file_id)
+            except gridfs.errors.NoFile:
+                pass
+            
+            written = 0
+            with self.sql_connector.get_engine().connect() as conn:
+                with bucket.open_upload_stream_with_id(
+                    file_id, f"{table_name}.{column}",
+                    metadata={'table': table_name, 'column': column, 'key': list(key)}
+                ) as stream:
+                    offset = 1
+                    while True:
+                        chunk = conn.execute(
+                            query, dict(params, offset=offset, size=self.chunk_size)
+                        ).scalar()
+                        if not chunk:
+                            break
+                        data = chunk.encode('utf-8') if isinstance(chunk, str) else bytes(chunk)
+                        stream.write(data)
+                        written += len(data)
+                        # SUBSTRING metinde karakter, binary'de byte sayar
+                        offset += len(chunk)
+                        if len(chunk) < self.chunk_size:
+                            break
+            
+            with self._lock:
+                self.stats['files'] += 1
+                self.stats['bytes'] += written
+        except Exception as e:
+            logger.error(f"{table_name}.{column} LOB aktarım hatası ({file_id}): {str(e)}")
+            with self._lock:
+                self.stats['failed'] += 1
+                self.failed_tables.add(table_name)
+
+
+def _lob_kind(type_name: str, db_type: str = '') -> Optional[str]:
+    """
+    Kolon tipinin LOB türünü döndürür. MSSQL VARBINARY(MAX) / (N)VARCHAR(MAX)
+    kolonları SQLAlchemy tarafından uzunluksuz yansıtıldığından ('VARBINARY',
+    'NVARCHAR') uzunluk belirtilmemiş bu tipler LOB sayılır.
+    
+    Args:
+        type_name: Kolon tipi (örn. 'LONGBLOB', 'NVARCHAR', 'VARBINARY(max)')
+        db_type: Veritabanı tipi ('mysql' veya 'mssql')
+    
+    Returns:
+        str: 'binary', 'text' veya None
+    """
+    upper = type_name.upper()
+    base = upper.split('(')[0].split()[0] if upper.strip() else ''
+    length = upper[len(base):].strip()
+    is_max = db_type == 'mssql' and (not length.startswith('(') or 'MAX' in length)
+    if base in BINARY_LOB_TYPES or (base in MAX_BINARY_TYPES and is_max):
+        return 'binary'
+    if base in TEXT_LOB_TYPES or (base in MAX_TEXT_TYPES and is_max):
+        return 'text'
+    return None
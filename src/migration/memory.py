@@ -0,0 +1,224 @@
+"""
+Memory Guard Module
+Migration'ın bellek kullanımını (RSS) izler ve yapılandırılan bütçeye
+yaklaşıldığında fetch boyutunu ve worker sayısını küçültür.
+"""
+
+import gc
+import logging
+import os
+import platform
+import threading
+from typing import Dict, Any
+
+try:
+    import resource
+except ImportError:
+    # Windows'ta resource modülü yoktur; RSS psutil ile (kuruluysa) ölçülür
+    resource = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+# Bütçenin bu oranı aşıldığında kısılır, bu oranın altında tekrar büyütülür
+HIGH_WATERMARK = 0.85
+LOW_WATERMARK = 0.6
+
+
+class MemoryGuard:
+    """
+    Bellek bütçesi sınıfı.
+    Her fetch sonrası RSS'i ölçer; bütçe yaklaşınca SQL'den tek seferde
+    çekilen satır sayısını (dolayısıyla bellekteki batch sayısını) yarıya
+    indirir, bellek rahatladığında yapılandırılan değere geri büyütür.
+    Aynı ölçümle aynı anda çalışabilecek tablo worker sayısı da güncellenir;
+    worker'lar yeni bir tabloya başlamadan önce acquire_worker ile bekler.
+    """
+    
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Bellek bütçesini başlatır.
+        
+        Args:
+            config: Migration konfigürasyonu
+        """
+        self.max_memory_mb = config.get('max_memory_mb', 0)
+        self.configured_fetch_size = config.get('fetch_size', 10000)
+        self.min_fetch_size = config.get('min_fetch_size', 500)
+        self.fetch_size = self.configured_fetch_size
+        self.smallest_fetch_size = self.fetch_size
+        self.throttle_events = 0
+        self.peak_rss_mb = current_rss_mb()
+        # Dinamik worker sınırı (worker_count ile yapılandırılan değer başlatılır)
+        self.configured_workers = 0
+        self.allowed_workers = 0
+        self.active_workers = 0
+        self._workers_changed = threading.Condition()
+        if self.enabled and self.peak_rss_mb == 0:
+            logger.warning("Bu platformda RSS ölçülemiyor (psutil kurulu değil), "
+                           "max_memory_mb bütçesi uygulanmayacak")
+    
+    @property
+    def enabled(self) -> bool:
+        """
+        Bellek bütçesi tanımlıysa True döndürür.
+        """
+        return self.max_memory_mb > 0
+    
+    def check(self) -> float:
+        """
+        RSS'i ölçer, peak değeri günceller ve fetch boyutunu bütçeye göre ayarlar.
+        
+        Returns:
+            float: Güncel RSS (MB)
+        """
+        rss = current_rss_mb()
+        self.peak_rss_mb = max(self.peak_rss_mb, rss)
+        if not self.enabled:
+            return rss
+        
+        usage = rss / self.max_memory_mb
+        if usage >= HIGH_WATERMARK:
+            if self.fetch_size > self.min_fetch_size:
+                # Serbest kalan batch'lerin hemen geri verilmesi için
+                gc.collect()
+                self.fetch_size = max(self.min_fetch_size, self.fetch_size // 2)
+                self.smallest_fetch_size = min(self.smallest_fetch_size, self.fetch_size)
+                self.throttle_events += 1
+                logger.warning(f"Bellek bütçesine yaklaşıldı ({rss:.0f}/{self.max_memory_mb} MB), "
+                               f"fetch boyutu {self.fetch_size} satıra düşürüldü")
+        elif usage < LOW_WATERMARK and self.fetch_size < self.configured_fetch_size:
+            self.fetch_size = min(self.configured_fetch_size, self.fetch_size * 2)
+            logger.debug(f"Bellek rahatladı ({rss:.0f} MB), fetch boyutu {self.fetch_size}")
+        
+        if self.configured_workers:
+            allowed = self._workers_for(usage, self.configured_workers)
+            if allowed != self.allowed_workers:
+                logger.info(f"Bellek kullanımı ({rss:.0f}/{self.max_memory_mb} MB) nedeniyle "
+                            f"eşzamanlı tablo sınırı {self.allowed_workers} → {allowed}")
+                with self._workers_changed:
+                    self.allowed_workers = allowed
+                    self._workers_changed.notify_all()
+        return rss
+    
+    def worker_count(self, configured: int) -> int:
+        """
+        Paralel worker sayısını kalan bellek payına göre sınırlar.
+        
+        Args:
+            configured: Yapılandırılan worker sayısı
+        
+        Returns:
+            int: Kullanılacak worker sayısı
+        """
+        if not self.enabled:
+            return configured
+        workers = self._workers_for(self.check() / self.max_memory_mb, configured)
+        if workers < configured:
+            logger.info(f"Bellek bütçesi nedeniyle worker sayısı {configured} → {workers}")
+        return workers
+    
+    def limit_workers(self, configured: int):
+        """
+        Tablo worker'larının dinamik sınırını başlatır. Sonraki her check()
+        çağrısı sınırı bellek kullanımına göre küçültür veya büyütür.
+        
+        Args:
+            configured: Yapılandırılan worker sayısı
+        """
+        if not self.enabled:
+            return
+        with self._workers_changed:
+            self.configured_workers = configured
+            self.allowed_workers = self._workers_for(self.check() / self.max_memory_mb, configured)
+    
+    def acquire_worker(self):
+        """
+        Eşzamanlı çalışan tablo sayısı bellek sınırının altına inene kadar bekler.
+        Bekleme sırasında RSS periyodik olarak tekrar ölçülür.
+        """
+        if not self.configured_workers:
+            return
+        with self._workers_changed:
+            while self.active_workers >= self.allowed_workers:
+                self._workers_changed.wait(timeout=1.0)
+                # Condition kilidi RLock'tur; check() içindeki güncelleme burada da yapılabilir
+                self.check()
+            self.active_workers += 1
+    
+    def release_worker(self):
+        """
+        acquire_worker ile alınan worker yerini serbest bırakır.
+        """
+        if not self.configured_workers:
+            return
+        with self._workers_changed:
+            self.active_workers -= 1
+            self._workers_changed.notify_all()
+    
+    @staticmethod
+    def _workers_for(usage: float, configured: int) -> int:
+        """
+        Bütçe kullanım oranına göre izin verilen worker sayısını döndürür.
+        """
+        if usage >= HIGH_WATERMARK:
+            return 1
+        if usage >= LOW_WATERMARK:
+            return max(1, configured // 2)
+        return configured
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Bellek istatistiklerini migration_stats formatına çevirir.
+        
+        Returns:
+            dict: Bellek istatistikleri
+        """
+        return {
+            'max_memory_mb': self.max_memory_mb,
+            'peak_rss_mb': max(self.peak_rss_mb, peak_rss_mb()),
+            'fetch_size': self.configured_fetch_size,
+            'smallest_fetch_size': self.smallest_fetch_size,
+            'throttle_events': self.throttle_events
+        }
+
+
+def current_rss_mb() -> float:
+    """
+    Process'in güncel RSS değerini MB olarak döndürür.
+    /proc okunamayan sistemlerde psutil (kuruluysa), o da yoksa peak RSS kullanılır.
+    
+    Returns:
+        float: RSS (MB)
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        if psutil is not None:
+            return psutil.Process().memory_info().rss / (1024 * 1024)
+        return peak_rss_mb()
+
+
+def peak_rss_mb() -> float:
+    """
+    Process'in peak RSS değerini MB olarak döndürür.
+    
+    Returns:
+        float: Peak RSS (MB); ölçülemiyorsa 0
+    """
+    if resource is None:
+        if psutil is not None:
+            info = psutil.Process().memory_info()
+            return getattr(info, 'peak_wset', info.rss) / (1024 * 1024)
+        return 0.0
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux'ta KB, macOS'ta byte döner
+    if platform.system() == 'Darwin':
+        return max_rss / (1024 * 1024)
+    return max_rss / 1024
@@ -0,0 +1,139 @@
+"""
+Migration Metrics Module
+Tablo bazında aşama sürelerini, byte miktarlarını ve batch gecikmelerini toplar.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Any, Iterator
+
+# Okunan byte miktarı her N. satırdan örneklenerek tahmin edilir
+ROW_SAMPLE_EVERY = 100
+
+
+class TableMetrics:
+    """
+    Tablo performans metrikleri sınıfı.
+    Extraction, dönüşüm ve yazma aşamalarının sürelerini ve batch
+    gecikmelerini toplar; migration_stats için sözlüğe çevrilir.
+    """
+    
+    def __init__(self, table_name: str):
+        """
+        Metrik toplayıcıyı başlatır.
+        
+        Args:
+            table_name: Tablo ismi
+        """
+        self.table_name = table_name
+        self.rows = 0
+        self.stage_seconds = {'extract': 0.0, 'convert': 0.0, 'write': 0.0}
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.batch_latencies: List[float] = []
+        self._sampled_rows = 0
+        self._sampled_row_bytes = 0
+    
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Bir aşamanın süresini ölçer ve toplama ekler.
+        
+        Args:
+            name: Aşama ismi ('extract', 'convert' veya 'write')
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage_seconds[name] = self.stage_seconds.get(name, 0.0) + time.perf_counter() - started
+    
+    def record_rows(self, rows: List[Any]):
+        """
+        Okunan satırları sayar ve okunan byte miktarını örnekleyerek tahmin eder.
+        
+        Args:
+            rows: SQL'den okunan satırlar
+        """
+        for row in rows[::ROW_SAMPLE_EVERY]:
+            self._sampled_rows += 1
+            self._sampled_row_bytes += estimate_row_bytes(row)
+        self.rows += len(rows)
+        if self._sampled_rows:
+            self.bytes_read = self.rows * self._sampled_row_bytes // self._sampled_rows
+    
+    def record_batch(self, seconds: float, batch_bytes: int):
+        """
+        Tamamlanan bir yazma batch'ini kaydeder.
+        
+        Args:
+            seconds: bulk_write süresi (saniye)
+            batch_bytes: Batch'in tahmini BSON boyutu
+        """
+        self.batch_latencies.append(seconds)
+        self.bytes_written += batch_bytes
+        self.stage_seconds['write'] += seconds
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Metrikleri migration_stats formatına çevirir.
+        
+        Returns:
+            dict: Tablo metrikleri
+        """
+        total_seconds = sum(self.stage_seconds.values())
+        latencies = sorted(self.batch_latencies)
+        return {
+            'rows': self.rows,
+            'extract_seconds': self.stage_seconds['extract'],
+            'convert_seconds': self.stage_seconds['convert'],
+            'write_seconds': self.stage_seconds['write'],
+            'total_seconds': total_seconds,
+            'rows_per_second': self.rows / total_seconds if total_seconds > 0 else 0.0,
+            'bytes_read': self.bytes_read,
+            'bytes_written': self.bytes_written,
+            'batch_count': len(latencies),
+            'batch_latency_p50': percentile(latencies, 50),
+            'batch_latency_p95': percentile(latencies, 95),
+            'batch_latency_p99': percentile(latencies, 99)
+        }
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """
+    Sıralı listede nearest-rank yöntemiyle yüzdelik değer hesaplar.
+    
+    Args:
+        sorted_values: Küçükten büyüğe sıralı değerler
+        q: Yüzdelik (0-100)
+    
+    Returns:
+        float: Yüzdelik değer (liste boşsa 0)
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * q // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def estimate_row_bytes(row: Any) -> int:
+    """
+    SQL satırının yaklaşık ağ üzerindeki boyutunu tahmin eder.
+    
+    Args:
+        row: SQL satırı (tuple benzeri)
+    
+    Returns:
+        int: Tahmini boyut (byte)
+    """
+    size = 0
+    for value in row:
+        if value is None:
+            size += 1
+        elif isinstance(value, (bytes, bytearray)):
+            size += len(value)
+        elif isinstance(value, str):
+            size += len(value.encode('utf-8'))
+        else:
+            size += 8
+    return size
@@ -5,28 +5,61 @@ SQL veritabanından MongoDB'ye veri aktarımını yönetir.
 """
 
 import logging
-from typing import Dict, List, Any, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Iterator, Optional, Tuple
 from datetime import datetime, date
 from sqlalchemy import text
-from pymongo import UpdateOne
+from pymongo import InsertOne, UpdateOne
+
+from src.migration.batching import AdaptiveBatchSizer
+from src.migration.verifier import MigrationVerifier
+from src.migration.sample_validator import SampleValidator
+from src.migration.metrics import TableMetrics
+from src.migration.progress import ProgressTracker
+from src.migration.profiling import MigrationProfiler
+from src.migration.memory import MemoryGuard
+from src.migration.rows import RowLayout
+from src.migration.exporter import FileExporter
+from src.migration.bulk_extract import BulkExtractor
+from src.migration.selection import TableSelection
+from src.migration.scheduler import TableScheduler
+from src.migration.lob import LobHandler
+from src.migration.fingerprint import TableFingerprints
+from src.migration.delta import DeltaFilter
+from src.migration.reconcile import DeletionReconciler
+from src.migration.collection_types import CollectionTypes
+from src.migration.index_advisor import IndexAdvisor
 
 logger = logging.getLogger(__name__)
 
 
+class MigrationCancelled(Exception):
+    """
+    İptal istendiğinde tablo aktarımını o anki fetch parçası yazıldıktan sonra durdurur.
+    """
+
+
 class DataMigrator:
     """
     Veri aktarım sınıfı.
     SQL veritabanından MongoDB'ye veri aktarımını gerçekleştirir.
     """
     
-    def __init__(self, sql_connector, mongodb_connector, config: Dict[str, Any]):
+    def __init__(self, sql_connector, mongodb_connector, config: Dict[str, Any],
+                 profiler: Optional[MigrationProfiler] = None,
+                 worker_budget: Optional[threading.Semaphore] = None):
         """
         Migrator sınıfını başlatır.
         
         Args:
             sql_connector: SQLConnector instance
-            mongodb_connector: MongoDBConnector instance
+            mongodb_connector: MongoDBConnector instance (dosyaya aktarımda None olabilir)
             config: Migration konfigürasyonu
+            profiler: Tablo aktarımlarını profillemek için MigrationProfiler (opsiyonel)
+            worker_budget: Birden fazla migrator arasında paylaşılan tablo worker
+                bütçesi (çoklu kaynak aktarımında, opsiyonel)
         """
         self.sql_connector = sql_connector
         self.mongodb_connector = mongodb_connector
@@ -34,12 +67,47 @@ class DataMigrator:
         self.batch_size = config.get('batch_size', 1000)
         self.drop_existing = config.get('drop_existing', False)
         self.preserve_ids = config.get('preserve_ids', True)
+        self.verify = config.get('verify', False)
+        self.sample_validation = config.get('sample_validation', False)
+        self.reconcile_deletes = config.get('reconcile_deletes', False)
+        # YAML'da tırnaksız off değeri False olarak okunur
+        self.index_advisor = config.get('index_advisor') or 'off'
+        # tenant: çoklu kaynak aktarımında belgeler kaynak ismiyle etiketlenir
+        self.tenant = config.get('tenant')
+        self.tenant_field = config.get('tenant_field', '_tenant')
         self.db_type = sql_connector.db_type  # Veritabanı tipini al
+        self.progress: Optional[ProgressTracker] = None
+        self.profiler = profiler
+        # target: 'file' ise belgeler MongoDB yerine dosyalara yazılır
+        self.exporter = FileExporter(config) if config.get('target', 'mongodb') == 'file' else None
+        self.memory = MemoryGuard(config)
+        self.bulk_extractor = BulkExtractor(sql_connector, config)
+        self.selection = TableSelection(config)
+        self.lob = LobHandler(sql_connector, mongodb_connector, config)
+        # skip_unchanged: parmak izi değişmemiş tablolar tekrar çalıştırmada atlanır
+        self.fingerprints = TableFingerprints(sql_connector, mongodb_connector, self.selection, config)
+        # delta_upserts: satır hash'i değişmemiş belgeler tekrar yazılmaz
+        self.delta = DeltaFilter(mongodb_connector, config)
+        # table_options.collection_type: time-series / clustered hedef collection'lar
+        self.collections = CollectionTypes(mongodb_connector, config)
+        self._table_failures: Dict[str, int] = {}
+        self._lob_fingerprints: Dict[str, Dict[str, Any]] = {}
+        self.row_estimates: Dict[str, int] = {}
+        self.foreign_keys: Dict[str, List[Dict[str, Any]]] = {}
+        self.table_workers = config.get('table_workers', 1)
+        self.worker_budget = worker_budget
+        self._stats_lock = threading.Lock()
+        self._cancel = threading.Event()
         
         # Migration istatistikleri
         self.migration_stats = {
             'tables_migrated': 0,
+            'tables_skipped': 0,
             'total_documents': 0,
+            'failed_documents': 0,
+            'unchanged_documents': 0,
+            'table_metrics': {},
+            'tasks': {},
             'errors': [],
             'start_time': None,
             'end_time': None
@@ -51,33 +119,164 @@ class DataMigrator:
         
         Args:
             schema_info: Keşfedilen şema bilgileri
-            
+        
         Returns:
             dict: Migration istatistikleri
         """
+        tables = schema_info.get('tables', [])
+        columns_info = schema_info.get('columns', {})
+        primary_keys = schema_info.get('primary_keys', {})
+        scheduler = self._prepare_run(schema_info)
+        
+        def worker():
+            while not self._cancel.is_set():
+                table_name = scheduler.acquire()
+                if table_name is None:
+                    return
+                if self._cancel.is_set():
+                    # Beklerken iptal edildi; tablo başlatılmaz
+                    scheduler.release(table_name)
+                    return
+                try:
+                    self._run_table(
+                        table_name,
+                        columns_info.get(table_name, []),
+                        primary_keys.get(table_name, [])
+                    )
+                finally:
+                    scheduler.release(table_name)
+        
+        workers = min(self.table_workers, max(1, len(tables)))
+        # Worker'lar başlatılır; aynı anda çalışan tablo sayısını bellek sınırı belirler
+        self.memory.limit_workers(workers)
+        if workers <= 1:
+            worker()
+        else:
+            logger.info(f"{workers} tablo paralel aktarılacak")
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for future in [executor.submit(worker) for _ in range(workers)]:
+                    future.result()
+        
+        return self._finish_run(schema_info)
+    
+    def cancel(self):
+        """
+        Aktarımın iptalini ister. Çalışan tablolar o anki fetch parçasını
+        yazdıktan sonra durur, yeni tablo başlatılmaz; LOB aktarımları ve
+        export manifest'i yine tamamlanır.
+        """
+        if not self._cancel.is_set():
+            logger.warning("İptal istendi: çalışan batch'ler tamamlanıp aktarım durdurulacak")
+            self._cancel.set()
+    
+    @property
+    def cancelled(self) -> bool:
+        """
+        İptal istendiyse True döndürür.
+        """
+        return self._cancel.is_set()
+    
+    def _prepare_run(self, schema_info: Dict[str, Any]) -> TableScheduler:
+        """
+        Aktarım öncesi istatistikleri ve ilerleme izlemeyi başlatır, tablo zamanlayıcısını oluşturur.
+        
+        Args:
+            schema_info: Keşfedilen şema bilgileri
+        
+        Returns:
+            TableScheduler: Tablo zamanlayıcısı
+        """
         self.migration_stats['start_time'] = datetime.now()
         logger.info("Veri aktarımı başlatılıyor...")
         
         tables = schema_info.get('tables', [])
-        columns_info = schema_info.get('columns', {})
-        primary_keys = schema_info.get('primary_keys', {})
         
-        for table_name in tables:
-            try:
-                self._migrate_table(
-                    table_name,
-                    columns_info.get(table_name, []),
-                    primary_keys.get(table_name, [])
-                )
-                self.migration_stats['tables_migrated'] += 1
-            except Exception as e:
-                error_msg = f"{table_name} tablosu aktarım hatası: {str(e)}"
-                logger.error(error_msg)
-                self.migration_stats['errors'].append(error_msg)
+        # İlerleme izleme (tahmini satır sayıları istatistiklerden gelir)
+        self.row_estimates = schema_info.get('row_estimates', {})
+        self.foreign_keys = schema_info.get('foreign_keys', {})
+        self.progress = ProgressTracker(
+            self.config, {t: self.row_estimates.get(t, 0) for t in tables}
+        )
+        self.progress.start()
+        
+        # Tablolar FK bağımlılıklarına ve tahmini boyuta göre zamanlanır
+        scheduler = TableScheduler(
+            tables, self.row_estimates, schema_info.get('foreign_keys', {}),
+            self.config.get('respect_dependencies', True)
+        )
+        logger.info(f"Aktarım sırası: {', '.join(scheduler.plan())}")
+        return scheduler
+    
+    def _finish_run(self, schema_info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Tablo aktarımları bittikten sonra LOB aktarımlarını bekler, index,
+        uzlaştırma ve doğrulama adımlarını çalıştırır.
         
-        # Index'leri oluştur
-        self._create_indexes(schema_info)
+        Args:
+            schema_info: Keşfedilen şema bilgileri
         
+        Returns:
+            dict: Migration istatistikleri
+        """
+        if self.progress is not None:
+            self.progress.stop()
+        
+        if self.cancelled:
+            self.migration_stats['cancelled'] = True
+            for table_name in schema_info.get('tables', []):
+                self.migration_stats['tasks'].setdefault(table_name, {'status': 'not_started'})
+        
+        # Arka planda GridFS'e aktarılan büyük LOB değerleri beklenir
+        if self.lob.table_columns:
+            self.migration_stats['lob'] = self.lob.wait()
+            logger.info(f"GridFS: {self.migration_stats['lob']['files']} LOB aktarıldı "
+                        f"({self.migration_stats['lob']['bytes']} byte, "
+                        f"{self.migration_stats['lob']['failed']} hata)")
+            # LOB içeren tabloların parmak izleri tüm aktarımlar bitince kaydedilir
+            for table_name, fingerprint in self._lob_fingerprints.items():
+                if table_name not in self.lob.failed_tables:
+                    self.fingerprints.save(table_name, fingerprint)
+        
+        if self.exporter is not None:
+            # Dosyaya aktarımda index'ler ve doğrulama hedef yüklenirken yapılır;
+            # index tanımları manifest'e yazılır
+            manifest_path = self.exporter.write_manifest(schema_info, self.db_type)
+            self.migration_stats['export'] = {
+                'output_dir': self.exporter.output_dir,
+                'manifest': manifest_path,
+                'format': self.exporter.format,
+                'compression': self.exporter.compression,
+                'files': sum(len(t['files']) for t in self.exporter.tables.values())
+            }
+            if self.verify or self.sample_validation:
+                logger.warning("Dosyaya aktarım modunda doğrulama atlandı")
+        elif self.cancelled:
+            logger.warning("Aktarım iptal edildi: index, uzlaştırma ve doğrulama adımları atlandı")
+        else:
+            # Index'leri oluştur
+            self._create_indexes(schema_info)
+            
+            # Kaynakta silinmiş satırların belgelerini sil (doğrulamadan önce)
+            if self.reconcile_deletes:
+                reconciler = DeletionReconciler(self, self.config)
+                self.migration_stats['reconciliation'] = reconciler.reconcile_all(schema_info)
+            
+            # Kaynak ve hedefi karşılaştır
+            if self.verify:
+                verifier = MigrationVerifier(self, self.config)
+                self.migration_stats['verification'] = verifier.verify_all(schema_info)
+            
+            # Rastgele örneklerle alan bazında karşılaştır
+            if self.sample_validation:
+                validator = SampleValidator(self, self.config)
+                self.migration_stats['sample_validation'] = validator.validate_all(schema_info)
+        
+        # View ve rutin tanımlarından index önerileri (dosyaya aktarımda yalnızca rapor)
+        if self.index_advisor != 'off' and not self.cancelled:
+            advisor = IndexAdvisor(self, self.config)
+            self.migration_stats['index_advice'] = advisor.advise_all(schema_info)
+        
+        self.migration_stats['memory'] = self.memory.to_dict()
         self.migration_stats['end_time'] = datetime.now()
         duration = (self.migration_stats['end_time'] - 
                    self.migration_stats['start_time']).total_seconds()
@@ -89,8 +288,61 @@ class DataMigrator:
         
         return self.migration_stats
     
+    def _run_table(self, table_name: str, columns: List[Dict], primary_keys: List[str]):
+        """
+        Tek bir tabloyu metrik, ilerleme ve profil kaydıyla aktarır; hatayı
+        istatistiklere yazar.
+        
+        Args:
+            table_name: Tablo ismi
+            columns: Tablo kolon bilgileri
+            primary_keys: Primary key kolonları
+        """
+        metrics = TableMetrics(table_name)
+        task = {'status': 'running', 'started_at': datetime.now().isoformat(),
+                'worker': threading.current_thread().name}
+        self.migration_stats['tasks'][table_name] = task
+        if self.worker_budget is not None:
+            # Ortak bütçeden yer açılana kadar beklenir; bekleme süresi göreve sayılmaz
+            self.worker_budget.acquire()
+        # Bellek bütçesine yaklaşıldıysa çalışan tablolardan biri bitene kadar beklenir
+        self.memory.acquire_worker()
+        started = time.perf_counter()
+        self.progress.start_table(table_name)
+        try:
+            if self.profiler is not None:
+                with self.profiler.profile_table(table_name):
+                    skipped = self._migrate_table(table_name, columns, primary_keys, metrics)
+            else:
+                skipped = self._migrate_table(table_name, columns, primary_keys, metrics)
+            with self._stats_lock:
+                self.migration_stats['tables_migrated'] += 1
+            task['status'] = 'skipped' if skipped else 'ok'
+            self.progress.finish_table(table_name)
+        except MigrationCancelled:
+            logger.warning(f"{table_name} tablosu iptal edildi ({metrics.rows} satır yazıldı)")
+            task['status'] = 'cancelled'
+            self.progress.finish_table(table_name, failed=True)
+        except Exception as e:
+            error_msg = f"{table_name} tablosu aktarım hatası: {str(e)}"
+            logger.error(error_msg)
+            with self._stats_lock:
+                self.migration_stats['errors'].append(error_msg)
+            task['status'] = 'failed'
+            task['error'] = str(e)
+            self.progress.finish_table(table_name, failed=True)
+        finally:
+            task['duration'] = time.perf_counter() - started
+            task['rows'] = metrics.rows
+            self.migration_stats['table_metrics'][table_name] = metrics.to_dict()
+            self.memory.release_worker()
+            if self.worker_budget is not None:
+                self.worker_budget.release()
+    
     def _migrate_table(self, table_name: str, columns: List[Dict], 
-                      primary_keys: List[str]):
+                      primary_keys: List[str], metrics: TableMetrics,
+                      key_range: Optional[Tuple[str, Any, Any]] = None,
+                      abort: Optional[threading.Event] = None):
         """
         Tek bir tabloyu MongoDB'ye aktarır.
         
@@ -98,120 +350,393 @@ class DataMigrator:
             table_name: Aktarılacak tablo ismi
             columns: Tablo kolon bilgileri
             primary_keys: Primary key kolonları
-        """
-        logger.info(f"{table_name} tablosu aktarılıyor...")
+            metrics: Tablo performans metrikleri
+            key_range: Yalnızca bir PK aralığı aktarılacaksa (kolon, başlangıç, bitiş);
+                sınırlar None ise açık uçludur (dağıtık iş birimleri için)
+            abort: Set edildiğinde yalnızca bu tablonun aktarımını durduran event
+                (dağıtık modda kiralaması kaybedilen birimler için, opsiyonel)
         
+        Returns:
+            bool: Tablo değişmediği için atlandıysa True
+        """
         collection_name = table_name  # Collection ismi tablo ismiyle aynı
         
-        # Mevcut collection'ı sil (eğer drop_existing True ise)
-        if self.drop_existing and self.mongodb_connector.collection_exists(collection_name):
+        # Kolon projeksiyonu ve satır filtresi extraction sorgusuna eklenir
+        selected_columns = self.selection.columns(table_name, columns, primary_keys)
+        
+        # Kaynak değişmemişse tablo atlanır; parmak izi aktarım başlamadan alınır ki
+        # aktarım sırasında yapılan değişiklikler bir sonraki çalıştırmada yakalansın
+        fingerprint = None
+        if self.exporter is None and self.fingerprints.enabled and key_range is None:
+            fingerprint = self.fingerprints.compute(table_name, selected_columns)
+            if fingerprint is not None and self.fingerprints.is_unchanged(table_name, fingerprint):
+                logger.info(f"{table_name} tablosu son aktarımdan beri değişmemiş, atlanıyor")
+                with self._stats_lock:
+                    self.migration_stats['tables_skipped'] += 1
+                return True
+        
+        logger.info(f"{table_name} tablosu aktarılıyor...")
+        
+        # Mevcut collection'ı sil (eğer drop_existing True ise); aralık birimlerinde koordinatör siler
+        if (self.exporter is None and self.drop_existing and key_range is None
+                and self.mongodb_connector.collection_exists(collection_name)):
             self.mongodb_connector.drop_collection(collection_name)
             logger.info(f"Mevcut collection '{collection_name}' silindi")
         
-        # SQL'den verileri çek
+        # Time-series / clustered collection'lar yüklemeden önce oluşturulur
+        if self.exporter is None and key_range is None:
+            self._prepare_collection(table_name, selected_columns, primary_keys)
+        
+        # Batch boyutu tabloya özgü belge boyutu ve gecikmeye göre ayarlanır
+        batch_sizer = AdaptiveBatchSizer(self.config)
+        
+        # lob_mode: gridfs ise eşiği aşan LOB değerleri ana sorgudan çıkarılıp GridFS'e aktarılır
+        lob_columns = []
+        if self.exporter is None:
+            lob_columns = self.lob.lob_columns(table_name, selected_columns, primary_keys)
+        
+        # Büyük tablolar native bulk export ile, diğerleri server-side cursor
+        # ile parça parça okunur; bellekte aynı anda yalnızca bir parça tutulur
+        if (columns and not lob_columns and key_range is None
+                and self.bulk_extractor.should_use(self.row_estimates.get(table_name, 0))):
+            logger.info(f"{table_name}: bulk export ile çıkarılıyor")
+            chunks = self.bulk_extractor.read_table(
+                table_name, selected_columns, metrics, lambda: self.memory.fetch_size,
+                self.selection.where(table_name)
+            )
+        else:
+            chunks = self._stream_rows(table_name, selected_columns, metrics, lob_columns, key_range)
+        
+        layout = None
+        try:
+            for column_names, rows in chunks:
+                if layout is None:
+                    # LOB uzunluk kolonları sorgunun sonundadır ve belgeye yazılmaz
+                    data_columns = column_names[:len(column_names) - len(lob_columns)]
+                    layout = self._row_layout(data_columns, primary_keys)
+                metrics.record_rows(rows)
+                self._write_rows(collection_name, layout, rows, primary_keys, batch_sizer, metrics,
+                                 lob_columns)
+                del rows
+                self.memory.check()
+                # İptal yalnızca parça sınırında uygulanır; yazılmakta olan batch'ler tamamlanır
+                if self._cancel.is_set() or (abort is not None and abort.is_set()):
+                    raise MigrationCancelled(table_name)
+        finally:
+            # Cursor / bulk export dosyası erken çıkışta da kapatılır
+            chunks.close()
+            if self.exporter is not None:
+                self.exporter.close_table(collection_name)
+        
+        if metrics.rows == 0:
+            logger.warning(f"{table_name} tablosu boş, atlanıyor")
+        
+        # Yazılamayan belge varsa parmak izi kaydedilmez; tablo sonraki çalıştırmada tekrar aktarılır
+        if fingerprint is not None and not self._table_failures.get(collection_name):
+            if lob_columns:
+                self._lob_fingerprints[table_name] = fingerprint
+            else:
+                self.fingerprints.save(table_name, fingerprint)
+        return False
+    
+    def _prepare_collection(self, table_name: str, columns: List[Dict], primary_keys: List[str]):
+        """
+        table_options.collection_type tanımlı tablonun collection'ını oluşturur.
+        
+        Args:
+            table_name: Tablo ismi
+            columns: Seçilen kolon bilgileri
+            primary_keys: Primary key kolonları
+        """
+        spec = self.collections.resolve(table_name, columns, primary_keys,
+                                        self.foreign_keys.get(table_name, []))
+        if spec is not None:
+            self.collections.create(table_name, spec)
+    
+    def _stream_rows(self, table_name: str, columns: List[Dict], metrics: TableMetrics,
+                     lob_columns: Optional[List[str]] = None,
+                     key_range: Optional[Tuple[str, Any, Any]] = None
+                     ) -> Iterator[Tuple[List[str], List[Any]]]:
+        """
+        Tabloyu server-side cursor ile fetch boyutunda parçalar halinde okur.
+        
+        Args:
+            table_name: Tablo ismi
+            columns: Seçilen kolon bilgileri
+            metrics: Tablo performans metrikleri
+            lob_columns: GridFS'e aktarılacak LOB kolonları (opsiyonel)
+            key_range: Okunacak PK aralığı (kolon, başlangıç, bitiş) (opsiyonel)
+        
+        Yields:
+            tuple: (kolon isimleri, satırlar)
+        """
         engine = self.sql_connector.get_engine()
         if not engine:
             raise Exception("SQL engine bulunamadı")
         
-        # Tüm verileri çek
-        # Tablo ismini veritabanı tipine göre quote et
-        if self.db_type == 'mysql':
-            # MySQL için backtick kullan
-            quoted_table = f"`{table_name}`"
-        elif self.db_type == 'mssql':
-            # MSSQL için köşeli parantez kullan
-            quoted_table = f"[{table_name}]"
-        else:
-            quoted_table = table_name
+        quote = self.sql_connector.quote_identifier
+        select_list = '*'
+        if lob_columns:
+            select_list = self.lob.select_list(columns, lob_columns)
+        elif self.selection.is_projected(table_name):
+            select_list = ', '.join(quote(col['name']) for col in columns)
+        conditions = []
+        params = {}
+        if key_range is not None:
+            range_column, low, high = key_range
+            if low is not None:
+                conditions.append(f"{quote(range_column)} >= :range_low")
+                params['range_low'] = low
+            if high is not None:
+                conditions.append(f"{quote(range_column)} < :range_high")
+                params['range_high'] = high
+        query = (f"SELECT {select_list} FROM {quote(table_name)}"
+                 f"{self.selection.where_clause(table_name, *conditions)}")
         
         with engine.connect() as conn:
-            result = conn.execute(text(f"SELECT * FROM {quoted_table}"))
-            rows = result.fetchall()
-            column_names = list(result.keys())
+            with metrics.stage('extract'):
+                result = conn.execution_options(stream_results=True).execute(text(query), params)
+                column_names = list(result.keys())
+            
+            while True:
+                with metrics.stage('extract'):
+                    rows = result.fetchmany(self.memory.fetch_size)
+                if not rows:
+                    break
+                yield column_names, rows
+    
+    def _write_rows(self, collection_name: str, layout: RowLayout, rows: List[Any],
+                    primary_keys: List[str], batch_sizer: AdaptiveBatchSizer,
+                    metrics: TableMetrics, lob_columns: Optional[List[str]] = None):
+        """
+        Fetch parçasındaki satırları batch boyutunda dilimler halinde belgeye
+        çevirip yazar; belgeler yalnızca yazılacakları batch için oluşturulur.
         
-        if not rows:
-            logger.warning(f"{table_name} tablosu boş, atlanıyor")
-            return
+        Args:
+            collection_name: Collection ismi
+            layout: Tablonun satır düzeni
+            rows: Kolon sırasıyla SQL satırları
+            primary_keys: Primary key kolonları
+            batch_sizer: Tablo için batch boyutlandırıcı
+            metrics: Tablo performans metrikleri
+            lob_columns: GridFS'e aktarılacak LOB kolonları (opsiyonel)
+        """
+        start = 0
+        while start < len(rows):
+            # Batch boyutu her yazmadan sonra güncellenebildiği için her dilimde tekrar okunur
+            end = start + max(1, batch_sizer.batch_size)
+            with metrics.stage('convert'):
+                documents = layout.to_documents(rows[start:end], self._convert_value)
+                if lob_columns:
+                    self.lob.attach(collection_name, layout.column_names, primary_keys,
+                                    rows[start:end], documents)
+                self.collections.apply(collection_name, layout.column_names, rows[start:end], documents)
+            self._write_documents(collection_name, documents, primary_keys, batch_sizer, metrics)
+            start = end
+    
+    def _write_documents(self, collection_name: str, documents: List[Dict[str, Any]],
+                         primary_keys: List[str], batch_sizer: AdaptiveBatchSizer,
+                         metrics: TableMetrics):
+        """
+        Belgeleri upsert veya insert ile MongoDB'ye yazar.
         
-        # MongoDB belgelerine dönüştür
-        documents = []
-        for row in rows:
-            doc = {}
-            
-            # Row'u dict'e çevir (SQLAlchemy 2.0 uyumluluğu için)
-            row_dict = dict(row._mapping) if hasattr(row, '_mapping') else dict(zip(column_names, row))
-            
-            # Primary key'i _id olarak kullan (eğer preserve_ids True ise)
-            if self.preserve_ids and primary_keys:
-                if len(primary_keys) == 1:
-                    # Tek kolonlu PK
-                    doc['_id'] = self._convert_value(row_dict[primary_keys[0]])
-                else:
-                    # Composite PK - string olarak birleştir
-                    pk_value = '_'.join([str(row_dict[pk]) for pk in primary_keys])
-                    doc['_id'] = pk_value
-            
-            # Tüm kolonları ekle
-            for col_name in column_names:
-                # Primary key'i _id olarak kullandıysak, belge içinde de tut (None yerine gerçek değer)
-                if col_name in primary_keys and self.preserve_ids:
-                    # Primary key değerini belge içinde de sakla
-                    doc[col_name] = self._convert_value(row_dict[col_name])
-                elif col_name not in primary_keys:
-                    value = row_dict[col_name]
-                    doc[col_name] = self._convert_value(value)
-            
-            documents.append(doc)
+        Args:
+            collection_name: Collection ismi
+            documents: Yazılacak belgeler
+            primary_keys: Primary key kolonları
+            batch_sizer: Tablo için batch boyutlandırıcı
+            metrics: Tablo performans metrikleri
+        """
+        if self.exporter is not None:
+            self._export_documents(collection_name, documents, metrics)
+            return
         
-        # MongoDB'ye ekle (upsert kullanarak idempotent yap)
-        if self.preserve_ids and primary_keys:
+        # MongoDB'ye ekle (upsert kullanarak idempotent yap); time-series
+        # collection'lar upsert desteklemez, her aktarımda yeniden oluşturulur
+        if (self.preserve_ids and primary_keys
+                and self.collections.kind(collection_name) != 'timeseries'):
             # Upsert kullan (idempotent)
-            self._upsert_documents(collection_name, documents)
+            self._upsert_documents(collection_name, documents, batch_sizer, metrics)
         else:
             # Normal insert
-            inserted = self.mongodb_connector.insert_documents(
-                collection_name, documents, self.batch_size
-            )
-            self.migration_stats['total_documents'] += inserted
+            with metrics.stage('convert'):
+                sizes = [batch_sizer.estimate_size(doc) for doc in documents]
+                operations = [InsertOne(doc) for doc in documents]
+            self._write_operations(collection_name, operations, sizes, batch_sizer, metrics,
+                                   payloads=documents)
+    
+    def _convert_rows(self, rows: List[Any], column_names: List[str],
+                      primary_keys: List[str]) -> List[Dict[str, Any]]:
+        """
+        SQL satırlarını MongoDB belgelerine dönüştürür.
+        
+        Args:
+            rows: SQL satırları
+            column_names: Sorgu kolonları
+            primary_keys: Primary key kolonları
+        
+        Returns:
+            list: MongoDB belgeleri
+        """
+        layout = self._row_layout(column_names, primary_keys)
+        return layout.to_documents(rows, self._convert_value)
+    
+    def _row_layout(self, column_names: List[str], primary_keys: List[str]) -> RowLayout:
+        """
+        Tablonun satır düzenini migrator ayarlarıyla oluşturur.
+        
+        Args:
+            column_names: Sorgu kolonları
+            primary_keys: Primary key kolonları
+        
+        Returns:
+            RowLayout: Satır düzeni
+        """
+        return RowLayout(column_names, primary_keys, self.preserve_ids,
+                         self.tenant_field if self.tenant else None, self.tenant)
+    
+    def _build_document(self, row_dict: Dict[str, Any], column_names: List[str],
+                        primary_keys: List[str]) -> Dict[str, Any]:
+        """
+        Kolon isimlerine göre verilmiş tek bir SQL satırını MongoDB belgesine dönüştürür.
+        
+        Args:
+            row_dict: Kolon isimlerine göre satır değerleri
+            column_names: Tablo kolonları
+            primary_keys: Primary key kolonları
+        
+        Returns:
+            dict: MongoDB belgesi
+        """
+        layout = self._row_layout(column_names, primary_keys)
+        return layout.to_document([row_dict[name] for name in column_names], self._convert_value)
+    
+    def _export_documents(self, collection_name: str, documents: List[Dict[str, Any]],
+                          metrics: TableMetrics):
+        """
+        Belgeleri MongoDB yerine dışa aktarım dosyalarına yazar.
+        
+        Args:
+            collection_name: Collection ismi
+            documents: Yazılacak belgeler
+            metrics: Tablo performans metrikleri
+        """
+        started = time.perf_counter()
+        written = self.exporter.write_documents(collection_name, documents)
+        metrics.record_batch(time.perf_counter() - started, written)
+        if self.progress is not None:
+            self.progress.advance(collection_name, len(documents))
+        with self._stats_lock:
+            self.migration_stats['total_documents'] += len(documents)
     
-    def _upsert_documents(self, collection_name: str, documents: List[Dict[str, Any]]):
+    def _upsert_documents(self, collection_name: str, documents: List[Dict[str, Any]],
+                          batch_sizer: AdaptiveBatchSizer, metrics: TableMetrics):
         """
         Belgeleri upsert eder (idempotent çalışma için).
         
         Args:
             collection_name: Collection ismi
             documents: Upsert edilecek belgeler
+            batch_sizer: Tablo için batch boyutlandırıcı
+            metrics: Tablo performans metrikleri
         """
         collection = self.mongodb_connector.get_collection(collection_name)
         if collection is None:
             return
         
+        if self.delta.enabled:
+            with metrics.stage('convert'):
+                documents, unchanged = self.delta.filter(collection_name, documents)
+            if unchanged:
+                with self._stats_lock:
+                    self.migration_stats['unchanged_documents'] += unchanged
+                if self.progress is not None:
+                    self.progress.advance(collection_name, unchanged)
+        
         operations = []
-        for doc in documents:
-            # _id'yi al
-            doc_id = doc.pop('_id', None)
-            if doc_id is not None:
-                # Upsert operation
-                operations.append(
-                    UpdateOne(
-                        {'_id': doc_id},
-                        {'$set': doc},
-                        upsert=True
+        sizes = []
+        # Yazılamayan operasyonlar dead-letter'a filtre ve güncellemesiyle kaydedilir
+        payloads = []
+        with metrics.stage('convert'):
+            for doc in documents:
+                sizes.append(batch_sizer.estimate_size(doc))
+                # _id'yi al
+                doc_id = doc.pop('_id', None)
+                if doc_id is not None:
+                    # Upsert operation
+                    operations.append(
+                        UpdateOne(
+                            {'_id': doc_id},
+                            {'$set': doc},
+                            upsert=True
+                        )
                     )
-                )
-            else:
-                # _id yoksa normal insert
-                operations.append(UpdateOne({}, {'$set': doc}, upsert=False))
+                    payloads.append({'q': {'_id': doc_id}, 'u': {'$set': doc}, 'upsert': True})
+                else:
+                    # _id yoksa normal insert
+                    operations.append(UpdateOne({}, {'$set': doc}, upsert=False))
+                    payloads.append({'q': {}, 'u': {'$set': doc}, 'upsert': False})
         
         # Batch halinde çalıştır
         if operations:
-            for i in range(0, len(operations), self.batch_size):
-                batch = operations[i:i + self.batch_size]
-                result = collection.bulk_write(batch, ordered=False)
-                self.migration_stats['total_documents'] += (
-                    result.inserted_count + result.modified_count + result.upserted_count
+            self._write_operations(collection_name, operations, sizes, batch_sizer, metrics,
+                                   payloads)
+    
+    def _write_operations(self, collection_name: str, operations: List[Any],
+                          sizes: List[int], batch_sizer: AdaptiveBatchSizer,
+                          metrics: TableMetrics, payloads: Optional[List[Any]] = None):
+        """
+        Operasyonları adaptif batch'ler halinde yazar ve gecikmeyi batch
+        boyutlandırıcıya ve metriklere geri bildirir.
+        
+        Args:
+            collection_name: Collection ismi
+            operations: Bulk write operasyonları
+            sizes: Operasyonların tahmini byte boyutları
+            batch_sizer: Tablo için batch boyutlandırıcı
+            metrics: Tablo performans metrikleri
+            payloads: Operasyonlarla aynı sırada dead-letter kayıtları (opsiyonel)
+        """
+        processed = 0
+        for batch, batch_bytes in batch_sizer.split(operations, sizes):
+            started = time.perf_counter()
+            counts = self.mongodb_connector.bulk_write_operations(
+                collection_name, batch, len(batch),
+                payloads[processed:processed + len(batch)] if payloads is not None else None
+            )
+            elapsed = time.perf_counter() - started
+            batch_sizer.record(len(batch), elapsed)
+            metrics.record_batch(elapsed, batch_bytes)
+            if self.progress is not None:
+                self.progress.advance(collection_name, len(batch))
+            self._record_write_counts(collection_name, counts)
+            processed += len(batch)
+            logger.debug(f"{collection_name}: {processed}/{len(operations)} belge işlendi")
+    
+    def _record_write_counts(self, collection_name: str, counts: Dict[str, int]):
+        """
+        Bulk write sonuçlarını migration istatistiklerine ekler.
+        
+        Args:
+            collection_name: Collection ismi
+            counts: bulk_write_operations sonucu
+        """
+        with self._stats_lock:
+            # matched, değişmeden tekrar upsert edilen belgeleri de kapsar
+            self.migration_stats['total_documents'] += (
+                counts['inserted'] + counts['matched'] + counts['upserted']
+            )
+            if counts['failed']:
+                self.migration_stats['failed_documents'] += counts['failed']
+                self._table_failures[collection_name] = (
+                    self._table_failures.get(collection_name, 0) + counts['failed']
                 )
-                logger.debug(f"{collection_name}: {i + len(batch)}/{len(operations)} belge işlendi")
+        if counts['failed']:
+            error_msg = (f"{collection_name}: {counts['failed']} belge yazılamadı "
+                         f"(dead-letter kayıtlarına bakın)")
+            logger.warning(error_msg)
+            with self._stats_lock:
+                self.migration_stats['errors'].append(error_msg)
     
     def _convert_value(self, value: Any) -> Any:
         """
@@ -219,7 +744,7 @@ class DataMigrator:
         
         Args:
             value: Dönüştürülecek değer
-            
+        
         Returns:
             MongoDB uyumlu değer
         """
@@ -261,12 +786,13 @@ class DataMigrator:
         indexes_info = schema_info.get('indexes', {})
         primary_keys = schema_info.get('primary_keys', {})
         
-        # Primary key index'lerini oluştur
+        # Primary key index'lerini oluştur; time-series collection'lar unique index
+        # desteklemez, clustered collection'larda _id kümeleme anahtarı PK'dir
         for table_name, pk_columns in primary_keys.items():
-            if pk_columns:
+            if pk_columns and self.collections.kind(table_name) is None:
                 collection_name = table_name
                 self.mongodb_connector.create_index(
-                    collection_name, pk_columns, unique=True
+                    collection_name, self._index_fields(pk_columns), unique=True
                 )
         
         # Diğer index'leri oluştur
@@ -274,14 +800,29 @@ class DataMigrator:
             collection_name = table_name
             for index in indexes:
                 index_fields = index.get('columns', [])
-                unique = index.get('unique', False)
+                unique = index.get('unique', False) and self.collections.kind(table_name) != 'timeseries'
                 if index_fields:
                     self.mongodb_connector.create_index(
-                        collection_name, index_fields, unique=unique
+                        collection_name, self._index_fields(index_fields), unique=unique
                     )
         
         logger.info("Index oluşturma tamamlandı")
     
+    def _index_fields(self, fields: List[str]) -> List[str]:
+        """
+        Index alanlarını döndürür; ortak collection'larda tenant alanı başa eklenir
+        (unique index'ler tenant başına geçerli olur).
+        
+        Args:
+            fields: Kaynak index kolonları
+        
+        Returns:
+            list: MongoDB index alanları
+        """
+        if self.tenant:
+            return [self.tenant_field] + list(fields)
+        return fields
+    
     def get_migration_stats(self) -> Dict[str, Any]:
         """
         Migration istatistiklerini döndürür.
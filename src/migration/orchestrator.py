@@ -0,0 +1,195 @@
+"""
+Async Orchestration Module
+Şema keşfini ve tablo aktarımlarını asyncio görevleri olarak çalıştırır.
+Bloklayan SQL ve MongoDB çağrıları executor thread'lerinde yürür; event loop
+eşzamanlılık sınırını, iptal sinyallerini ve görev sonuçlarını yönetir.
+"""
+
+import asyncio
+import logging
+import signal
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+ORCHESTRATORS = ('threads', 'asyncio')
+
+# Inspector'ı paylaşan adımlar tek thread'de sırayla, bağımsız sorgu adımları paralel çalışır
+INSPECTOR_STEPS = ('tables', 'columns', 'primary_keys', 'foreign_keys', 'indexes', 'views')
+QUERY_STEPS = ('constraints', 'triggers', 'stored_procedures', 'functions', 'row_estimates')
+
+
+class AsyncOrchestrator:
+    """
+    Asyncio orkestrasyon sınıfı.
+    İlk SIGINT/SIGTERM aktarımı kooperatif olarak iptal eder: çalışan
+    tablolar o anki parçayı yazıp durur, export manifest'i ve LOB
+    aktarımları tamamlanır. İkinci sinyal varsayılan davranışa döner
+    (KeyboardInterrupt / sonlandırma).
+    """
+    
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Orkestratörü başlatır.
+        
+        Args:
+            config: Migration konfigürasyonu
+        """
+        self.max_concurrency = max(1, config.get('table_workers', 1))
+        self.stats: Dict[str, Any] = {'mode': 'asyncio'}
+        self.cancelled = False
+        self._cancel_callbacks: List[Any] = []
+    
+    def run_discovery(self, discovery) -> Dict[str, Any]:
+        """
+        Şema keşfini çalıştırır (senkron giriş noktası).
+        
+        Args:
+            discovery: SchemaDiscovery instance
+        
+        Returns:
+            dict: Keşfedilen şema bilgileri
+        """
+        return asyncio.run(self._with_signals(self.discover(discovery)))
+    
+    def run_migration(self, migrator, schema_info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Tablo aktarımlarını çalıştırır (senkron giriş noktası).
+        
+        Args:
+            migrator: DataMigrator instance
+            schema_info: Keşfedilen şema bilgileri
+        
+        Returns:
+            dict: Migration istatistikleri
+        """
+        self._cancel_callbacks.append(migrator.cancel)
+        return asyncio.run(self._with_signals(self.migrate(migrator, schema_info)))
+    
+    async def discover(self, discovery) -> Dict[str, Any]:
+        """
+        Keşif adımlarını paralel çalıştırır. Sonuç SchemaDiscovery.discover_all ile aynıdır.
+        
+        Args:
+            discovery: SchemaDiscovery instance
+        
+        Returns:
+            dict: Keşfedilen şema bilgileri
+        """
+        logger.info("Veritabanı şeması keşfediliyor (paralel)...")
+        started = time.perf_counter()
+        
+        def inspector_steps() -> Dict[str, Any]:
+            return {step: getattr(discovery, f"discover_{step}")() for step in INSPECTOR_STEPS}
+        
+        results = await asyncio.gather(
+            asyncio.to_thread(inspector_steps),
+            *(asyncio.to_thread(getattr(discovery, f"discover_{step}")) for step in QUERY_STEPS)
+        )
+        found = dict(results[0])
+        found.update(zip(QUERY_STEPS, results[1:]))
+        
+        # Anahtar sırası discover_all ile aynı tutulur
+        discovery.schema_info = {
+            key: found[key] for key in (
+                'tables', 'columns', 'primary_keys', 'foreign_keys', 'indexes', 'constraints',
+                'triggers', 'stored_procedures', 'functions', 'views', 'row_estimates'
+            )
+        }
+        self.stats['discovery_seconds'] = time.perf_counter() - started
+        logger.info(f"Şema keşfi tamamlandı ({self.stats['discovery_seconds']:.2f} sn)")
+        return discovery.schema_info
+    
+    async def migrate(self, migrator, schema_info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Tabloları eşzamanlılık sınırı içinde asyncio görevleri olarak aktarır.
+        
+        Args:
+            migrator: DataMigrator instance
+            schema_info: Keşfedilen şema bilgileri
+        
+        Returns:
+            dict: Migration istatistikleri (görev sonuçları 'tasks' altında)
+        """
+        loop = asyncio.get_running_loop()
+        tables = schema_info.get('tables', [])
+        columns_info = schema_info.get('columns', {})
+        primary_keys = schema_info.get('primary_keys', {})
+        
+        scheduler = migrator._prepare_run(schema_info)
+        workers = min(self.max_concurrency, max(1, len(tables)))
+        # Aynı anda çalışan tablo sayısını bellek sınırı tablolar arasında günceller
+        migrator.memory.limit_workers(workers)
+        self.stats['concurrency'] = workers
+        logger.info(f"Asyncio orkestrasyonu: en fazla {workers} tablo eşzamanlı aktarılacak")
+        
+        def next_table() -> Optional[str]:
+            table_name = scheduler.acquire()
+            if table_name is not None and migrator.cancelled:
+                # Beklerken iptal edildi; tablo başlatılmaz
+                scheduler.release(table_name)
+                return None
+            return table_name
+        
+        def run_table(table_name: str):
+            try:
+                migrator._run_table(
+                    table_name,
+                    columns_info.get(table_name, []),
+                    primary_keys.get(table_name, [])
+                )
+            finally:
+                scheduler.release(table_name)
+        
+        async def worker():
+            while not migrator.cancelled:
+                table_name = await loop.run_in_executor(executor, next_table)
+                if table_name is None:
+                    return
+                await loop.run_in_executor(executor, run_table, table_name)
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='table') as executor:
+            await asyncio.gather(*(worker() for _ in range(workers)))
+        
+        stats = await asyncio.to_thread(migrator._finish_run, schema_info)
+        stats['orchestrator'] = self.stats
+        return stats
+    
+    async def _with_signals(self, coroutine):
+        """
+        Coroutine'i iptal sinyali handler'ları kurulu olarak çalıştırır.
+        
+        Args:
+            coroutine: Çalıştırılacak coroutine
+        
+        Returns:
+            Coroutine'in sonucu
+        """
+        loop = asyncio.get_running_loop()
+        installed = []
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self._on_signal, loop, sig)
+                installed.append(sig)
+            except (NotImplementedError, RuntimeError):
+                # Windows'ta loop sinyal handler'ı desteklenmez; KeyboardInterrupt geçerli kalır
+                pass
+        try:
+            return await coroutine
+        finally:
+            for sig in installed:
+                loop.remove_signal_handler(sig)
+    
+    def _on_signal(self, loop, sig):
+        """
+        İlk sinyalde kooperatif iptali başlatır; handler kaldırıldığı için
+        ikinci sinyal varsayılan davranışla işlenir.
+        """
+        logger.warning(f"{signal.Signals(sig).name} alındı; tekrar gönderilirse süreç hemen sonlanır")
+        loop.remove_signal_handler(sig)
+        self.cancelled = True
+        self.stats['cancelled_by'] = signal.Signals(sig).name
+        for callback in self._cancel_callbacks:
+            callback()
@@ -0,0 +1,185 @@
+"""
+Profiling Module
+Migration hot path'ini (tablo aktarımı, dönüşüm döngüsü, bulk_write) tablo
+bazında profiller ve flame graph araçlarıyla uyumlu collapsed stack çıktısı üretir.
+"""
+
+import cProfile
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+PROFILE_MODES = ('sampling', 'cprofile')
+
+# Python 3.12+ aynı anda yalnızca bir cProfile'ın etkin olmasına izin verir
+_CPROFILE_LOCK = threading.Lock()
+
+
+class MigrationProfiler:
+    """
+    Profiling sınıfı.
+    'sampling' modunda aktarım thread'inin stack'ini belirli aralıklarla
+    örnekler; 'cprofile' modunda cProfile çalıştırıp .prof dosyası ve
+    caller;callee çiftlerinden collapsed stack çıktısı üretir.
+    cProfile modunda tablolar sırayla profillenir (aynı anda tek profiler);
+    bu modda table_workers 1'e düşürülür.
+    """
+    
+    def __init__(self, output_dir: str, mode: str = 'sampling', interval: float = 0.005):
+        """
+        Profiler'ı başlatır.
+        
+        Args:
+            output_dir: Profil çıktılarının kaydedileceği ana dizin (rapor dizini)
+            mode: 'sampling' veya 'cprofile'
+            interval: Sampling aralığı (saniye)
+        """
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Desteklenmeyen profil modu: {mode}")
+        self.mode = mode
+        self.interval = interval
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.output_dir = os.path.join(output_dir, 'profiles', timestamp)
+        os.makedirs(self.output_dir, exist_ok=True)
+    
+    @contextmanager
+    def profile_table(self, table_name: str) -> Iterator[None]:
+        """
+        Bir tablonun aktarımını profiller ve çıktıyı tablo ismiyle kaydeder.
+        
+        Args:
+            table_name: Tablo ismi
+        """
+        if self.mode == 'cprofile':
+            with _CPROFILE_LOCK:
+                profile = cProfile.Profile()
+                profile.enable()
+                try:
+                    yield
+                finally:
+                    profile.disable()
+                    self._write_cprofile_output(table_name, profile)
+        else:
+            sampler = _StackSampler(threading.get_ident(), self.interval)
+            sampler.start()
+            try:
+                yield
+            finally:
+                sampler.stop()
+                self._write_collapsed(table_name, sampler.stacks)
+    
+    def _write_cprofile_output(self, table_name: str, profile: cProfile.Profile):
+        """
+        cProfile sonucunu .prof ve collapsed stack olarak kaydeder.
+        
+        cProfile tam stack tutmadığından collapsed çıktı iki seviyelidir
+        (caller;callee), değer olarak callee'nin o caller altındaki öz süresi
+        (mikrosaniye) kullanılır.
+        
+        Args:
+            table_name: Tablo ismi
+            profile: Tamamlanmış cProfile
+        """
+        prof_path = os.path.join(self.output_dir, f"{table_name}.prof")
+        profile.dump_stats(prof_path)
+        
+        stacks = Counter()
+        stats = pstats.Stats(profile).stats
+        for func, (_cc, _nc, tottime, _cumtime, callers) in stats.items():
+            if not callers:
+                stacks[_format_function(func)] += int(tottime * 1_000_000)
+                continue
+            for caller, caller_stats in callers.items():
+                caller_tottime = caller_stats[2]
+                stacks[f"{_format_function(caller)};{_format_function(func)}"] += int(caller_tottime * 1_000_000)
+        
+        self._write_collapsed(table_name, stacks)
+        logger.info(f"{table_name}: cProfile çıktısı kaydedildi: {prof_path}")
+    
+    def _write_collapsed(self, table_name: str, stacks: Counter):
+        """
+        Collapsed stack dosyasını yazar (flamegraph.pl / speedscope uyumlu).
+        
+        Args:
+            table_name: Tablo ismi
+            stacks: Stack → örnek sayısı (veya mikrosaniye)
+        """
+        path = os.path.join(self.output_dir, f"{table_name}.collapsed")
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, value in stacks.most_common():
+                if value > 0:
+                    f.write(f"{stack} {value}\n")
+        logger.info(f"{table_name}: profil kaydedildi: {path}")
+
+
+class _StackSampler:
+    """
+    Hedef thread'in stack'ini arka plan thread'inden örnekleyen basit sampling profiler.
+    """
+    
+    def __init__(self, thread_id: int, interval: float):
+        """
+        Sampler'ı başlatır.
+        
+        Args:
+            thread_id: Örneklenecek thread
+            interval: Örnekleme aralığı (saniye)
+        """
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+    
+    def start(self):
+        """
+        Örneklemeyi başlatır.
+        """
+        self._thread.start()
+    
+    def stop(self):
+        """
+        Örneklemeyi durdurur ve thread'in bitmesini bekler.
+        """
+        self._stop.set()
+        self._thread.join()
+    
+    def _run(self):
+        """
+        Durdurulana kadar hedef thread'in stack'ini kaydeder.
+        """
+        while not self._stop.is_set():
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                frames = []
+                while frame is not None:
+                    code = frame.f_code
+                    frames.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                self.stacks[';'.join(reversed(frames))] += 1
+            time.sleep(self.interval)
+
+
+def _format_function(func: tuple) -> str:
+    """
+    pstats fonksiyon anahtarını collapsed stack çerçevesine çevirir.
+    
+    Args:
+        func: (dosya, satır, fonksiyon ismi)
+    
+    Returns:
+        str: Çerçeve ismi
+    """
+    filename, line, name = func
+    if filename == '~':
+        return name
+    return f"{name} ({os.path.basename(filename)}:{line})"
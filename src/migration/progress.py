@@ -0,0 +1,336 @@
+"""
+Progress Tracking Module
+Uzun migration'lar sırasında tablo bazında ilerleme, ETA ve throughput izler.
+Durumu konsola, JSON status dosyasına ve isteğe bağlı olarak Prometheus
+formatında bir HTTP endpoint'ine yayınlar.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Anlık throughput hesabı için kullanılan pencere (saniye)
+RATE_WINDOW_SECONDS = 30
+
+
+class _RateWindow:
+    """
+    Son N saniyedeki (zaman, toplam satır) örneklerinden rolling rows/s hesaplar.
+    """
+    
+    def __init__(self):
+        self.samples = deque()
+    
+    def add(self, now: float, total: int):
+        """
+        Yeni bir örnek ekler ve pencere dışına düşenleri atar.
+        
+        Args:
+            now: Zaman damgası
+            total: O ana kadar tamamlanan toplam satır
+        """
+        self.samples.append((now, total))
+        while len(self.samples) > 2 and now - self.samples[0][0] > RATE_WINDOW_SECONDS:
+            self.samples.popleft()
+    
+    def rate(self) -> float:
+        """
+        Pencere içindeki ortalama rows/s değerini döndürür.
+        
+        Returns:
+            float: Satır/saniye
+        """
+        if len(self.samples) < 2:
+            return 0.0
+        (start, first), (end, last) = self.samples[0], self.samples[-1]
+        return (last - first) / (end - start) if end > start else 0.0
+
+
+class ProgressTracker:
+    """
+    İlerleme izleme sınıfı.
+    Tablo başına tahmini satır sayısını ve tamamlanan satırları tutar;
+    belirli aralıklarla ilerleme durumunu yayınlar. Thread-safe'tir.
+    """
+    
+    def __init__(self, config: Dict[str, Any], row_estimates: Dict[str, int]):
+        """
+        İlerleme izleyiciyi başlatır.
+        
+        Args:
+            config: Migration konfigürasyonu
+            row_estimates: Tablo isimlerine göre tahmini satır sayıları
+        """
+        self.interval = config.get('progress_interval', 10)
+        self.status_file = config.get('progress_status_file', '')
+        self.http_port = config.get('progress_http_port', 0)
+        
+        self._lock = threading.Lock()
+        # Yayınlar (throttle kontrolü ve status dosyası yazımı) ayrı kilitle sıralanır
+        self._publish_lock = threading.Lock()
+        self._tables: Dict[str, Dict[str, Any]] = {
+            name: {'estimated': int(rows), 'done': 0, 'status': 'pending'}
+            for name, rows in row_estimates.items()
+        }
+        self._table_rates: Dict[str, _RateWindow] = {}
+        self._overall_rate = _RateWindow()
+        self._started = time.time()
+        self._last_publish = 0.0
+        self._server: Optional[ThreadingHTTPServer] = None
+    
+    def start(self):
+        """
+        İzlemeyi başlatır; yapılandırılmışsa HTTP metrics endpoint'ini açar.
+        """
+        self._started = time.time()
+        self._overall_rate.add(self._started, 0)
+        if self.http_port:
+            self._start_http_server()
+        self._publish(force=True)
+    
+    def stop(self):
+        """
+        Son durumu yayınlar ve HTTP endpoint'ini kapatır.
+        """
+        self._publish(force=True)
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+    
+    def start_table(self, table_name: str):
+        """
+        Tablonun aktarımının başladığını işaretler.
+        
+        Args:
+            table_name: Tablo ismi
+        """
+        with self._lock:
+            table = self._tables.setdefault(
+                table_name, {'estimated': 0, 'done': 0, 'status': 'pending'}
+            )
+            table['status'] = 'running'
+            table['started'] = time.time()
+            self._table_rates[table_name] = _RateWindow()
+            self._table_rates[table_name].add(table['started'], 0)
+    
+    def advance(self, table_name: str, rows: int):
+        """
+        Tablo için tamamlanan satır sayısını artırır.
+        
+        Args:
+            table_name: Tablo ismi
+            rows: Yeni tamamlanan satır sayısı
+        """
+        now = time.time()
+        with self._lock:
+            table = self._tables[table_name]
+            table['done'] += rows
+            # İstatistikler eskiyse tahmini yukarı çek
+            table['estimated'] = max(table['estimated'], table['done'])
+            self._table_rates[table_name].add(now, table['done'])
+            self._overall_rate.add(now, self._total_done())
+        self._publish()
+    
+    def finish_table(self, table_name: str, failed: bool = False):
+        """
+        Tablonun aktarımının bittiğini işaretler.
+        
+        Args:
+            table_name: Tablo ismi
+            failed: Tablo hata ile bittiyse True
+        """
+        with self._lock:
+            table = self._tables.setdefault(
+                table_name, {'estimated': 0, 'done': 0, 'status': 'pending'}
+            )
+            table['status'] = 'failed' if failed else 'done'
+            if not failed:
+                # Tamamlanan tablonun kalan tahmini sıfırlanır
+                table['estimated'] = table['done']
+        self._publish(force=True)
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Anlık ilerleme durumunu döndürür.
+        
+        Returns:
+            dict: Genel ve tablo bazında ilerleme bilgileri
+        """
+        with self._lock:
+            tables = {}
+            for name, table in self._tables.items():
+                rate_window = self._table_rates.get(name)
+                rate = rate_window.rate() if rate_window and table['status'] == 'running' else 0.0
+                remaining = max(table['estimated'] - table['done'], 0)
+                tables[name] = {
+                    'status': table['status'],
+                    'estimated_rows': table['estimated'],
+                    'rows_done': table['done'],
+                    'percent': _percent(table['done'], table['estimated']),
+                    'rows_per_second': rate,
+                    'eta_seconds': remaining / rate if rate > 0 else None
+                }
+            
+            total_done = self._total_done()
+            total_estimated = sum(t['estimated'] for t in self._tables.values())
+            rate = self._overall_rate.rate()
+            remaining = max(total_estimated - total_done, 0)
+            return {
+                'updated_at': time.time(),
+                'elapsed_seconds': time.time() - self._started,
+                'estimated_rows': total_estimated,
+                'rows_done': total_done,
+                'percent': _percent(total_done, total_estimated),
+                'rows_per_second': rate,
+                'eta_seconds': remaining / rate if rate > 0 else None,
+                'tables': tables
+            }
+    
+    def render_prometheus(self) -> str:
+        """
+        İlerleme durumunu Prometheus text formatında döndürür.
+        
+        Returns:
+            str: Prometheus metrikleri
+        """
+        snapshot = self.snapshot()
+        lines = [
+            "# HELP migration_rows_done Rows written to MongoDB.",
+            "# TYPE migration_rows_done gauge",
+        ]
+        for name, table in snapshot['tables'].items():
+            lines.append(f'migration_rows_done{{table="{name}"}} {table["rows_done"]}')
+        lines += [
+            "# HELP migration_rows_estimated Estimated source rows.",
+            "# TYPE migration_rows_estimated gauge",
+        ]
+        for name, table in snapshot['tables'].items():
+            lines.append(f'migration_rows_estimated{{table="{name}"}} {table["estimated_rows"]}')
+        lines += [
+            "# HELP migration_rows_per_second Rolling write throughput.",
+            "# TYPE migration_rows_per_second gauge",
+        ]
+        for name, table in snapshot['tables'].items():
+            lines.append(f'migration_rows_per_second{{table="{name}"}} {table["rows_per_second"]:.2f}')
+        lines += [
+            "# HELP migration_eta_seconds Estimated seconds until the migration finishes.",
+            "# TYPE migration_eta_seconds gauge",
+            f"migration_eta_seconds {snapshot['eta_seconds'] if snapshot['eta_seconds'] is not None else 'NaN'}",
+            "# HELP migration_total_rows_per_second Rolling overall write throughput.",
+            "# TYPE migration_total_rows_per_second gauge",
+            f"migration_total_rows_per_second {snapshot['rows_per_second']:.2f}",
+        ]
+        return "\n".join(lines) + "\n"
+    
+    def _total_done(self) -> int:
+        """
+        Tüm tablolarda tamamlanan satır sayısını döndürür (kilit altında çağrılır).
+        
+        Returns:
+            int: Toplam satır
+        """
+        return sum(t['done'] for t in self._tables.values())
+    
+    def _publish(self, force: bool = False):
+        """
+        Aralık dolduysa ilerlemeyi loglar ve status dosyasını günceller.
+        
+        Args:
+            force: True ise aralık beklenmeden yayınlanır
+        """
+        with self._publish_lock:
+            now = time.time()
+            if not force and now - self._last_publish < self.interval:
+                return
+            self._last_publish = now
+            
+            snapshot = self.snapshot()
+            eta = snapshot['eta_seconds']
+            eta_str = _format_duration(eta) if eta is not None else "?"
+            logger.info(f"İlerleme: {snapshot['rows_done']}/{snapshot['estimated_rows']} satır "
+                        f"(%{snapshot['percent']:.1f}), {snapshot['rows_per_second']:.0f} satır/sn, "
+                        f"ETA: {eta_str}")
+            
+            if self.status_file:
+                self._write_status_file(snapshot)
+    
+    def _write_status_file(self, snapshot: Dict[str, Any]):
+        """
+        Status dosyasını aynı dizindeki benzersiz bir geçici dosya üzerinden
+        atomik olarak yazar (yarım okunmaması için). _publish_lock altında çağrılır.
+        
+        Args:
+            snapshot: İlerleme durumu
+        """
+        tmp_path = None
+        try:
+            status_dir = os.path.dirname(self.status_file)
+            if status_dir:
+                os.makedirs(status_dir, exist_ok=True)
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=status_dir or '.',
+                                             prefix=os.path.basename(self.status_file) + '.',
+                                             suffix='.tmp', delete=False) as f:
+                tmp_path = f.name
+                json.dump(snapshot, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.status_file)
+        except OSError as e:
+            logger.warning(f"Status dosyası yazılamadı: {str(e)}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+    
+    def _start_http_server(self):
+        """
+        /metrics endpoint'ini arka plan thread'inde başlatır.
+        """
+        tracker = self
+        
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip('/') not in ('', '/metrics'):
+                    self.send_error(404)
+                    return
+                body = tracker.render_prometheus().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                logger.debug(f"Metrics isteği: {format % args}")
+        
+        try:
+            self._server = ThreadingHTTPServer(('127.0.0.1', self.http_port), MetricsHandler)
+        except OSError as e:
+            logger.warning(f"Metrics endpoint'i açılamadı (port {self.http_port}): {str(e)}")
+            return
+        thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        thread.start()
+        logger.info(f"Prometheus metrics: http://127.0.0.1:{self.http_port}/metrics")
+
+
+def _percent(done: int, total: int) -> float:
+    """
+    Yüzde hesaplar.
+    """
+    return 100.0 * done / total if total > 0 else 0.0
+
+
+def _format_duration(seconds: float) -> str:
+    """
+    Saniyeyi SS:DD:ss formatına çevirir.
+    """
+    seconds = int(seconds)
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
@@ -0,0 +1,218 @@
+"""
+Deletion Reconciliation Module
+SQL'de silinmiş satırların MongoDB'de kalan karşılıklarını bulur ve siler.
+Her iki taraftaki primary key listeleri sıralı olarak stream edilip merge ile
+karşılaştırılır; bellek kullanımı tablo boyutundan bağımsızdır.
+"""
+
+import logging
+import time
+from typing import Dict, List, Any, Iterator
+
+from pymongo import DeleteMany
+from sqlalchemy import bindparam, text
+
+logger = logging.getLogger(__name__)
+
+# Karakter tipli PK'lar MongoDB ile aynı (binary) sırada okunmalıdır
+STRING_TYPE_MARKERS = ('CHAR', 'TEXT')
+
+
+class DeletionReconciler:
+    """
+    Silme uzlaştırma sınıfı.
+    Kaynakta bulunmayan belge _id'leri batch'ler halinde toplanır; silmeden
+    önce her batch kaynağa IN sorgusuyla tekrar sorulur. Böylece sıralama
+    farkları veya aktarım sonrası eklenen satırlar yanlışlıkla silinmez.
+    Yalnızca tek kolonlu primary key'i olan ve preserve_ids açık tablolar
+    uzlaştırılabilir.
+    """
+    
+    def __init__(self, migrator, config: Dict[str, Any]):
+        """
+        Uzlaştırma sınıfını başlatır.
+        
+        Args:
+            migrator: DataMigrator instance (bağlantılar ve dönüşüm kuralları için)
+            config: Migration konfigürasyonu
+        """
+        self.migrator = migrator
+        self.sql_connector = migrator.sql_connector
+        self.mongodb_connector = migrator.mongodb_connector
+        self.batch_size = config.get('reconcile_batch_size', 1000)
+    
+    def reconcile_all(self, schema_info: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Tüm tabloları uzlaştırır.
+        
+        Args:
+            schema_info: Keşfedilen şema bilgileri
+        
+        Returns:
+            dict: Tablo isimlerine göre silinen belge sayıları
+        """
+        logger.info("Silinen satırlar uzlaştırılıyor...")
+        
+        columns_info = schema_info.get('columns', {})
+        primary_keys = schema_info.get('primary_keys', {})
+        results = {}
+        
+        for table_name in schema_info.get('tables', []):
+            try:
+                results[table_name] = self.reconcile_table(
+                    table_name,
+                    columns_info.get(table_name, []),
+                    primary_keys.get(table_name, [])
+                )
+            except Exception as e:
+                logger.error(f"{table_name} tablosu uzlaştırma hatası: {str(e)}")
+                results[table_name] = {'status': 'error', 'error': str(e)}
+        
+        deleted = sum(r.get('deleted', 0) for r in results.values())
+        logger.info(f"Uzlaştırma tamamlandı: {deleted} yetim belge silindi")
+        return results
+    
+    def reconcile_table(self, table_name: str, columns: List[Dict],
+                        primary_keys: List[str]) -> Dict[str, Any]:
+        """
+        Tek bir tablonun yetim belgelerini siler.
+        
+        Args:
+            table_name: Tablo ismi
+            columns: Tablo kolon bilgileri
+            primary_keys: Primary key kolonları
+        
+        Returns:
+            dict: Durum, taranan belge ve silinen belge sayıları
+        """
+        if len(primary_keys) != 1 or not self.migrator.preserve_ids:
+            # Composite PK _id'leri birleştirilmiş string olduğundan kaynak sırasıyla eşleşmez
+            return {'status': 'skipped', 'reason': 'tek kolonlu primary key / preserve_ids yok'}
+        
+        if self.migrator.collections.kind(table_name) == 'timeseries':
+            # Time-series collection'lar her tam aktarımda yeniden oluşturulur
+            return {'status': 'skipped', 'reason': 'time-series collection'}
+        
+        collection = self.mongodb_connector.get_collection(table_name)
+        if collection is None:
+            return {'status': 'skipped', 'reason': 'collection yok'}
+        
+        started = time.perf_counter()
+        pk_column = primary_keys[0]
+        pk_type = next((str(col.get('type', '')) for col in columns if col['name'] == pk_column), '')
+        
+        scanned = 0
+        deleted = 0
+        orphans = []
+        source_keys = self._source_keys(table_name, pk_column, pk_type)
+        source_key = next(source_keys, None)
+        
+        for target in collection.find({}, {'_id': 1}).sort('_id', 1).batch_size(10000):
+            target_key = target['_id']
+            scanned += 1
+            while source_key is not None and source_key < target_key:
+                source_key = next(source_keys, None)
+            if source_key is not None and source_key == target_key:
+                source_key = next(source_keys, None)
+                continue
+            orphans.append(target_key)
+            if len(orphans) >= self.batch_size:
+                deleted += self._delete_orphans(table_name, pk_column, orphans)
+                orphans = []
+        
+        if orphans:
+            deleted += self._delete_orphans(table_name, pk_column, orphans)
+        
+        if deleted:
+            logger.info(f"{table_name}: {deleted} yetim belge silindi")
+        return {
+            'status': 'ok',
+            'scanned': scanned,
+            'deleted': deleted,
+            'duration': time.perf_counter() - started
+        }
+    
+    def _source_keys(self, table_name: str, pk_column: str, pk_type: str) -> Iterator[Any]:
+        """
+        Kaynak primary key'lerini MongoDB _id sırasıyla ve dönüştürülmüş olarak stream eder.
+        
+        Args:
+            table_name: Tablo ismi
+            pk_column: Primary key kolonu
+            pk_type: Primary key kolon tipi
+        
+        Yields:
+            Dönüştürülmüş anahtar değerleri
+        """
+        quote = self.sql_connector.quote_identifier
+        order_by = quote(pk_column)
+        if any(marker in pk_type.upper() for marker in STRING_TYPE_MARKERS):
+            # MongoDB string'leri binary (code point) sırasıyla karşılaştırır
+            if self.sql_connector.db_type == 'mysql':
+                order_by = f"CAST({order_by} AS BINARY)"
+            elif self.sql_connector.db_type == 'mssql':
+                order_by = f"{order_by} COLLATE Latin1_General_BIN2"
+        query = (f"SELECT {quote(pk_column)} FROM {quote(table_name)}"
+                 f"{self.migrator.selection.where_clause(table_name)} ORDER BY {order_by}")
+        
+        convert = self.migrator._convert_value
+        with self.sql_connector.get_engine().connect() as conn:
+            result = conn.execution_options(stream_results=True).execute(text(query))
+            while True:
+                rows = result.fetchmany(self.migrator.memory.fetch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield convert(row[0])
+    
+    def _delete_orphans(self, table_name: str, pk_column: str, orphans: List[Any]) -> int:
+        """
+        Aday yetim belgeleri kaynakta tekrar kontrol eder ve gerçekten olmayanları siler.
+        
+        Args:
+            table_name: Tablo ismi
+            pk_column: Primary key kolonu
+            orphans: Kaynakta bulunamayan _id değerleri
+        
+        Returns:
+            int: Silinen belge sayısı
+        """
+        quote = self.sql_connector.quote_identifier
+        query = text(
+            f"SELECT {quote(pk_column)} FROM {quote(table_name)}"
+            f"{self.migrator.selection.where_clause(table_name, f'{quote(pk_column)} IN :keys')}"
+        ).bindparams(bindparam('keys', expanding=True))
+        
+        keys = [_source_value(key) for key in orphans]
+        convert = self.migrator._convert_value
+        with self.sql_connector.get_engine().connect() as conn:
+            existing = {convert(row[0]) for row in conn.execute(query, {'keys': keys})}
+        
+        confirmed = [key for key in orphans if key not in existing]
+        if len(confirmed) < len(orphans):
+            logger.debug(f"{table_name}: {len(orphans) - len(confirmed)} aday kaynakta bulundu, "
+                         f"silinmedi")
+        if not confirmed:
+            return 0
+        
+        orphan_filter = {'_id': {'$in': confirmed}}
+        counts = self.mongodb_connector.bulk_write_operations(
+            table_name, [DeleteMany(orphan_filter)], 1, [{'q': orphan_filter}]
+        )
+        return counts.get('deleted', 0)
+
+
+def _source_value(key: Any) -> Any:
+    """
+    MongoDB _id değerini kaynak sorgusu parametresine çevirir
+    (dönüşümde float'a çevrilen tam sayılar geri çevrilir).
+    
+    Args:
+        key: MongoDB _id değeri
+    
+    Returns:
+        Sorgu parametresi
+    """
+    if isinstance(key, float) and key.is_integer():
+        return int(key)
+    return key
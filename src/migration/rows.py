@@ -0,0 +1,88 @@
+"""
+Row Layout Module
+Aktarım sırasında bekleyen satırları tablo başına tek bir kolon başlığı ile
+tuple olarak tutar; belgeler yalnızca yazma batch'i oluşturulurken üretilir.
+"""
+
+from typing import Dict, List, Any, Callable, Optional, Tuple
+
+
+class RowLayout:
+    """
+    Satır düzeni sınıfı.
+    Kolon isimlerini ve belgeye hangi pozisyonların hangi alan ismiyle
+    yazılacağını tablo başına bir kez hesaplar; böylece satırlar ara
+    dict kopyası oluşturulmadan doğrudan belgeye çevrilir.
+    """
+    
+    def __init__(self, column_names: List[str], primary_keys: List[str], preserve_ids: bool,
+                 tenant_field: Optional[str] = None, tenant: Optional[str] = None):
+        """
+        Satır düzenini oluşturur.
+        
+        Args:
+            column_names: Sorgu kolonları (satır tuple'larının sırası)
+            primary_keys: Primary key kolonları
+            preserve_ids: Primary key'ler _id olarak korunuyorsa True
+            tenant_field: Kaynak isminin yazılacağı alan (çoklu kaynak aktarımı, opsiyonel)
+            tenant: Kaynak ismi; verilirse _id'nin başına eklenir
+        """
+        self.column_names = list(column_names)
+        self.tenant_field = tenant_field
+        self.tenant = tenant
+        positions = {name: i for i, name in enumerate(self.column_names)}
+        
+        # _id için kullanılacak kolon pozisyonları
+        self.id_positions: Tuple[int, ...] = ()
+        if preserve_ids and primary_keys:
+            self.id_positions = tuple(positions[pk] for pk in primary_keys)
+        
+        # Belgeye yazılacak (alan ismi, pozisyon) çiftleri; PK kolonları
+        # yalnızca preserve_ids açıkken belgede tutulur
+        self.fields: Tuple[Tuple[str, int], ...] = tuple(
+            (name, i) for i, name in enumerate(self.column_names)
+            if preserve_ids or name not in primary_keys
+        )
+    
+    def to_document(self, values: Any, convert: Callable[[Any], Any]) -> Dict[str, Any]:
+        """
+        Satır değerlerini MongoDB belgesine çevirir.
+        
+        Args:
+            values: Kolon sırasıyla satır değerleri (tuple veya SQLAlchemy Row)
+            convert: Değer dönüştürme fonksiyonu
+        
+        Returns:
+            dict: MongoDB belgesi
+        """
+        doc = {}
+        id_positions = self.id_positions
+        if id_positions and self.tenant is not None:
+            # Ortak collection: tenant, composite PK'nin ilk kolonu gibi birleştirilir
+            doc['_id'] = '_'.join([self.tenant] + [str(values[i]) for i in id_positions])
+        elif len(id_positions) == 1:
+            # Tek kolonlu PK
+            doc['_id'] = convert(values[id_positions[0]])
+        elif id_positions:
+            # Composite PK - string olarak birleştir
+            doc['_id'] = '_'.join([str(values[i]) for i in id_positions])
+        
+        if self.tenant_field is not None:
+            doc[self.tenant_field] = self.tenant
+        for name, i in self.fields:
+            doc[name] = convert(values[i])
+        return doc
+    
+    def to_documents(self, rows: List[Any], convert: Callable[[Any], Any]) -> List[Dict[str, Any]]:
+        """
+        Satır listesini MongoDB belgelerine çevirir.
+        
+        Args:
+            rows: Kolon sırasıyla satırlar
+            convert: Değer dönüştürme fonksiyonu
+        
+        Returns:
+            list: MongoDB belgeleri
+        """
+        to_document = self.to_document
+        return [to_document(row, convert) for row in rows]
@@ -0,0 +1,369 @@
+"""
+Sample Validation Module
+Rastgele örneklenen satırları SQL ve MongoDB tarafında alan bazında karşılaştırır.
+Uyuşmazlık oranını güven aralığı ile raporlar.
+"""
+
+import logging
+import math
+import random
+import time
+from statistics import NormalDist
+from typing import Dict, List, Any, Optional, Tuple
+from sqlalchemy import text, bindparam
+
+logger = logging.getLogger(__name__)
+
+# Tek sorguda IN / $in ile çekilecek anahtar sayısı
+FETCH_BATCH_SIZE = 500
+
+# TABLESAMPLE sayfa bazında örneklediğinden hedeflenen satırın katı kadar yüzde istenir
+TABLESAMPLE_OVERSAMPLING = 4
+
+
+class SampleValidator:
+    """
+    Örneklemeli doğrulama sınıfı.
+    Her tablodan N primary key örnekler, satırları iki taraftan batch'ler
+    halinde çeker, migrator'ın dönüşüm kurallarından geçirip karşılaştırır.
+    Tam sayı PK'si olmayan büyük tablolar MSSQL'de TABLESAMPLE ile örneklenir;
+    diğer veritabanlarında tam tarama yapmamak için atlanır.
+    """
+    
+    def __init__(self, migrator, config: Dict[str, Any]):
+        """
+        Örneklemeli doğrulama sınıfını başlatır.
+        
+        Args:
+            migrator: DataMigrator instance (bağlantılar ve dönüşüm kuralları için)
+            config: Migration konfigürasyonu
+        """
+        self.migrator = migrator
+        self.sql_connector = migrator.sql_connector
+        self.mongodb_connector = migrator.mongodb_connector
+        self.sample_size = config.get('sample_size', 1000)
+        self.confidence = config.get('sample_confidence', 0.95)
+        self.random = random.Random(config.get('sample_seed'))
+        # Rastgele sıralama (tam tarama + sıralama) ile örneklenecek en büyük tablo
+        self.random_order_max_rows = config.get('sample_random_order_max_rows', 100000)
+        self.row_estimates: Dict[str, int] = {}
+    
+    def validate_all(self, schema_info: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Tüm tabloları örnekleyerek doğrular.
+        
+        Args:
+            schema_info: Keşfedilen şema bilgileri
+        
+        Returns:
+            dict: Tablo isimlerine göre örnekleme sonuçları
+        """
+        logger.info(f"Örneklemeli doğrulama başlatılıyor (tablo başına {self.sample_size} satır)...")
+        
+        columns_info = schema_info.get('columns', {})
+        primary_keys = schema_info.get('primary_keys', {})
+        self.row_estimates = schema_info.get('row_estimates', {})
+        results = {}
+        
+        for table_name in schema_info.get('tables', []):
+            try:
+                results[table_name] = self.validate_table(
+                    table_name,
+                    columns_info.get(table_name, []),
+                    primary_keys.get(table_name, [])
+                )
+            except Exception as e:
+                logger.error(f"{table_name} tablosu örnekleme hatası: {str(e)}")
+                results[table_name] = {'status': 'error', 'error': str(e)}
+        
+        return results
+    
+    def validate_table(self, table_name: str, columns: List[Dict],
+                       primary_keys: List[str]) -> Dict[str, Any]:
+        """
+        Tek bir tabloyu örnekleyerek doğrular.
+        
+        Args:
+            table_name: Tablo ismi
+            columns: Tablo kolon bilgileri
+            primary_keys: Primary key kolonları
+        
+        Returns:
+            dict: Örnek sayısı, uyuşmazlık oranı ve güven aralığı
+        """
+        if not primary_keys or not self.migrator.preserve_ids:
+            # _id eşlemesi olmadan satırlar hedefte bulunamaz
+            return {'status': 'skipped', 'reason': 'primary key / preserve_ids yok'}
+        
+        estimate = int(self.row_estimates.get(table_name, 0))
+        if (not _integer_key(columns, primary_keys) and self.sql_connector.db_type != 'mssql'
+                and estimate > self.random_order_max_rows):
+            # ORDER BY RAND() tüm tabloyu tarayıp sıralar; hızlı doğrulama amacını bozar
+            return {'status': 'skipped',
+                    'reason': f'tam sayı PK yok ve tahmini {estimate} satır '
+                              f'sample_random_order_max_rows değerini aşıyor'}
+        
+        started = time.perf_counter()
+        source_rows = self._sample_source_rows(table_name, columns, primary_keys)
+        expected = [
+            self.migrator._build_document(row, list(row.keys()), primary_keys)
+            for row in source_rows
+        ]
+        # Time-series zaman alanı BSON date (milisaniye) olarak saklanır, karşılaştırılmaz
+        time_field = self.migrator.collections.time_field(table_name)
+        if time_field:
+            for doc in expected:
+                doc.pop(time_field, None)
+        
+        mismatched_rows = 0
+        missing_rows = 0
+        field_mismatches: Dict[str, int] = {}
+        examples = []
+        
+        for i in range(0, len(expected), FETCH_BATCH_SIZE):
+            batch = expected[i:i + FETCH_BATCH_SIZE]
+            actual = self._fetch_target_documents(table_name, [doc['_id'] for doc in batch])
+            for doc in batch:
+                target = actual.get(doc['_id'])
+                if target is None:
+                    missing_rows += 1
+                    mismatched_rows += 1
+                    if len(examples) < 10:
+                        examples.append({'_id': doc['_id'], 'fields': ['<eksik belge>']})
+                    continue
+                diff = _diff_fields(doc, target)
+                if diff:
+                    mismatched_rows += 1
+                    for field in diff:
+                        field_mismatches[field] = field_mismatches.get(field, 0) + 1
+                    if len(examples) < 10:
+                        examples.append({'_id': doc['_id'], 'fields': diff})
+        
+        sampled = len(expected)
+        low, high = self._wilson_interval(mismatched_rows, sampled)
+        result = {
+            'status': 'ok' if mismatched_rows == 0 else 'mismatch',
+            'sampled': sampled,
+            'mismatched': mismatched_rows,
+            'missing': missing_rows,
+            'mismatch_rate': mismatched_rows / sampled if sampled else 0.0,
+            'confidence': self.confidence,
+            'interval_low': low,
+            'interval_high': high,
+            'field_mismatches': field_mismatches,
+            'examples': examples,
+            'duration': time.perf_counter() - started
+        }
+        logger.info(f"{table_name}: {sampled} örnek, {mismatched_rows} uyuşmazlık "
+                    f"(%{self.confidence * 100:.0f} GA: {low:.4%} - {high:.4%})")
+        return result
+    
+    def _sample_source_rows(self, table_name: str, columns: List[Dict],
+                            primary_keys: List[str]) -> List[Dict[str, Any]]:
+        """
+        Kaynak tablodan rastgele satırlar örnekler.
+        
+        Tek kolonlu tam sayı PK'lerde MIN/MAX aralığından rastgele anahtarlar
+        üretilip IN sorgusuyla çekilir. Diğer tablolarda küçük tablolar
+        veritabanının rastgele sıralamasıyla, büyük MSSQL tabloları
+        TABLESAMPLE ile örneklenir.
+        
+        Args:
+            table_name: Tablo ismi
+            columns: Tablo kolon bilgileri
+            primary_keys: Primary key kolonları
+        
+        Returns:
+            list: Kolon isimlerine göre satır değerleri
+        """
+        quote = self.sql_connector.quote_identifier
+        engine = self.sql_connector.get_engine()
+        
+        # Aktarımdaki kolon projeksiyonu ve satır filtresi örneklemeye de uygulanır
+        selection = self.migrator.selection
+        select_list = '*'
+        if selection.is_projected(table_name):
+            select_list = ', '.join(
+                quote(col['name']) for col in selection.columns(table_name, columns, primary_keys)
+            )
+        where = selection.where_clause(table_name)
+        
+        with engine.connect() as conn:
+            if _integer_key(columns, primary_keys):
+                return self._sample_by_key_range(conn, table_name, primary_keys[0], select_list)
+            
+            estimate = int(self.row_estimates.get(table_name, 0))
+            if self.sql_connector.db_type == 'mssql' and estimate > self.random_order_max_rows:
+                return self._sample_by_pages(conn, table_name, select_list, where, estimate)
+            
+            if self.sql_connector.db_type == 'mssql':
+                query = (f"SELECT TOP {int(self.sample_size)} {select_list} FROM {quote(table_name)}"
+                         f"{where} ORDER BY NEWID()")
+            else:
+                query = (f"SELECT {select_list} FROM {quote(table_name)}{where} "
+                         f"ORDER BY RAND() LIMIT {int(self.sample_size)}")
+            result = conn.execute(text(query))
+            return [dict(row._mapping) for row in result]
+    
+    def _sample_by_key_range(self, conn, table_name: str, pk_column: str,
+                             select_list: str = '*') -> List[Dict[str, Any]]:
+        """
+        Tam sayı PK aralığından rastgele anahtarlar seçerek satır örnekler.
+        
+        Args:
+            conn: Açık SQL bağlantısı
+            table_name: Tablo ismi
+            pk_column: Primary key kolonu
+            select_list: Seçilecek kolonlar
+        
+        Returns:
+            list: Kolon isimlerine göre satır değerleri
+        """
+        quote = self.sql_connector.quote_identifier
+        low, high = conn.execute(text(
+            f"SELECT MIN({quote(pk_column)}), MAX({quote(pk_column)}) FROM {quote(table_name)}"
+            f"{self.migrator.selection.where_clause(table_name)}"
+        )).fetchone()
+        if low is None:
+            return []
+        
+        query = text(
+            f"SELECT {select_list} FROM {quote(table_name)}"
+            f"{self.migrator.selection.where_clause(table_name, f'{quote(pk_column)} IN :keys')}"
+        ).bindparams(bindparam('keys', expanding=True))
+        
+        rows: Dict[Any, Dict[str, Any]] = {}
+        tried = set()
+        key_space = high - low + 1
+        # Boşluklu anahtar aralıklarında örnek tamamlanana kadar tekrar denenir
+        for _ in range(10):
+            needed = self.sample_size - len(rows)
+            if needed <= 0 or len(tried) >= key_space:
+                break
+            candidates = set()
+            while len(candidates) < min(needed * 2, key_space - len(tried)):
+                key = self.random.randint(low, high)
+                if key not in tried:
+                    candidates.add(key)
+            tried.update(candidates)
+            candidate_list = list(candidates)
+            for i in range(0, len(candidate_list), FETCH_BATCH_SIZE):
+                result = conn.execute(query, {'keys': candidate_list[i:i + FETCH_BATCH_SIZE]})
+                for row in result:
+                    row_dict = dict(row._mapping)
+                    rows[row_dict[pk_column]] = row_dict
+        
+        return list(rows.values())[:self.sample_size]
+    
+    def _sample_by_pages(self, conn, table_name: str, select_list: str, where: str,
+                         estimate: int) -> List[Dict[str, Any]]:
+        """
+        Büyük MSSQL tablosunu TABLESAMPLE SYSTEM ile sayfa bazında örnekler;
+        yalnızca seçilen sayfalar okunur. Yeterli satır gelmezse yüzde artırılır.
+        
+        Args:
+            conn: Açık SQL bağlantısı
+            table_name: Tablo ismi
+            select_list: Seçilecek kolonlar
+            where: Satır filtresi (WHERE ifadesi veya boş)
+            estimate: Tahmini satır sayısı
+        
+        Returns:
+            list: Kolon isimlerine göre satır değerleri
+        """
+        quote = self.sql_connector.quote_identifier
+        percent = min(100.0, 100.0 * self.sample_size * TABLESAMPLE_OVERSAMPLING / estimate)
+        rows: List[Dict[str, Any]] = []
+        while True:
+            query = (f"SELECT TOP {int(self.sample_size)} {select_list} FROM {quote(table_name)} "
+                     f"TABLESAMPLE SYSTEM ({percent:.6f} PERCENT){where}")
+            rows = [dict(row._mapping) for row in conn.execute(text(query))]
+            if len(rows) >= self.sample_size or percent >= 100.0:
+                return rows
+            percent = min(100.0, percent * 4)
+    
+    def _fetch_target_documents(self, table_name: str, ids: List[Any]) -> Dict[Any, Dict[str, Any]]:
+        """
+        Belgeleri MongoDB'den tek bir $in sorgusuyla çeker.
+        
+        Args:
+            table_name: Collection ismi
+            ids: Belge _id değerleri
+        
+        Returns:
+            dict: _id → belge
+        """
+        collection = self.mongodb_connector.get_collection(table_name)
+        if collection is None:
+            return {}
+        return {doc['_id']: doc for doc in collection.find({'_id': {'$in': ids}})}
+    
+    def _wilson_interval(self, failures: int, total: int) -> Tuple[float, float]:
+        """
+        Uyuşmazlık oranı için Wilson skor güven aralığını hesaplar.
+        
+        Args:
+            failures: Uyuşmayan satır sayısı
+            total: Örnek sayısı
+        
+        Returns:
+            tuple: (alt sınır, üst sınır)
+        """
+        if total == 0:
+            return 0.0, 1.0
+        z = NormalDist().inv_cdf((1 + self.confidence) / 2)
+        p = failures / total
+        denominator = 1 + z * z / total
+        center = (p + z * z / (2 * total)) / denominator
+        margin = z * math.sqrt(p * (1 - p) / total + z * z / (4 * total * total)) / denominator
+        return max(0.0, center - margin), min(1.0, center + margin)
+
+
+def _integer_key(columns: List[Dict], primary_keys: List[str]) -> bool:
+    """
+    Tablonun tek kolonlu tam sayı primary key'i varsa True döndürür
+    (anahtar aralığından örneklenebilir).
+    """
+    if len(primary_keys) != 1:
+        return False
+    pk_type = next((str(col.get('type', '')) for col in columns
+                    if col['name'] == primary_keys[0]), '')
+    return 'INT' in pk_type.upper()
+
+
+def _diff_fields(expected: Dict[str, Any], actual: Dict[str, Any]) -> List[str]:
+    """
+    Beklenen belge ile MongoDB belgesi arasında farklı olan alanları bulur.
+    
+    Args:
+        expected: Kaynaktan dönüştürülmüş belge
+        actual: MongoDB'deki belge
+    
+    Returns:
+        list: Farklı alan isimleri
+    """
+    diff = []
+    for field, value in expected.items():
+        target = actual.get(field)
+        if isinstance(target, dict) and 'gridfs_id' in target:
+            # İçeriği GridFS'e aktarılmış LOB alanı
+            continue
+        if field not in actual or not _values_equal(value, actual[field]):
+            diff.append(field)
+    return diff
+
+
+def _values_equal(expected: Any, actual: Any) -> bool:
+    """
+    İki değeri karşılaştırır; float değerlerde yuvarlama farkını tolere eder.
+    
+    Args:
+        expected: Beklenen değer
+        actual: Gerçek değer
+    
+    Returns:
+        bool: Değerler eşitse True
+    """
+    if isinstance(expected, float) and isinstance(actual, (int, float)):
+        return math.isclose(expected, actual, rel_tol=1e-9, abs_tol=1e-12)
+    return expected == actual
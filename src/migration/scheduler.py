@@ -0,0 +1,142 @@
+"""
+Table Scheduler Module
+Tabloları foreign key bağımlılıklarına ve tahmini boyutlarına göre sıralar;
+paralel çalışan worker'lara sıradaki hazır tabloyu verir.
+"""
+
+import logging
+import threading
+from typing import Dict, List, Any, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class TableScheduler:
+    """
+    Tablo zamanlayıcı sınıfı.
+    Bir tablo, referans verdiği (parent) tablolar bitmeden başlatılmaz.
+    Hazır tablolar arasından kritik yolu en uzun olan (kendi satırları ve
+    kendisini bekleyen en büyük child zinciri) önce verilir; böylece büyük
+    tablolar ve onların parent'ları erken başlar, sonda tek bir uzun tablo
+    kalmaz. Thread-safe'tir.
+    """
+    
+    def __init__(self, tables: List[str], row_estimates: Dict[str, int],
+                 foreign_keys: Dict[str, List[Dict[str, Any]]], respect_dependencies: bool = True):
+        """
+        Zamanlayıcıyı başlatır.
+        
+        Args:
+            tables: Aktarılacak tablolar
+            row_estimates: Tablo isimlerine göre tahmini satır sayıları
+            foreign_keys: Tablo isimlerine göre foreign key bilgileri
+            respect_dependencies: False ise FK sırası gözetilmez, yalnızca boyut kullanılır
+        """
+        self._pending: Set[str] = set(tables)
+        self._running: Set[str] = set()
+        self._done: Set[str] = set()
+        self._condition = threading.Condition()
+        
+        # table → bitmesi beklenen parent tablolar
+        self._parents: Dict[str, Set[str]] = {table: set() for table in tables}
+        if respect_dependencies:
+            for table in tables:
+                for fk in foreign_keys.get(table, []):
+                    parent = fk.get('referred_table')
+                    if parent and parent != table and parent in self._pending:
+                        self._parents[table].add(parent)
+        
+        children: Dict[str, Set[str]] = {table: set() for table in tables}
+        for table, parents in self._parents.items():
+            for parent in parents:
+                children[parent].add(table)
+        
+        self.priorities: Dict[str, int] = {}
+        for table in tables:
+            self._priority(table, row_estimates, children, set())
+    
+    def plan(self) -> List[str]:
+        """
+        Tek worker ile çalışılsaydı izlenecek sırayı döndürür (loglama için).
+        
+        Returns:
+            list: Tablo sırası
+        """
+        done: Set[str] = set()
+        order = []
+        pending = set(self._pending)
+        while pending:
+            ready = [t for t in pending if self._parents[t] <= done] or list(pending)
+            table = min(ready, key=self._sort_key)
+            order.append(table)
+            done.add(table)
+            pending.discard(table)
+        return order
+    
+    def acquire(self) -> Optional[str]:
+        """
+        Sıradaki hazır tabloyu verir; hazır tablo yoksa bir tablonun bitmesini bekler.
+        
+        Returns:
+            str: Tablo ismi (tüm tablolar verildiyse None)
+        """
+        with self._condition:
+            while True:
+                if not self._pending:
+                    return None
+                ready = [t for t in self._pending if self._parents[t] <= self._done]
+                if not ready and not self._running:
+                    # Döngüsel FK: bekleyecek tablo kalmadı, en öncelikli tablo ile kırılır
+                    ready = list(self._pending)
+                    logger.warning(f"Döngüsel foreign key bağımlılığı: "
+                                   f"{', '.join(sorted(ready))}; sıra boyuta göre belirlenecek")
+                if ready:
+                    table = min(ready, key=self._sort_key)
+                    self._pending.discard(table)
+                    self._running.add(table)
+                    return table
+                self._condition.wait()
+    
+    def release(self, table_name: str):
+        """
+        Tablonun bittiğini bildirir (başarısız olsa bile child'lar bekletilmez).
+        
+        Args:
+            table_name: Tablo ismi
+        """
+        with self._condition:
+            self._running.discard(table_name)
+            self._done.add(table_name)
+            self._condition.notify_all()
+    
+    def _sort_key(self, table: str):
+        """
+        Hazır tablolar arasındaki seçim anahtarı: yüksek öncelik, eşitlikte alfabetik sıra.
+        """
+        return -self.priorities.get(table, 0), table
+    
+    def _priority(self, table: str, row_estimates: Dict[str, int],
+                  children: Dict[str, Set[str]], visiting: Set[str]) -> int:
+        """
+        Tablonun kritik yol ağırlığını hesaplar: kendi satırları ve en ağır child zinciri.
+        
+        Args:
+            table: Tablo ismi
+            row_estimates: Tahmini satır sayıları
+            children: table → kendisine referans veren tablolar
+            visiting: Döngü tespiti için ziyaret edilen tablolar
+        
+        Returns:
+            int: Öncelik
+        """
+        if table in self.priorities:
+            return self.priorities[table]
+        visiting.add(table)
+        heaviest_child = max(
+            (self._priority(child, row_estimates, children, visiting)
+             for child in children[table] if child not in visiting),
+            default=0
+        )
+        visiting.discard(table)
+        self.priorities[table] = int(row_estimates.get(table, 0)) + heaviest_child
+        return self.priorities[table]
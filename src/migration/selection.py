@@ -0,0 +1,110 @@
+"""
+Table Selection Module
+Tablo bazında kolon projeksiyonu (include/exclude) ve satır filtresi (WHERE)
+ayarlarını okur; extraction ve doğrulama sorgularına uygular.
+"""
+
+import logging
+from typing import Dict, List, Any
+
+logger = logging.getLogger(__name__)
+
+
+class TableSelection:
+    """
+    Tablo seçim ayarları sınıfı.
+    migration.table_options altındaki tablo bazında include_columns,
+    exclude_columns ve where ayarlarını tutar.
+    """
+    
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Seçim ayarlarını başlatır.
+        
+        Args:
+            config: Migration konfigürasyonu
+        """
+        self.table_options: Dict[str, Dict[str, Any]] = config.get('table_options') or {}
+        self._warned_tables = set()
+    
+    def is_projected(self, table_name: str) -> bool:
+        """
+        Tablo için kolon projeksiyonu tanımlıysa True döndürür.
+        
+        Args:
+            table_name: Tablo ismi
+        
+        Returns:
+            bool: include_columns veya exclude_columns tanımlıysa True
+        """
+        options = self.table_options.get(table_name, {})
+        return bool(options.get('include_columns') or options.get('exclude_columns'))
+    
+    def columns(self, table_name: str, columns: List[Dict],
+                primary_keys: List[str]) -> List[Dict]:
+        """
+        Tablonun aktarılacak kolonlarını döndürür.
+        Primary key kolonları _id için gerekli olduğundan her zaman tutulur.
+        
+        Args:
+            table_name: Tablo ismi
+            columns: Tablo kolon bilgileri
+            primary_keys: Primary key kolonları
+        
+        Returns:
+            list: Seçilen kolon bilgileri (tablodaki sırasıyla)
+        """
+        options = self.table_options.get(table_name, {})
+        include = options.get('include_columns')
+        exclude = set(options.get('exclude_columns') or [])
+        
+        excluded_keys = [pk for pk in primary_keys
+                         if pk in exclude or (include and pk not in include)]
+        if excluded_keys and table_name not in self._warned_tables:
+            self._warned_tables.add(table_name)
+            logger.warning(f"{table_name}: primary key kolonları projeksiyondan çıkarılamaz, "
+                           f"tutuluyor: {', '.join(excluded_keys)}")
+        
+        selected = []
+        for col in columns:
+            name = col['name']
+            if name in primary_keys:
+                selected.append(col)
+            elif (not include or name in include) and name not in exclude:
+                selected.append(col)
+        return selected
+    
+    def where(self, table_name: str) -> str:
+        """
+        Tablonun satır filtresini döndürür.
+        
+        Args:
+            table_name: Tablo ismi
+        
+        Returns:
+            str: SQL predicate (filtre yoksa boş string)
+        """
+        return (self.table_options.get(table_name, {}).get('where') or '').strip()
+    
+    def where_clause(self, table_name: str, *conditions: str) -> str:
+        """
+        Tablo filtresini ve ek koşulları SQLAlchemy text() sorgusu için
+        WHERE ifadesine çevirir. Filtredeki ':' karakterleri bind parametresi
+        sanılmasın diye escape edilir.
+        
+        Args:
+            table_name: Tablo ismi
+            conditions: Ek koşullar (bind parametreleri içerebilir)
+        
+        Returns:
+            str: ' WHERE ...' ifadesi (koşul yoksa boş string)
+        """
+        predicates = []
+        where = self.where(table_name)
+        if where:
+            escaped = where.replace(':', '\\:')
+            predicates.append(f"({escaped})")
+        predicates.extend(conditions)
+        if not predicates:
+            return ''
+        return ' WHERE ' + ' AND '.join(predicates)
@@ -0,0 +1,432 @@
+"""
+Migration Verification Module
+Aktarım sonrası SQL kaynağı ile MongoDB hedefini karşılaştırır.
+Satır sayılarını ve PK aralıkları üzerinden sıra bağımsız hash'leri doğrular.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+# Satır hash'leri 64 bit toplam olarak birleştirilir (sıra bağımsız)
+HASH_MODULUS = 2 ** 64
+
+
+class MigrationVerifier:
+    """
+    Doğrulama sınıfı.
+    Her tablo için satır sayısı ve PK aralığı hash'lerini iki tarafta paralel
+    hesaplar; uyuşmayan aralıkları uyuşmazlık bulunan en küçük aralıklara
+    kadar böler. Hedefte kaynak aralığının dışında kalan belgeler ayrıca
+    sayılır; böylece fazla veya yetim belgeler de uyuşmazlık olarak görünür.
+    """
+    
+    def __init__(self, migrator, config: Dict[str, Any]):
+        """
+        Doğrulama sınıfını başlatır.
+        
+        Args:
+            migrator: DataMigrator instance (bağlantılar ve dönüşüm kuralları için)
+            config: Migration konfigürasyonu
+        """
+        self.migrator = migrator
+        self.sql_connector = migrator.sql_connector
+        self.mongodb_connector = migrator.mongodb_connector
+        self.range_count = config.get('verification_ranges', 16)
+        # Bellek bütçesi varsa paralel hash'lenen aralık sayısı sınırlanır
+        self.workers = migrator.memory.worker_count(config.get('verification_workers', 4))
+        self.min_range_rows = config.get('verification_min_range_rows', 1000)
+        self.max_reported_keys = config.get('verification_max_reported_keys', 20)
+    
+    def verify_all(self, schema_info: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Tüm tabloları doğrular.
+        
+        Args:
+            schema_info: Keşfedilen şema bilgileri
+        
+        Returns:
+            dict: Tablo isimlerine göre doğrulama sonuçları
+        """
+        logger.info("Aktarım doğrulaması başlatılıyor...")
+        
+        columns_info = schema_info.get('columns', {})
+        primary_keys = schema_info.get('primary_keys', {})
+        results = {}
+        
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for table_name in schema_info.get('tables', []):
+                try:
+                    results[table_name] = self.verify_table(
+                        executor,
+                        table_name,
+                        columns_info.get(table_name, []),
+                        primary_keys.get(table_name, [])
+                    )
+                except Exception as e:
+                    logger.error(f"{table_name} tablosu doğrulama hatası: {str(e)}")
+                    results[table_name] = {'status': 'error', 'error': str(e)}
+        
+        mismatched = [t for t, r in results.items() if r.get('status') != 'ok']
+        logger.info(f"Doğrulama tamamlandı: {len(results) - len(mismatched)}/{len(results)} "
+                    f"tablo eşleşti")
+        return results
+    
+    def verify_table(self, executor: ThreadPoolExecutor, table_name: str,
+                     columns: List[Dict], primary_keys: List[str]) -> Dict[str, Any]:
+        """
+        Tek bir tabloyu doğrular.
+        
+        Args:
+            executor: Aralık hash'leri için thread pool
+            table_name: Tablo ismi
+            columns: Tablo kolon bilgileri
+            primary_keys: Primary key kolonları
+        
+        Returns:
+            dict: Doğrulama sonucu
+        """
+        started = time.perf_counter()
+        # Projeksiyonla dışarıda bırakılan kolonlar hedefte yoktur
+        columns = self.migrator.selection.columns(table_name, columns, primary_keys)
+        # GridFS'e aktarılan LOB kolonları belgede referans olarak tutulur, hash'e katılmaz
+        # Time-series zaman alanı da string yerine BSON date (milisaniye) olarak saklanır
+        excluded = self.migrator.lob.table_columns.get(table_name, []) + [
+            self.migrator.collections.time_field(table_name)
+        ]
+        columns = [col for col in columns if col['name'] not in excluded]
+        fields = self._stored_fields(columns, primary_keys)
+        range_column = self._range_column(columns, primary_keys)
+        
+        if range_column:
+            ranges = self._initial_ranges(table_name, range_column)
+        else:
+            # Aralığa bölünemeyen tablolar tek parça olarak hash'lenir
+            ranges = [None]
+        
+        source_total = 0
+        target_total = 0
+        mismatched_ranges = []
+        mismatched_keys = []
+        level = ranges
+        first_level = True
+        
+        while level:
+            results = list(executor.map(
+                lambda r: self._compare_range(table_name, fields, range_column, r, False),
+                level
+            ))
+            next_level = []
+            for key_range, comparison in zip(level, results):
+                if first_level:
+                    source_total += comparison['source_count']
+                    target_total += comparison['target_count']
+                if comparison['match']:
+                    continue
+                
+                sub_ranges = self._split_range(key_range, comparison)
+                if sub_ranges:
+                    next_level.extend(sub_ranges)
+                    continue
+                
+                mismatched_ranges.append(self._describe_range(key_range, comparison))
+                remaining = self.max_reported_keys - len(mismatched_keys)
+                if key_range is not None and remaining > 0:
+                    # En küçük aralıkta satır bazında karşılaştırma yapılır
+                    detail = self._compare_range(
+                        table_name, fields, range_column, key_range, keep_rows=True
+                    )
+                    mismatched_keys.extend(detail['mismatched_keys'][:remaining])
+            level = next_level
+            first_level = False
+        
+        if ranges[0] is not None:
+            # Kaynağın [MIN, MAX] aralığı dışında kalan veya aralık alanı sayı olmayan
+            # belgeler hiçbir aralığa düşmez; ayrıca sayılıp uyuşmazlık olarak raporlanır
+            outside_count, outside_keys = self._outside_target(
+                table_name, range_column, ranges[0][0], ranges[-1][1]
+            )
+            if outside_count:
+                target_total += outside_count
+                mismatched_ranges.append({
+                    'start': ranges[0][0],
+                    'end': ranges[-1][1],
+                    'outside': True,
+                    'source_count': 0,
+                    'target_count': outside_count
+                })
+                remaining = self.max_reported_keys - len(mismatched_keys)
+                mismatched_keys.extend(outside_keys[:max(0, remaining)])
+        
+        status = 'ok' if not mismatched_ranges else 'mismatch'
+        result = {
+            'status': status,
+            'source_count': source_total,
+            'target_count': target_total,
+            'mismatched_ranges': mismatched_ranges,
+            'mismatched_keys': mismatched_keys,
+            'duration': time.perf_counter() - started
+        }
+        
+        if status == 'ok':
+            logger.info(f"{table_name}: doğrulandı ({source_total} satır)")
+        else:
+            logger.warning(f"{table_name}: {len(mismatched_ranges)} aralıkta uyuşmazlık "
+                           f"(kaynak {source_total}, hedef {target_total})")
+        return result
+    
+    def _stored_fields(self, columns: List[Dict], primary_keys: List[str]) -> List[str]:
+        """
+        MongoDB belgesinde saklanan kolonları döndürür.
+        
+        Args:
+            columns: Tablo kolon bilgileri
+            primary_keys: Primary key kolonları
+        
+        Returns:
+            list: Belge alan isimleri
+        """
+        names = [col['name'] for col in columns]
+        if self.migrator.preserve_ids:
+            return names
+        # preserve_ids kapalıyken PK kolonları belgeye yazılmaz
+        return [name for name in names if name not in primary_keys]
+    
+    def _range_column(self, columns: List[Dict], primary_keys: List[str]) -> Optional[str]:
+        """
+        Aralık bölmesi için kullanılabilecek tam sayı PK kolonunu döndürür.
+        
+        Args:
+            columns: Tablo kolon bilgileri
+            primary_keys: Primary key kolonları
+        
+        Returns:
+            str: Kolon ismi veya None
+        """
+        if len(primary_keys) != 1 or not self.migrator.preserve_ids:
+            return None
+        for col in columns:
+            if col['name'] == primary_keys[0] and 'INT' in col.get('type', '').upper():
+                return col['name']
+        return None
+    
+    def _initial_ranges(self, table_name: str, range_column: str) -> List[Tuple[int, int]]:
+        """
+        PK değer aralığını eşit parçalara böler.
+        
+        Args:
+            table_name: Tablo ismi
+            range_column: Aralık kolonu
+        
+        Returns:
+            list: [başlangıç, bitiş) aralıkları
+        """
+        quoted_table = self.sql_connector.quote_identifier(table_name)
+        quoted_column = self.sql_connector.quote_identifier(range_column)
+        with self.sql_connector.get_engine().connect() as conn:
+            low, high = conn.execute(text(
+                f"SELECT MIN({quoted_column}), MAX({quoted_column}) FROM {quoted_table}"
+                f"{self.migrator.selection.where_clause(table_name)}"
+            )).fetchone()
+        
+        if low is None:
+            # Boş kaynak tablo: hedefin de boş olduğu tek aralıkla kontrol edilir
+            return [None]
+        
+        high = high + 1
+        step = max(1, -(-(high - low) // self.range_count))
+        return [(start, min(start + step, high)) for start in range(low, high, step)]
+    
+    def _outside_target(self, table_name: str, range_column: str, low: int,
+                        high: int) -> Tuple[int, List[Any]]:
+        """
+        Hedefte kaynak aralığının dışında kalan belgeleri sayar: aralık alanı
+        low'dan küçük, high'a eşit veya büyük, eksik ya da sayı olmayan belgeler.
+        
+        Args:
+            table_name: Tablo ismi
+            range_column: Aralık kolonu
+            low: Kaynaktaki en küçük değer
+            high: Kaynaktaki en büyük değer + 1
+        
+        Returns:
+            tuple: (belge sayısı, raporlanacak anahtarlar)
+        """
+        collection = self.mongodb_connector.get_collection(table_name)
+        if collection is None:
+            return 0, []
+        query = {'$or': [
+            {range_column: {'$lt': low}},
+            {range_column: {'$gte': high}},
+            {range_column: {'$not': {'$type': 'number'}}}
+        ]}
+        count = collection.count_documents(query)
+        keys = []
+        if count:
+            cursor = collection.find(query, {range_column: 1}).limit(self.max_reported_keys)
+            keys = [doc.get(range_column, doc['_id']) for doc in cursor]
+        return count, keys
+    
+    def _split_range(self, key_range: Optional[Tuple[int, int]],
+                     comparison: Dict[str, Any]) -> List[Tuple[int, int]]:
+        """
+        Uyuşmayan aralığı ikiye böler. Aralık yeterince küçükse bölmez.
+        
+        Args:
+            key_range: Uyuşmayan aralık
+            comparison: Aralık karşılaştırma sonucu
+        
+        Returns:
+            list: Alt aralıklar (bölünmeyecekse boş liste)
+        """
+        if key_range is None:
+            return []
+        start, end = key_range
+        rows = max(comparison['source_count'], comparison['target_count'])
+        if rows <= self.min_range_rows or end - start <= 1:
+            return []
+        middle = start + (end - start) // 2
+        return [(start, middle), (middle, end)]
+    
+    def _describe_range(self, key_range: Optional[Tuple[int, int]],
+                        comparison: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Uyuşmayan aralığı rapor formatına çevirir.
+        
+        Args:
+            key_range: Aralık
+            comparison: Aralık karşılaştırma sonucu
+        
+        Returns:
+            dict: Aralık açıklaması
+        """
+        start, end = key_range if key_range else (None, None)
+        return {
+            'start': start,
+            'end': end,
+            'source_count': comparison['source_count'],
+            'target_count': comparison['target_count']
+        }
+    
+    def _compare_range(self, table_name: str, fields: List[str],
+                       range_column: Optional[str],
+                       key_range: Optional[Tuple[int, int]],
+                       keep_rows: bool) -> Dict[str, Any]:
+        """
+        Bir aralığı iki tarafta hash'leyip karşılaştırır.
+        
+        Args:
+            table_name: Tablo ismi
+            fields: Karşılaştırılacak alanlar
+            range_column: Aralık kolonu
+            key_range: [başlangıç, bitiş) aralığı veya None (tüm tablo)
+            keep_rows: True ise satır hash'leri tutulup uyuşmayan anahtarlar bulunur
+        
+        Returns:
+            dict: Sayılar, hash eşleşmesi ve uyuşmayan anahtarlar
+        """
+        source_count, source_hash, source_rows = self._hash_source(
+            table_name, fields, range_column, key_range, keep_rows
+        )
+        target_count, target_hash, target_rows = self._hash_target(
+            table_name, fields, range_column, key_range, keep_rows
+        )
+        
+        mismatched_keys = []
+        if keep_rows and (source_count != target_count or source_hash != target_hash):
+            for key in sorted(set(source_rows) | set(target_rows), key=str):
+                if source_rows.get(key) != target_rows.get(key):
+                    mismatched_keys.append(key)
+        
+        return {
+            'match': source_count == target_count and source_hash == target_hash,
+            'source_count': source_count,
+            'target_count': target_count,
+            'mismatched_keys': mismatched_keys
+        }
+    
+    def _hash_source(self, table_name: str, fields: List[str], range_column: Optional[str],
+                     key_range: Optional[Tuple[int, int]],
+                     keep_rows: bool) -> Tuple[int, int, Dict[Any, int]]:
+        """
+        SQL tarafında aralıktaki satırları dönüştürüp hash'ler.
+        
+        Returns:
+            tuple: (satır sayısı, aralık hash'i, anahtar → satır hash'i)
+        """
+        quote = self.sql_connector.quote_identifier
+        select_list = ', '.join(quote(field) for field in fields)
+        conditions = []
+        params = {}
+        if key_range is not None:
+            conditions.append(f"{quote(range_column)} >= :start AND {quote(range_column)} < :end")
+            params = {'start': key_range[0], 'end': key_range[1]}
+        # Filtreyle aktarılmayan satırlar kaynak tarafta da sayılmaz
+        where = self.migrator.selection.where_clause(table_name, *conditions)
+        query = f"SELECT {select_list} FROM {quote(table_name)}{where}"
+        
+        convert = self.migrator._convert_value
+        count = 0
+        total = 0
+        rows = {}
+        with self.sql_connector.get_engine().connect() as conn:
+            result = conn.execution_options(stream_results=True).execute(text(query), params)
+            for row in result:
+                values = [convert(value) for value in row]
+                row_hash = _row_hash(values)
+                total = (total + row_hash) % HASH_MODULUS
+                count += 1
+                if keep_rows:
+                    rows[values[fields.index(range_column)]] = row_hash
+        return count, total, rows
+    
+    def _hash_target(self, table_name: str, fields: List[str], range_column: Optional[str],
+                     key_range: Optional[Tuple[int, int]],
+                     keep_rows: bool) -> Tuple[int, int, Dict[Any, int]]:
+        """
+        MongoDB tarafında aralıktaki belgeleri hash'ler.
+        
+        Returns:
+            tuple: (belge sayısı, aralık hash'i, anahtar → belge hash'i)
+        """
+        collection = self.mongodb_connector.get_collection(table_name)
+        if collection is None:
+            return 0, 0, {}
+        
+        query = {}
+        if key_range is not None:
+            query = {range_column: {'$gte': key_range[0], '$lt': key_range[1]}}
+        projection = {field: 1 for field in fields}
+        projection['_id'] = 0
+        
+        count = 0
+        total = 0
+        rows = {}
+        for doc in collection.find(query, projection, batch_size=10000):
+            values = [doc.get(field) for field in fields]
+            row_hash = _row_hash(values)
+            total = (total + row_hash) % HASH_MODULUS
+            count += 1
+            if keep_rows:
+                rows[doc.get(range_column)] = row_hash
+        return count, total, rows
+
+
+def _row_hash(values: List[Any]) -> int:
+    """
+    Dönüştürülmüş satır değerlerinden 64 bit hash üretir.
+    
+    Args:
+        values: Alan sırasına göre değerler
+    
+    Returns:
+        int: Satır hash'i
+    """
+    encoded = json.dumps(values, default=str, ensure_ascii=False).encode('utf-8')
+    return int.from_bytes(hashlib.blake2b(encoded, digest_size=8).digest(), 'big')
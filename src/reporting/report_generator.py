@@ -332,8 +332,30 @@ class ReportGenerator:
             
             # Migration İstatistikleri
             f.write("## Migration İstatistikleri\n\n")
+            if migration_stats.get('cancelled'):
+                tasks = migration_stats.get('tasks', {})
+                unfinished = [t for t, task in tasks.items() if task.get('status') in ('cancelled', 'not_started')]
+                f.write(f"- **Durum:** ⚠️ İptal edildi ({len(unfinished)} tablo tamamlanmadı)\n")
+            consolidation = migration_stats.get('consolidation')
+            if consolidation:
+                f.write(f"- **Kaynak Sayısı:** {consolidation['sources']} "
+                        f"({consolidation['schemas']} farklı şema, yönlendirme: {consolidation['routing']})\n")
+            distributed = migration_stats.get('distributed')
+            if distributed:
+                f.write(f"- **Dağıtık Çalıştırma:** {distributed['run_id']} "
+                        f"({distributed['units']} birim, {len(distributed['workers'])} worker)\n")
             f.write(f"- **Aktarılan Tablo Sayısı:** {migration_stats.get('tables_migrated', 0)}\n")
+            if migration_stats.get('tables_skipped'):
+                f.write(f"- **Değişmediği İçin Atlanan Tablo Sayısı:** {migration_stats['tables_skipped']}\n")
             f.write(f"- **Aktarılan Belge Sayısı:** {migration_stats.get('total_documents', 0)}\n")
+            f.write(f"- **Yazılamayan Belge Sayısı:** {migration_stats.get('failed_documents', 0)}\n")
+            reconciliation = migration_stats.get('reconciliation')
+            if reconciliation:
+                deleted = sum(r.get('deleted', 0) for r in reconciliation.values())
+                f.write(f"- **Kaynakta Silindiği İçin Silinen Belge Sayısı:** {deleted}\n")
+            if migration_stats.get('unchanged_documents'):
+                f.write(f"- **Değişmediği İçin Yazılmayan Belge Sayısı:** "
+                       f"{migration_stats['unchanged_documents']}\n")
             
             start_time = migration_stats.get('start_time')
             end_time = migration_stats.get('end_time')
@@ -341,8 +363,43 @@ class ReportGenerator:
                 duration = (end_time - start_time).total_seconds()
                 f.write(f"- **Toplam Süre:** {duration:.2f} saniye\n")
             
+            memory = migration_stats.get('memory')
+            if memory:
+                f.write(f"- **Peak Bellek (RSS):** {memory.get('peak_rss_mb', 0):.0f} MB")
+                if memory.get('max_memory_mb'):
+                    f.write(f" / bütçe {memory['max_memory_mb']} MB "
+                           f"({memory.get('throttle_events', 0)} kez kısıldı, en küçük fetch "
+                           f"{memory.get('smallest_fetch_size', 0)} satır)")
+                f.write("\n")
+            
+            export = migration_stats.get('export')
+            if export:
+                f.write(f"- **Hedef:** dosya ({export['format']}, {export['compression']}), "
+                       f"{export['files']} dosya\n")
+                f.write(f"- **Export Manifest:** `{export['manifest']}`\n")
+            
             f.write(f"- **Hata Sayısı:** {len(migration_stats.get('errors', []))}\n\n")
             
+            sources = migration_stats.get('sources')
+            if sources:
+                self._write_sources_section(f, sources)
+            
+            table_metrics = migration_stats.get('table_metrics')
+            if table_metrics:
+                self._write_performance_section(f, table_metrics)
+            
+            verification = migration_stats.get('verification')
+            if verification:
+                self._write_verification_section(f, verification)
+            
+            sample_validation = migration_stats.get('sample_validation')
+            if sample_validation:
+                self._write_sample_validation_section(f, sample_validation)
+            
+            index_advice = migration_stats.get('index_advice')
+            if index_advice:
+                self._write_index_advice_section(f, index_advice)
+            
             # MongoDB Bağlantı Bilgileri
             f.write("## MongoDB Bağlantı Bilgileri\n\n")
             f.write(f"- **Host:** {mongodb_config.get('host', 'N/A')}\n")
@@ -355,6 +412,161 @@ class ReportGenerator:
         logger.info(f"Rapor oluşturuldu: {filepath}")
         return filepath
     
+    def _write_sources_section(self, f, sources: Dict[str, Dict[str, Any]]):
+        """
+        Çoklu kaynak aktarımında kaynak bazında sonuç tablosunu yazar.
+        
+        Args:
+            f: Açık dosya
+            sources: Kaynak isimlerine göre sonuçlar
+        """
+        f.write("### Kaynaklar\n\n")
+        f.write("| Kaynak | Durum | Hedef Database | Tablo | Belge | Yazılamayan | Şema | Süre (sn) |\n")
+        f.write("|--------|-------|----------------|-------|-------|-------------|------|-----------|\n")
+        for name, source in sources.items():
+            schema = source.get('schema') or '-'
+            if source.get('schema_reused'):
+                schema += ' (tekrar kullanıldı)'
+            f.write(f"| {name} | {source['status']} | {source.get('target_database') or '-'} | "
+                    f"{source['tables']} | {source['documents']} | {source['failed_documents']} | "
+                    f"{schema} | {source['duration']:.2f} |\n")
+        f.write("\n")
+    
+    def _write_performance_section(self, f, table_metrics: Dict[str, Dict[str, Any]]):
+        """
+        Tablo bazında performans metriklerini ve en yavaş tabloları rapora yazar.
+        
+        Args:
+            f: Açık rapor dosyası
+            table_metrics: Tablo isimlerine göre performans metrikleri
+        """
+        mb = 1024 * 1024
+        f.write("## Performans Metrikleri\n\n")
+        f.write("| Tablo | Satır | Okuma (sn) | Dönüşüm (sn) | Yazma (sn) | Satır/sn | "
+                "Okunan MB | Yazılan MB | Batch | p50 / p95 / p99 (ms) |\n")
+        f.write("|-------|-------|------------|--------------|------------|----------|"
+                "-----------|------------|-------|----------------------|\n")
+        for table_name, m in table_metrics.items():
+            f.write(f"| {table_name} | {m.get('rows', 0)} | "
+                   f"{m.get('extract_seconds', 0):.2f} | {m.get('convert_seconds', 0):.2f} | "
+                   f"{m.get('write_seconds', 0):.2f} | {m.get('rows_per_second', 0):.0f} | "
+                   f"{m.get('bytes_read', 0) / mb:.2f} | {m.get('bytes_written', 0) / mb:.2f} | "
+                   f"{m.get('batch_count', 0)} | "
+                   f"{m.get('batch_latency_p50', 0) * 1000:.0f} / "
+                   f"{m.get('batch_latency_p95', 0) * 1000:.0f} / "
+                   f"{m.get('batch_latency_p99', 0) * 1000:.0f} |\n")
+        f.write("\n")
+        
+        total_seconds = sum(m.get('total_seconds', 0) for m in table_metrics.values())
+        slowest = sorted(table_metrics.items(), key=lambda x: x[1].get('total_seconds', 0),
+                         reverse=True)[:5]
+        f.write("### En Yavaş Tablolar\n\n")
+        for rank, (table_name, m) in enumerate(slowest, 1):
+            seconds = m.get('total_seconds', 0)
+            share = seconds / total_seconds if total_seconds > 0 else 0
+            stages = {'okuma': m.get('extract_seconds', 0),
+                      'dönüşüm': m.get('convert_seconds', 0),
+                      'yazma': m.get('write_seconds', 0)}
+            dominant = max(stages, key=stages.get)
+            f.write(f"{rank}. `{table_name}`: {seconds:.2f} sn ({share:.0%}), "
+                   f"en uzun aşama: {dominant}\n")
+        f.write("\n")
+    
+    def _write_verification_section(self, f, verification: Dict[str, Dict[str, Any]]):
+        """
+        Doğrulama sonuçlarını rapora yazar.
+        
+        Args:
+            f: Açık rapor dosyası
+            verification: Tablo isimlerine göre doğrulama sonuçları
+        """
+        f.write("## Doğrulama Sonuçları\n\n")
+        f.write("| Tablo | Durum | Kaynak Satır | Hedef Belge | Uyuşmayan Aralık | Süre (sn) |\n")
+        f.write("|-------|-------|--------------|-------------|------------------|-----------|\n")
+        status_labels = {'ok': '✅ Eşleşti', 'mismatch': '❌ Uyuşmazlık', 'error': '⚠️ Hata'}
+        for table_name, result in verification.items():
+            status = result.get('status', 'error')
+            f.write(f"| {table_name} | {status_labels.get(status, status)} | "
+                   f"{result.get('source_count', '-')} | {result.get('target_count', '-')} | "
+                   f"{len(result.get('mismatched_ranges', []))} | "
+                   f"{result.get('duration', 0):.2f} |\n")
+        f.write("\n")
+        
+        for table_name, result in verification.items():
+            if result.get('status') == 'error':
+                f.write(f"- **{table_name}:** {result.get('error', '')}\n")
+            for key_range in result.get('mismatched_ranges', []):
+                if key_range.get('outside'):
+                    range_str = f"[{key_range['start']}, {key_range['end']}) dışı"
+                elif key_range.get('start') is None:
+                    range_str = "tüm tablo"
+                else:
+                    range_str = f"[{key_range['start']}, {key_range['end']})"
+                f.write(f"- **{table_name}** {range_str}: kaynak {key_range['source_count']}, "
+                       f"hedef {key_range['target_count']}\n")
+            keys = result.get('mismatched_keys', [])
+            if keys:
+                f.write(f"  - Uyuşmayan anahtarlar: {', '.join(str(k) for k in keys)}\n")
+        f.write("\n")
+    
+    def _write_sample_validation_section(self, f, sample_validation: Dict[str, Dict[str, Any]]):
+        """
+        Örneklemeli doğrulama sonuçlarını güven aralıklarıyla rapora yazar.
+        
+        Args:
+            f: Açık rapor dosyası
+            sample_validation: Tablo isimlerine göre örnekleme sonuçları
+        """
+        f.write("## Örneklemeli Doğrulama\n\n")
+        f.write("| Tablo | Örnek | Uyuşmayan | Eksik | Uyuşmazlık Oranı | Güven Aralığı |\n")
+        f.write("|-------|-------|-----------|-------|------------------|---------------|\n")
+        for table_name, result in sample_validation.items():
+            status = result.get('status')
+            if status in ('skipped', 'error'):
+                reason = result.get('reason') or result.get('error', '')
+                f.write(f"| {table_name} | - | - | - | - | {status}: {reason} |\n")
+                continue
+            confidence = result.get('confidence', 0.95)
+            f.write(f"| {table_name} | {result.get('sampled', 0)} | "
+                   f"{result.get('mismatched', 0)} | {result.get('missing', 0)} | "
+                   f"{result.get('mismatch_rate', 0):.4%} | "
+                   f"%{confidence * 100:.0f}: {result.get('interval_low', 0):.4%} - "
+                   f"{result.get('interval_high', 0):.4%} |\n")
+        f.write("\n")
+        
+        for table_name, result in sample_validation.items():
+            field_mismatches = result.get('field_mismatches', {})
+            if field_mismatches:
+                fields_str = ', '.join(f"{field} ({count})" for field, count in
+                                       sorted(field_mismatches.items(), key=lambda x: -x[1]))
+                f.write(f"- **{table_name}:** {fields_str}\n")
+            for example in result.get('examples', []):
+                f.write(f"  - `_id={example['_id']}`: {', '.join(example['fields'])}\n")
+        f.write("\n")
+    
+    def _write_index_advice_section(self, f, index_advice: Dict[str, Any]):
+        """
+        View ve rutin tanımlarından üretilen index önerilerini rapora yazar.
+        
+        Args:
+            f: Açık rapor dosyası
+            index_advice: IndexAdvisor sonuçları
+        """
+        f.write("## Index Önerileri\n\n")
+        f.write(f"{index_advice['definitions']} tanım incelendi, "
+                f"{len(index_advice['proposals'])} öneri, "
+                f"{index_advice['created']} index oluşturuldu (mod: {index_advice['mode']}).\n\n")
+        if not index_advice['proposals']:
+            return
+        f.write("| Collection | Alanlar | Partial Filtre | Kaynak | Durum |\n")
+        f.write("|------------|---------|----------------|--------|-------|\n")
+        for proposal in index_advice['proposals']:
+            fields_str = ', '.join(f"{field}: {direction}" for field, direction in proposal['fields'])
+            partial = f"`{proposal['partial_filter']}`" if proposal['partial_filter'] else '-'
+            f.write(f"| {proposal['table']} | `{{{fields_str}}}` | {partial} | "
+                    f"{', '.join(proposal['sources'])} | {proposal['status']} |\n")
+        f.write("\n")
+    
     def _generate_html_report(self, schema_info: Dict[str, Any],
                              migration_stats: Dict[str, Any],
                              sql_config: Dict[str, Any],
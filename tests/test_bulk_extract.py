@@ -0,0 +1,152 @@
+"""
+Bulk extraction parser testleri.
+INTO OUTFILE ve bcp dosya formatlarının (escape, NULL, gömülü ayraçlar)
+doğru ayrıştırıldığını doğrular.
+"""
+
+import mmap
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from src.migration.bulk_extract import (
+    _bcp_records, _caster, _mysql_records, _parse_datetime, _redact_command
+)
+from src.migration.migrator import DataMigrator
+
+
+@pytest.fixture
+def mapped(tmp_path):
+    """
+    Verilen byte içeriğini dosyaya yazıp memory-map eder.
+    """
+    handles = []
+
+    def _map(content: bytes) -> mmap.mmap:
+        path = tmp_path / 'export.dat'
+        path.write_bytes(content)
+        f = open(path, 'rb')
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        handles.append((f, mm))
+        return mm
+
+    yield _map
+    for f, mm in handles:
+        mm.close()
+        f.close()
+
+
+def test_mysql_plain_rows(mapped):
+    mm = mapped(b'1\talice\n2\tbob\n')
+    assert list(_mysql_records(mm)) == [[b'1', b'alice'], [b'2', b'bob']]
+
+
+def test_mysql_null_and_literal_backslash_n(mapped):
+    # \N NULL'dur; escape edilmiş ters bölü + N ise "\N" metnidir
+    mm = mapped(b'1\t\\N\t\\\\N\n')
+    assert list(_mysql_records(mm)) == [[b'1', None, b'\\N']]
+
+
+def test_mysql_escaped_tab_and_newline(mapped):
+    # Veri içindeki tab ve satır sonu '\' ile escape edilir
+    mm = mapped(b'1\ta\\\tb\tline1\\\nline2\n2\tx\ty\n')
+    assert list(_mysql_records(mm)) == [
+        [b'1', b'a\tb', b'line1\nline2'],
+        [b'2', b'x', b'y'],
+    ]
+
+
+def test_mysql_escape_sequences(mapped):
+    mm = mapped(b'a\\0b\tc\\Zd\te\\\\\n')
+    assert list(_mysql_records(mm)) == [[b'a\0b', b'c\x1ad', b'e\\']]
+
+
+def test_mysql_empty_string_is_not_null(mapped):
+    mm = mapped(b'1\t\t\\N\n')
+    assert list(_mysql_records(mm)) == [[b'1', b'', None]]
+
+
+def test_mysql_last_row_without_newline(mapped):
+    mm = mapped(b'1\ta\n2\tb')
+    assert list(_mysql_records(mm)) == [[b'1', b'a'], [b'2', b'b']]
+
+
+def test_bcp_null_and_empty_string(mapped):
+    # bcp -c NULL'u boş alan, boş string'i tek NUL karakteri olarak yazar
+    mm = mapped(b'1|~||~|\x00~|~\n')
+    assert list(_bcp_records(mm)) == [[b'1', None, b'']]
+
+
+def test_bcp_embedded_tabs_and_newlines(mapped):
+    mm = mapped(b'1|~|a\tb|~|line1\nline2~|~\n2|~|x|~|y~|~\n')
+    assert list(_bcp_records(mm)) == [
+        [b'1', b'a\tb', b'line1\nline2'],
+        [b'2', b'x', b'y'],
+    ]
+
+
+def test_bcp_last_row_without_terminator(mapped):
+    mm = mapped(b'1|~|a~|~\n2|~|b')
+    assert list(_bcp_records(mm)) == [[b'1', b'a'], [b'2', b'b']]
+
+
+def test_casters_match_driver_types():
+    assert _caster('INTEGER', 'mysql')(b'42') == 42
+    assert _caster('DECIMAL(10, 2)', 'mysql')(b'12.50') == Decimal('12.50')
+    assert _caster('BIT', 'mssql')(b'1') == 1
+    assert _caster('VARBINARY(16)', 'mssql')(b'0aff') == b'\x0a\xff'
+    assert _caster('VARCHAR(20)', 'mysql')('ğüş'.encode('utf-8')) == 'ğüş'
+
+
+def test_mysql_bit_matches_streaming_path(mapped):
+    # Streaming yolunda pymysql BIT kolonunu ham bytes döndürür; bulk yol aynı belgeyi üretmeli
+    convert = DataMigrator.__new__(DataMigrator)._convert_value
+    [[field]] = list(_mysql_records(mapped(b'\x01\n')))
+    bulk_value = _caster('BIT(1)', 'mysql')(field)
+    assert bulk_value == b'\x01'
+    assert convert(bulk_value) == convert(b'\x01') == 'AQ=='
+
+
+def test_parse_datetime_truncates_mssql_fraction():
+    assert _parse_datetime(b'2024-01-02 03:04:05.1234567') == datetime(2024, 1, 2, 3, 4, 5, 123456)
+    assert _parse_datetime(b'not a date') == 'not a date'
+
+
+def test_redact_command_hides_password():
+    command = ['bcp', 'q', 'queryout', 'f', '-U', 'sa', '-P', 'secret', '-Psecret2']
+    redacted = _redact_command(command)
+    assert 'secret' not in redacted
+    assert '-Psecret2' not in redacted
+    assert redacted[:6] == command[:6]
+
+
+def test_bcp_password_not_on_command_line(tmp_path, monkeypatch):
+    from src.migration import bulk_extract
+
+    class Connector:
+        db_type = 'mssql'
+        config = {'host': 'db', 'port': 1433, 'database': 'shop',
+                  'username': 'sa', 'password': 'secret'}
+
+        def quote_identifier(self, name):
+            return f'[{name}]'
+
+    calls = []
+
+    class Result:
+        returncode = 0
+        stdout = ''
+        stderr = ''
+
+    def fake_run(command, **kwargs):
+        calls.append((command, kwargs))
+        return Result()
+
+    monkeypatch.setattr(bulk_extract.subprocess, 'run', fake_run)
+    extractor = bulk_extract.BulkExtractor(Connector(), {})
+    extractor._export_mssql('orders', ['id'], str(tmp_path / 'out.dat'))
+
+    command, kwargs = calls[0]
+    assert 'secret' not in command and '-P' not in command
+    assert kwargs['env']['SQLCMDPASSWORD'] == 'secret'
@@ -0,0 +1,76 @@
+"""
+Collection tipi testleri.
+Ortak (tenant) time-series collection'larının tekrar yüklemede yalnızca
+ilgili kaynağın belgeleriyle temizlendiğini doğrular.
+"""
+
+from types import SimpleNamespace
+
+from src.migration.collection_types import CollectionTypes
+
+
+class FakeCollection:
+    """
+    delete_many çağrılarını kaydeden collection.
+    """
+
+    def __init__(self):
+        self.deleted = []
+
+    def delete_many(self, query):
+        self.deleted.append(query)
+        return SimpleNamespace(deleted_count=3)
+
+
+class FakeConnector:
+    """
+    Yalnızca collection varlığını ve çağrıları izleyen MongoDB connector'ı.
+    """
+
+    def __init__(self, exists):
+        self.exists = exists
+        self.collection = FakeCollection()
+        self.dropped = []
+        self.created = []
+
+    def collection_exists(self, name):
+        return self.exists
+
+    def get_collection(self, name):
+        return self.collection
+
+    def drop_collection(self, name):
+        self.dropped.append(name)
+        return True
+
+    def create_collection(self, name, options):
+        self.created.append((name, options))
+        return True
+
+
+SPEC = {'type': 'timeseries', 'time_field': 'created_at', 'meta_field': '',
+        'granularity': 'seconds', 'expire_after_seconds': None}
+
+
+def test_shared_timeseries_clears_only_tenant_documents():
+    connector = FakeConnector(exists=True)
+    types = CollectionTypes(connector, {'tenant': 'tenant_001', 'tenant_field': '_tenant'})
+    types.create('payments', SPEC)
+    assert connector.collection.deleted == [{'_tenant': 'tenant_001'}]
+    assert connector.dropped == [] and connector.created == []
+
+
+def test_timeseries_recreated_without_tenant():
+    connector = FakeConnector(exists=True)
+    types = CollectionTypes(connector, {})
+    types.create('payments', SPEC)
+    assert connector.dropped == ['payments']
+    assert connector.created[0][1]['timeseries']['timeField'] == 'created_at'
+    assert connector.collection.deleted == []
+
+
+def test_new_shared_timeseries_is_created():
+    connector = FakeConnector(exists=False)
+    types = CollectionTypes(connector, {'tenant': 'tenant_001'})
+    types.create('payments', SPEC)
+    assert connector.created and connector.collection.deleted == []
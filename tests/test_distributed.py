@@ -0,0 +1,248 @@
+"""
+Dağıtık aktarım testleri.
+Kontrol collection'ı bellek içi bir sahte collection ile taklit edilir;
+kiralama devri, heartbeat kaybı, PK aralık bölme ve insert ile yazılan
+birimlerin tekrar denemede temizlenmesi doğrulanır.
+"""
+
+import threading
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from src.migration.distributed import DistributedMigration
+from src.migration.migrator import MigrationCancelled
+
+
+def matches(doc, query):
+    """
+    Testlerde kullanılan sorgu alt kümesini (eşitlik, $or, $lt, $in) değerlendirir.
+    """
+    for field, condition in query.items():
+        if field == '$or':
+            if not any(matches(doc, branch) for branch in condition):
+                return False
+        elif isinstance(condition, dict):
+            value = doc.get(field)
+            if '$lt' in condition and not (value is not None and value < condition['$lt']):
+                return False
+            if '$in' in condition and value not in condition['$in']:
+                return False
+        elif doc.get(field) != condition:
+            return False
+    return True
+
+
+class FakeCollection:
+    """
+    Bellek içi MongoDB collection'ı.
+    """
+
+    def __init__(self, docs=()):
+        self.docs = [dict(doc) for doc in docs]
+        self.lock = threading.Lock()
+
+    def find_one_and_update(self, query, update, sort=None, return_document=None):
+        with self.lock:
+            candidates = [doc for doc in self.docs if matches(doc, query)]
+            if not candidates:
+                return None
+            candidates.sort(key=lambda doc: (-doc.get('priority', 0), doc['_id']))
+            doc = candidates[0]
+            doc.update(update.get('$set', {}))
+            for field, amount in update.get('$inc', {}).items():
+                doc[field] = doc.get(field, 0) + amount
+            return dict(doc)
+
+    def create_index(self, keys):
+        pass
+
+    def find_one(self, query):
+        return next((dict(doc) for doc in self.docs if matches(doc, query)), None)
+
+    def update_many(self, query, update):
+        with self.lock:
+            modified = 0
+            for doc in self.docs:
+                if matches(doc, query):
+                    doc.update(update['$set'])
+                    modified += 1
+            return SimpleNamespace(modified_count=modified)
+
+    def update_one(self, query, update):
+        with self.lock:
+            for doc in self.docs:
+                if matches(doc, query):
+                    doc.update(update['$set'])
+                    return SimpleNamespace(matched_count=1)
+            return SimpleNamespace(matched_count=0)
+
+    def delete_many(self, query):
+        with self.lock:
+            kept = [doc for doc in self.docs if not matches(doc, query)]
+            deleted = len(self.docs) - len(kept)
+            self.docs = kept
+            return SimpleNamespace(deleted_count=deleted)
+
+    def get(self, doc_id):
+        return next(doc for doc in self.docs if doc['_id'] == doc_id)
+
+
+def make_distributed(control, data=None, worker_id='node-1', tenant=None, config=None,
+                     migrate_table=None):
+    data = data if data is not None else FakeCollection()
+    connector = SimpleNamespace(
+        get_collection=lambda name: control if name == '_migration_work' else data
+    )
+    migrator = SimpleNamespace(
+        mongodb_connector=connector,
+        preserve_ids=True,
+        tenant=tenant,
+        tenant_field='_tenant',
+        collections=SimpleNamespace(kind=lambda table_name: None),
+        fingerprints=SimpleNamespace(discard=lambda table_name: None),
+        lob=SimpleNamespace(wait=lambda: None),
+        migration_stats={'total_documents': 0, 'failed_documents': 0, 'errors': []},
+        _migrate_table=migrate_table or (lambda *args, **kwargs: False)
+    )
+    return DistributedMigration(migrator, dict(config or {}), run_id='run1', worker_id=worker_id)
+
+
+def unit(unit_id, status='pending', owner=None, lease_expires=None, attempts=0, priority=0):
+    return {'_id': unit_id, 'type': 'unit', 'run_id': 'run1', 'table': 'logs',
+            'range_column': None, 'low': None, 'high': None, 'priority': priority,
+            'status': status, 'owner': owner, 'lease_expires': lease_expires,
+            'attempts': attempts}
+
+
+def test_expired_lease_taken_over():
+    now = datetime.now(timezone.utc)
+    control = FakeCollection([
+        unit('run1:logs:00000', 'leased', 'node-1', now - timedelta(seconds=5), attempts=1),
+        unit('run1:users:00000', 'leased', 'node-1', now + timedelta(seconds=60), attempts=1),
+    ])
+    distributed = make_distributed(control, worker_id='node-2')
+
+    leased = distributed._lease()
+    assert leased['_id'] == 'run1:logs:00000'
+    assert leased['owner'] == 'node-2' and leased['attempts'] == 2
+    assert leased['lease_expires'] > now
+    # Kirası geçerli olan birim alınmaz
+    assert distributed._lease() is None
+
+    # Eski sahip birimi bitirmeye çalışırsa yeni sahibin kaydı değişmez
+    distributed._finish_unit({'_id': 'run1:logs:00000', 'owner': 'node-1'}, 'done')
+    assert control.get('run1:logs:00000')['status'] == 'leased'
+    distributed._finish_unit(leased, 'done')
+    assert control.get('run1:logs:00000')['status'] == 'done'
+
+
+def test_unit_failed_after_max_attempts():
+    past = datetime.now(timezone.utc) - timedelta(seconds=5)
+    control = FakeCollection([unit('run1:logs:00000', 'leased', 'node-1', past, attempts=3)])
+    distributed = make_distributed(control, worker_id='node-2', config={'max_unit_attempts': 3})
+    assert distributed._lease() is None
+    assert control.get('run1:logs:00000')['status'] == 'failed'
+
+
+def test_lost_heartbeat_sets_abort():
+    control = FakeCollection([unit('run1:logs:00000', 'leased', 'node-2', attempts=2)])
+    distributed = make_distributed(control, worker_id='node-1', config={'heartbeat_seconds': 0.01})
+    stop, lost = threading.Event(), threading.Event()
+    heartbeat = threading.Thread(target=distributed._heartbeat,
+                                 args=('run1:logs:00000', stop, lost))
+    heartbeat.start()
+    heartbeat.join(timeout=5)
+    assert lost.is_set() and not heartbeat.is_alive()
+
+
+def test_lost_lease_aborts_running_unit():
+    def migrate_table(*args, abort=None):
+        # Aktarım parça sınırında abort event'ini kontrol eder
+        assert abort.wait(timeout=5)
+        raise MigrationCancelled('logs')
+
+    control = FakeCollection([unit('run1:logs:00000', 'leased', 'node-2', attempts=2)])
+    distributed = make_distributed(control, worker_id='node-1', migrate_table=migrate_table,
+                                   config={'heartbeat_seconds': 0.01})
+    leased = dict(control.get('run1:logs:00000'), owner='node-1')
+    assert distributed._run_unit(leased, {'primary_keys': {'logs': ['id']}}) is False
+    # Birim artık başka worker'ın; kaydı değiştirilmez
+    assert control.get('run1:logs:00000')['owner'] == 'node-2'
+    assert control.get('run1:logs:00000')['status'] == 'leased'
+
+
+@pytest.mark.parametrize('low, high, count', [
+    (1, 100, 4), (1, 10, 3), (-50, 49, 7), (5, 5, 3), (0, 2, 10), (1, 1000003, 9),
+])
+def test_split_ranges_cover_key_space(low, high, count):
+    class Connection:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            return False
+
+        def execute(self, query):
+            return SimpleNamespace(fetchone=lambda: (low, high))
+
+    distributed = make_distributed(FakeCollection())
+    distributed.migrator.sql_connector = SimpleNamespace(
+        quote_identifier=lambda name: name,
+        get_engine=lambda: SimpleNamespace(connect=Connection)
+    )
+    distributed.migrator.selection = SimpleNamespace(where_clause=lambda table_name: '')
+    ranges = distributed._split_ranges('orders', 'id', count)
+
+    # İlk ve son aralık açık uçlu; ardışık aralıklar boşluksuz birleşir
+    assert ranges[0][0] is None and ranges[-1][1] is None
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start
+    assert len(ranges) <= count
+    # Aralık dışındaki değerler dahil her anahtar tam olarak bir aralığa düşer
+    for key in range(low - 3, min(high, low + 2000) + 4):
+        owners = [r for r in ranges if (r[0] is None or key >= r[0]) and (r[1] is None or key < r[1])]
+        assert len(owners) == 1
+
+
+def test_retry_of_insert_only_unit_clears_only_tenant_documents():
+    data = FakeCollection([
+        {'_id': 'tenant_001_1', '_tenant': 'tenant_001'},
+        {'_id': 'tenant_001_2', '_tenant': 'tenant_001'},
+        {'_id': 'tenant_002_1', '_tenant': 'tenant_002'},
+    ])
+    migrated = []
+    control = FakeCollection([unit('run1:logs:00000', 'leased', 'node-1', attempts=2)])
+    distributed = make_distributed(
+        control, data, tenant='tenant_001',
+        migrate_table=lambda table_name, *args, **kwargs: migrated.append(table_name)
+    )
+    assert distributed._run_unit(control.get('run1:logs:00000'), {'primary_keys': {'logs': []}})
+    assert [doc['_id'] for doc in data.docs] == ['tenant_002_1']
+    assert migrated == ['logs']
+    assert control.get('run1:logs:00000')['status'] == 'done'
+
+
+def test_replanning_existing_run_resumes():
+    control = FakeCollection([
+        {'_id': 'run:run1', 'type': 'run', 'run_id': 'run1', 'status': 'finished', 'planned': True},
+        unit('run1:logs:00000', 'done', 'node-1', attempts=1),
+        unit('run1:users:00000', 'failed', 'node-2', attempts=3),
+    ])
+    distributed = make_distributed(control)
+    # Planlama tekrar yapılmaz (insert_many / collection silme çağrılmaz)
+    distributed.plan({'tables': ['logs', 'users']})
+    assert control.get('run:run1')['status'] == 'running'
+    assert control.get('run1:logs:00000')['status'] == 'done'
+    retried = control.get('run1:users:00000')
+    assert retried['status'] == 'pending' and retried['attempts'] == 0 and retried['resumed']
+    assert distributed._lease()['_id'] == 'run1:users:00000'
+
+
+def test_first_attempt_does_not_clear():
+    data = FakeCollection([{'_id': 1, '_tenant': 'tenant_001'}])
+    control = FakeCollection([unit('run1:logs:00000', 'leased', 'node-1', attempts=1)])
+    distributed = make_distributed(control, data, tenant='tenant_001')
+    assert distributed._run_unit(control.get('run1:logs:00000'), {'primary_keys': {'logs': []}})
+    assert len(data.docs) == 1
@@ -0,0 +1,97 @@
+"""
+MongoDB connector hata toleransı testleri.
+Tekrar denemeleri tükenen batch'lerin dead-letter'a yazılıp aktarıma devam
+edildiğini ve geçici olmayan hataların yutulmadığını doğrular.
+"""
+
+import json
+
+import pytest
+from bson.errors import InvalidDocument
+from pymongo import InsertOne, UpdateOne
+from pymongo.errors import AutoReconnect
+
+from src.database.mongodb_connector import MongoDBConnector
+
+
+class FakeCollection:
+    """
+    Belirli çağrılarda verilen hatayı fırlatan collection.
+    """
+
+    def __init__(self, error, failing_calls):
+        self.error = error
+        self.failing_calls = failing_calls
+        self.calls = 0
+        self.written = []
+
+    def _call(self, batch):
+        self.calls += 1
+        if self.calls in self.failing_calls:
+            raise self.error
+        self.written.extend(batch)
+
+    def insert_many(self, batch, ordered=False):
+        self._call(batch)
+        return type('Result', (), {'inserted_ids': list(batch)})()
+
+    def bulk_write(self, batch, ordered=False):
+        self._call(batch)
+        return type('Result', (), {'inserted_count': 0, 'matched_count': 0,
+                                   'modified_count': len(batch), 'upserted_count': 0,
+                                   'deleted_count': 0})()
+
+
+def make_connector(tmp_path, collection):
+    connector = MongoDBConnector({'max_retries': 0,
+                                  'dead_letter_file': str(tmp_path / 'dead.jsonl')})
+    connector.get_collection = lambda name: collection
+    return connector
+
+
+def read_dead_letters(tmp_path):
+    with open(tmp_path / 'dead.jsonl', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def test_exhausted_bulk_batch_dead_lettered_with_payloads(tmp_path):
+    collection = FakeCollection(AutoReconnect('bağlantı koptu'), failing_calls={1})
+    connector = make_connector(tmp_path, collection)
+    operations = [UpdateOne({'_id': i}, {'$set': {'v': i}}, upsert=True) for i in range(4)]
+    payloads = [{'q': {'_id': i}, 'u': {'$set': {'v': i}}, 'upsert': True} for i in range(4)]
+
+    counts = connector.bulk_write_operations('orders', operations, 2, payloads)
+
+    # İlk batch dead-letter'a yazılır, ikinci batch yine yazılır
+    assert counts['failed'] == 2 and counts['modified'] == 2
+    assert collection.written == operations[2:]
+    entries = read_dead_letters(tmp_path)
+    assert [entry['operation'] for entry in entries] == payloads[:2]
+    assert entries[0]['collection'] == 'orders'
+
+
+def test_dead_letter_without_payloads_uses_operation_text(tmp_path):
+    collection = FakeCollection(AutoReconnect('bağlantı koptu'), failing_calls={1})
+    connector = make_connector(tmp_path, collection)
+    operation = InsertOne({'_id': 1})
+    connector.bulk_write_operations('orders', [operation], 1)
+    assert read_dead_letters(tmp_path)[0]['operation'] == str(operation)
+
+
+def test_exhausted_insert_batch_dead_lettered(tmp_path):
+    collection = FakeCollection(AutoReconnect('bağlantı koptu'), failing_calls={2})
+    connector = make_connector(tmp_path, collection)
+    documents = [{'_id': i} for i in range(6)]
+
+    assert connector.insert_documents('orders', documents, 2) == 4
+    assert [entry['operation'] for entry in read_dead_letters(tmp_path)] == documents[2:4]
+
+
+def test_non_transient_errors_propagate(tmp_path):
+    collection = FakeCollection(InvalidDocument('cannot encode object'), failing_calls={1, 2})
+    connector = make_connector(tmp_path, collection)
+    with pytest.raises(InvalidDocument):
+        connector.insert_documents('orders', [{'_id': 1}], 1)
+    with pytest.raises(InvalidDocument):
+        connector.bulk_write_operations('orders', [InsertOne({'_id': 1})], 1)
+    assert not (tmp_path / 'dead.jsonl').exists()
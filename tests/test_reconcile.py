@@ -0,0 +1,185 @@
+"""
+Silme uzlaştırma testleri.
+Kaynak ve hedef anahtar akışlarının merge ile karşılaştırıldığını, aday
+yetimlerin silmeden önce kaynakta tekrar doğrulandığını ve uzlaştırılamayan
+tabloların atlandığını doğrular.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from pymongo import DeleteMany
+
+from src.migration.reconcile import DeletionReconciler, _source_value
+
+
+class FakeCursor:
+    """
+    find().sort().batch_size() zincirini destekleyen cursor.
+    """
+
+    def __init__(self, ids):
+        self.ids = ids
+
+    def sort(self, *args):
+        return FakeCursor(sorted(self.ids))
+
+    def batch_size(self, size):
+        return self
+
+    def __iter__(self):
+        return iter({'_id': key} for key in self.ids)
+
+
+class FakeConnection:
+    """
+    Tekrar doğrulama (IN) sorgusunda kaynakta bulunan anahtarları döndürür.
+    """
+
+    def __init__(self, source):
+        self.source = source
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def execute(self, query, params):
+        self.source.queries.append(list(params['keys']))
+        return [(key,) for key in params['keys'] if key in self.source.existing]
+
+
+class FakeSource:
+    """
+    Kaynak veritabanı: stream edilen anahtarlar ve tekrar doğrulamada var olanlar.
+    """
+
+    db_type = 'mysql'
+
+    def __init__(self, existing):
+        self.existing = set(existing)
+        self.queries = []
+
+    def quote_identifier(self, name):
+        return f'`{name}`'
+
+    def get_engine(self):
+        return SimpleNamespace(connect=lambda: FakeConnection(self))
+
+
+class FakeTarget:
+    """
+    Hedef collection'ı ve silme operasyonlarını tutan MongoDB connector'ı.
+    """
+
+    def __init__(self, ids):
+        self.ids = list(ids)
+        self.deleted = []
+
+    def get_collection(self, name):
+        return SimpleNamespace(find=lambda *args: FakeCursor(self.ids))
+
+    def bulk_write_operations(self, name, operations, batch_size, payloads):
+        deleted = 0
+        for operation, payload in zip(operations, payloads):
+            keys = payload['q']['_id']['$in']
+            assert operation == DeleteMany({'_id': {'$in': keys}})
+            self.deleted.extend(keys)
+            deleted += len(keys)
+        return {'deleted': deleted}
+
+
+def where_clause(table_name, *conditions):
+    return f" WHERE {' AND '.join(conditions)}" if conditions else ''
+
+
+def make_reconciler(source_keys, target_ids, existing=None, batch_size=1000, kind=None,
+                    preserve_ids=True, convert=lambda value: value):
+    source = FakeSource(source_keys if existing is None else existing)
+    target = FakeTarget(target_ids)
+    migrator = SimpleNamespace(
+        sql_connector=source,
+        mongodb_connector=target,
+        preserve_ids=preserve_ids,
+        collections=SimpleNamespace(kind=lambda table_name: kind),
+        selection=SimpleNamespace(where_clause=where_clause),
+        memory=SimpleNamespace(fetch_size=100),
+        _convert_value=convert
+    )
+    reconciler = DeletionReconciler(migrator, {'reconcile_batch_size': batch_size})
+    reconciler._source_keys = lambda *args: iter(sorted(source_keys))
+    return reconciler, source, target
+
+
+COLUMNS = [{'name': 'id', 'type': 'INTEGER'}]
+
+
+@pytest.mark.parametrize('source_keys, target_ids, orphans', [
+    # Anahtarlar iki tarafta iç içe
+    ([1, 3, 5, 7], [1, 2, 3, 4, 5, 6, 7], [2, 4, 6]),
+    # Kaynak erken biter: kalan tüm hedef belgeler aday
+    ([1, 2], [1, 2, 3, 4], [3, 4]),
+    # Hedef erken biter: fazla kaynak anahtarları bir şey silmez
+    ([1, 2, 3, 4, 5], [1, 2], []),
+    # Boş kaynak
+    ([], [1, 2], [1, 2]),
+])
+def test_merge_finds_orphans(source_keys, target_ids, orphans):
+    reconciler, _, target = make_reconciler(source_keys, target_ids)
+    result = reconciler.reconcile_table('orders', COLUMNS, ['id'])
+    assert result['status'] == 'ok'
+    assert result['scanned'] == len(target_ids)
+    assert sorted(target.deleted) == orphans
+    assert result['deleted'] == len(orphans)
+
+
+def test_orphans_deleted_in_batches():
+    reconciler, source, target = make_reconciler([], [1, 2, 3, 4, 5], batch_size=2)
+    result = reconciler.reconcile_table('orders', COLUMNS, ['id'])
+    assert result['deleted'] == 5
+    assert source.queries == [[1, 2], [3, 4], [5]]
+
+
+def test_candidates_reconfirmed_against_source():
+    # 2 ve 4 stream'de yok ama tekrar sorguda bulunuyor (ör. aktarım sonrası eklendi)
+    reconciler, source, target = make_reconciler([1, 3], [1, 2, 3, 4, 5], existing=[1, 2, 3, 4])
+    result = reconciler.reconcile_table('orders', COLUMNS, ['id'])
+    assert source.queries == [[2, 4, 5]]
+    assert target.deleted == [5]
+    assert result['deleted'] == 1
+
+
+def test_nothing_deleted_when_all_candidates_exist():
+    reconciler, _, target = make_reconciler([], [1, 2], existing=[1, 2])
+    assert reconciler._delete_orphans('orders', 'id', [1, 2]) == 0
+    assert target.deleted == []
+
+
+def test_float_ids_queried_as_ints():
+    # Dönüşüm tam sayıları float'a çeviriyorsa _id'ler kaynağa int olarak sorulur
+    reconciler, source, target = make_reconciler(
+        [], [1.0, 2.0], existing=[1], convert=lambda value: float(value)
+    )
+    assert reconciler._delete_orphans('orders', 'id', [1.0, 2.0]) == 1
+    assert source.queries == [[1, 2]]
+    assert target.deleted == [2.0]
+
+
+def test_source_value():
+    assert _source_value(3.0) == 3 and isinstance(_source_value(3.0), int)
+    assert _source_value(2.5) == 2.5
+    assert _source_value('a') == 'a'
+
+
+@pytest.mark.parametrize('primary_keys, preserve_ids, kind', [
+    (['order_id', 'line_no'], True, None),
+    ([], True, None),
+    (['id'], False, None),
+    (['id'], True, 'timeseries'),
+])
+def test_unsupported_tables_skipped(primary_keys, preserve_ids, kind):
+    reconciler, source, target = make_reconciler([], [1, 2], preserve_ids=preserve_ids, kind=kind)
+    result = reconciler.reconcile_table('orders', COLUMNS, primary_keys)
+    assert result['status'] == 'skipped'
+    assert target.deleted == [] and source.queries == []
@@ -0,0 +1,83 @@
+"""
+Örneklemeli doğrulama testleri.
+Tam sayı PK'si olmayan tablolarda örnekleme sorgusunun tablo boyutuna göre
+seçildiğini (rastgele sıralama, TABLESAMPLE veya atlama) doğrular.
+"""
+
+from types import SimpleNamespace
+
+from src.migration.sample_validator import SampleValidator
+
+
+class FakeConnection:
+    """
+    Çalıştırılan sorguları kaydeden ve verilen satırları döndüren bağlantı.
+    """
+
+    def __init__(self, queries, rows):
+        self.queries = queries
+        self.rows = rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def execute(self, query, params=None):
+        self.queries.append(str(query))
+        return [SimpleNamespace(_mapping=row) for row in self.rows]
+
+
+def make_validator(db_type, estimate, rows=(), sample_size=10):
+    queries = []
+    connector = SimpleNamespace(
+        db_type=db_type,
+        quote_identifier=lambda name: name,
+        get_engine=lambda: SimpleNamespace(connect=lambda: FakeConnection(queries, list(rows)))
+    )
+    migrator = SimpleNamespace(
+        sql_connector=connector,
+        mongodb_connector=None,
+        preserve_ids=True,
+        selection=SimpleNamespace(is_projected=lambda table_name: False,
+                                  where_clause=lambda table_name, *conditions: '')
+    )
+    validator = SampleValidator(migrator, {'sample_size': sample_size,
+                                           'sample_random_order_max_rows': 1000})
+    validator.row_estimates = {'codes': estimate}
+    return validator, queries
+
+
+COLUMNS = [{'name': 'code', 'type': 'VARCHAR(10)'}]
+
+
+def test_large_table_without_integer_key_skipped():
+    validator, queries = make_validator('mysql', 5000)
+    result = validator.validate_table('codes', COLUMNS, ['code'])
+    assert result['status'] == 'skipped' and 'sample_random_order_max_rows' in result['reason']
+    assert queries == []
+
+
+def test_small_table_uses_random_order():
+    validator, queries = make_validator('mysql', 500)
+    validator._sample_source_rows('codes', COLUMNS, ['code'])
+    assert queries == ['SELECT * FROM codes ORDER BY RAND() LIMIT 10']
+
+
+def test_large_mssql_table_uses_tablesample():
+    rows = [{'code': str(i)} for i in range(10)]
+    validator, queries = make_validator('mssql', 100000, rows)
+    sampled = validator._sample_source_rows('codes', COLUMNS, ['code'])
+    assert len(sampled) == 10
+    assert len(queries) == 1
+    assert 'TABLESAMPLE SYSTEM (0.040000 PERCENT)' in queries[0]
+    assert 'NEWID' not in queries[0]
+
+
+def test_tablesample_grows_until_enough_rows():
+    validator, queries = make_validator('mssql', 100000, [{'code': 'a'}])
+    validator._sample_source_rows('codes', COLUMNS, ['code'])
+    # Yüzde her denemede artırılır ve %100'de durur
+    assert '100.000000 PERCENT' in queries[-1]
+    assert len(queries) == 7